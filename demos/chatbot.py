@@ -14,6 +14,7 @@ from typing import Any
 import httpx
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
+from mcp.client.list_cache import ListCache
 from mcp.client.stdio import stdio_client
 
 # Configure logging
@@ -88,7 +89,8 @@ class Client:
         try:
             stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
             read, write = stdio_transport
-            session = await self.exit_stack.enter_async_context(ClientSession(read, write))
+            # Tools are looked up for every tool call, so keep the listing until the server changes it.
+            session = await self.exit_stack.enter_async_context(ClientSession(read, write, list_cache=ListCache()))
             await session.initialize()
             self.session = session
         except Exception as e:
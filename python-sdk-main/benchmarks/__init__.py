@@ -0,0 +1,12 @@
+"""
+Performance benchmarks for the MCP Python SDK.
+
+The suite runs the same workloads against a FastMCP server over every transport
+and writes the results as JSON, so runs can be compared to catch regressions in
+the hot paths:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare baseline.json results.json
+
+Run `python -m benchmarks --help` for the available options.
+"""
@@ -0,0 +1,168 @@
+"""Command line entry point: `python -m benchmarks`."""
+
+import argparse
+import datetime
+import platform
+import sys
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+import anyio
+
+from benchmarks.compare import Change, compare, read_results, write_results
+from benchmarks.runner import BENCHMARKS, BenchmarkConfig, BenchmarkResult
+from benchmarks.transports import TRANSPORTS, TransportName, start_target
+
+
+def _names(value: str, choices: tuple[str, ...]) -> list[str]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    for name in names:
+        if name not in choices:
+            raise argparse.ArgumentTypeError(f"unknown name {name!r}, expected one of {', '.join(choices)}")
+    return names
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--transports",
+        type=lambda value: _names(value, TRANSPORTS),
+        default=list(TRANSPORTS),
+        help=f"Comma-separated transports to benchmark (default: all of {', '.join(TRANSPORTS)})",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        type=lambda value: _names(value, tuple(BENCHMARKS)),
+        default=list(BENCHMARKS),
+        help=f"Comma-separated benchmarks to run (default: all of {', '.join(BENCHMARKS)})",
+    )
+    parser.add_argument("--iterations", type=int, default=BenchmarkConfig.iterations)
+    parser.add_argument("--concurrency", type=int, default=BenchmarkConfig.concurrency)
+    parser.add_argument(
+        "--payload-sizes",
+        type=lambda value: tuple(int(size) for size in value.split(",")),
+        default=BenchmarkConfig.payload_sizes,
+        help="Comma-separated payload sizes in bytes",
+    )
+    parser.add_argument(
+        "--large-payload-sizes",
+        type=lambda value: tuple(int(size) for size in value.split(",")),
+        default=BenchmarkConfig.large_payload_sizes,
+        help="Comma-separated payload sizes in bytes for the large-payload benchmark",
+    )
+    parser.add_argument("--sessions", type=int, default=BenchmarkConfig.sessions)
+    parser.add_argument("--session-connects", type=int, default=BenchmarkConfig.session_connects)
+    parser.add_argument("--templates", type=int, default=BenchmarkConfig.templates)
+    parser.add_argument("--quick", action="store_true", help="Do a tenth of the work, for smoke testing")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare the results with those in this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compare two result files instead of running the benchmarks",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change for the worse reported as a regression (default: 0.1)",
+    )
+    return parser.parse_args(argv)
+
+
+def _config(args: argparse.Namespace) -> BenchmarkConfig:
+    config = BenchmarkConfig(
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        payload_sizes=args.payload_sizes,
+        sessions=args.sessions,
+        session_connects=args.session_connects,
+        large_payload_sizes=args.large_payload_sizes,
+        templates=args.templates,
+    )
+    if args.quick:
+        config.iterations = max(config.iterations // 10, 10)
+        config.warmup = max(config.warmup // 10, 1)
+        config.payload_iterations = max(config.payload_iterations // 10, 2)
+        config.sessions = max(config.sessions // 10, 2)
+        config.session_connects = max(config.session_connects // 10, config.concurrency)
+        config.large_payload_sizes = config.large_payload_sizes[:1]
+        config.large_payload_iterations = 2
+    return config
+
+
+async def run(transports: list[TransportName], benchmarks: list[str], config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Run the benchmarks over each transport, printing results as they complete."""
+    results: list[BenchmarkResult] = []
+    for transport in transports:
+        async with start_target(transport) as target:
+            for benchmark in benchmarks:
+                for result in await BENCHMARKS[benchmark](target, config):
+                    print(_format_result(result), flush=True)
+                    results.append(result)
+    return results
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    params = " ".join(f"{key}={value}" for key, value in result.params.items())
+    metrics = " ".join(f"{key}={value:.4g}" for key, value in result.metrics.items())
+    return f"{result.transport:<20} {result.benchmark:<10} {params:<20} {metrics}"
+
+
+def _report(changes: list[Change], threshold: float) -> bool:
+    """Print the comparison and return whether there were regressions."""
+    regressed = False
+    for change in changes:
+        result = change.result
+        params = " ".join(f"{key}={value}" for key, value in result.params.items())
+        status = "REGRESSION" if change.regression > threshold else "ok"
+        regressed |= change.regression > threshold
+        print(
+            f"{result.transport:<20} {result.benchmark:<10} {params:<20} {change.metric} "
+            f"{change.baseline:.4g} -> {change.current:.4g} ({-change.regression:+.1%}) {status}"
+        )
+    return regressed
+
+
+def _meta(config: BenchmarkConfig) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "mcp_version": version("mcp"),
+        "config": {
+            "iterations": config.iterations,
+            "warmup": config.warmup,
+            "concurrency": config.concurrency,
+            "payload_sizes": list(config.payload_sizes),
+            "payload_iterations": config.payload_iterations,
+            "sessions": config.sessions,
+            "session_connects": config.session_connects,
+            "large_payload_sizes": list(config.large_payload_sizes),
+            "large_payload_iterations": config.large_payload_iterations,
+            "templates": config.templates,
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.compare:
+        baseline_path, current_path = args.compare
+        return int(_report(compare(read_results(baseline_path), read_results(current_path)), args.threshold))
+
+    config = _config(args)
+    results = anyio.run(run, args.transports, args.benchmarks, config)
+    if args.output:
+        write_results(args.output, results, _meta(config))
+    if args.baseline:
+        print()
+        return int(_report(compare(read_results(args.baseline), results), args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
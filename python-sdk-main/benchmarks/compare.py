@@ -0,0 +1,50 @@
+"""Comparison of benchmark results between runs."""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.runner import PRIMARY_METRICS, BenchmarkResult
+
+
+@dataclass
+class Change:
+    """Change of a benchmark's primary metric between two runs."""
+
+    result: BenchmarkResult
+    metric: str
+    baseline: float
+    current: float
+    higher_is_better: bool
+
+    @property
+    def regression(self) -> float:
+        """Relative change for the worse (negative when the result improved)."""
+        if self.baseline == 0:
+            return 0.0
+        change = (self.current - self.baseline) / self.baseline
+        return -change if self.higher_is_better else change
+
+
+def write_results(path: Path, results: list[BenchmarkResult], meta: dict[str, Any]) -> None:
+    path.write_text(json.dumps({"meta": meta, "results": [asdict(result) for result in results]}, indent=2) + "\n")
+
+
+def read_results(path: Path) -> list[BenchmarkResult]:
+    data = json.loads(path.read_text())
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+
+def compare(baseline: list[BenchmarkResult], current: list[BenchmarkResult]) -> list[Change]:
+    """Pair up the results present in both runs and compare their primary metrics."""
+    baseline_by_key = {result.key: result for result in baseline}
+    changes: list[Change] = []
+    for result in current:
+        previous = baseline_by_key.get(result.key)
+        if previous is None:
+            continue
+        metric, higher_is_better = PRIMARY_METRICS[result.benchmark]
+        if metric in result.metrics and metric in previous.metrics:
+            changes.append(Change(result, metric, previous.metrics[metric], result.metrics[metric], higher_is_better))
+    return changes
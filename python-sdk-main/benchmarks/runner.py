@@ -0,0 +1,361 @@
+"""The benchmark workloads and their results."""
+
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+
+from benchmarks.transports import Target
+from mcp.server.fastmcp.resources import ResourceTemplate
+from mcp.server.fastmcp.resources.templates import ResourceTemplateRouter
+from mcp.shared.json_codec import JSONCodecName, get_json_codec
+from mcp.shared.session import _typed_message_data  # type: ignore[reportPrivateUsage]
+from mcp.types import ClientRequest, JSONRPCRequest
+
+
+@dataclass
+class BenchmarkConfig:
+    """How much work each benchmark does."""
+
+    iterations: int = 1000
+    """Round trips measured by the latency and throughput benchmarks."""
+    warmup: int = 100
+    """Round trips made before measuring."""
+    concurrency: int = 16
+    """Requests in flight at once in the throughput benchmark."""
+    payload_sizes: tuple[int, ...] = (1_024, 65_536, 1_048_576)
+    """Sizes in bytes of the payloads echoed by the payload benchmark."""
+    payload_iterations: int = 20
+    """Round trips measured for each payload size."""
+    sessions: int = 20
+    """Sessions held open at once by the memory benchmark."""
+    session_connects: int = 200
+    """Sessions opened and closed by the sessions benchmark, `concurrency` at a time."""
+    large_payload_sizes: tuple[int, ...] = (10_000_000, 100_000_000)
+    """Sizes in bytes of the payloads echoed by the large payload benchmark."""
+    large_payload_iterations: int = 3
+    """Round trips measured for each large payload size (at least two)."""
+    templates: int = 1000
+    """Resource templates registered for the template matching benchmark."""
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark over one transport."""
+
+    transport: str
+    benchmark: str
+    params: dict[str, Any] = field(default_factory=dict[str, Any])
+    metrics: dict[str, float] = field(default_factory=dict[str, float])
+
+    @property
+    def key(self) -> tuple[str, str, tuple[tuple[str, Any], ...]]:
+        """Identifies the same measurement across runs."""
+        return self.transport, self.benchmark, tuple(sorted(self.params.items()))
+
+
+PRIMARY_METRICS: dict[str, tuple[str, bool]] = {
+    "latency": ("p50_ms", False),
+    "throughput": ("ops_per_sec", True),
+    "payload": ("p50_ms", False),
+    "memory": ("bytes_per_session", False),
+    "sessions": ("sessions_per_sec", True),
+    "decode": ("us_per_message", False),
+    "templates": ("us_per_match", False),
+    "large-payload": ("mb_per_sec", True),
+}
+"""Metric compared across runs for each benchmark, and whether higher is better."""
+
+
+def _latency_metrics(durations: list[float]) -> dict[str, float]:
+    durations = sorted(durations)
+    quantiles = statistics.quantiles(durations, n=100, method="inclusive")
+    return {
+        "p50_ms": quantiles[49] * 1000,
+        "p90_ms": quantiles[89] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "mean_ms": statistics.fmean(durations) * 1000,
+        "ops_per_sec": len(durations) / sum(durations),
+    }
+
+
+async def _time_round_trips(operation: Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> list[float]:
+    for _ in range(warmup):
+        await operation()
+    durations: list[float] = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await operation()
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+async def run_latency(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Sequential round trips on one session: ping and a tool call that does nothing."""
+    results: list[BenchmarkResult] = []
+    async with target.connect() as session:
+        operations: dict[str, Callable[[], Awaitable[Any]]] = {
+            "ping": session.send_ping,
+            "tools/call": lambda: session.call_tool("noop", {}),
+        }
+        for method, operation in operations.items():
+            durations = await _time_round_trips(operation, config.iterations, config.warmup)
+            results.append(
+                BenchmarkResult(target.transport, "latency", {"method": method}, _latency_metrics(durations))
+            )
+    return results
+
+
+async def run_throughput(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Tool calls from concurrent tasks sharing one session."""
+    async with target.connect() as session:
+        for _ in range(config.warmup):
+            await session.call_tool("noop", {})
+
+        per_task = max(config.iterations // config.concurrency, 1)
+
+        async def worker() -> None:
+            for _ in range(per_task):
+                await session.call_tool("noop", {})
+
+        started_at = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(config.concurrency):
+                tg.start_soon(worker)
+        elapsed = time.perf_counter() - started_at
+
+    total = per_task * config.concurrency
+    return [
+        BenchmarkResult(
+            target.transport,
+            "throughput",
+            {"concurrency": config.concurrency},
+            {"ops_per_sec": total / elapsed, "elapsed_s": elapsed},
+        )
+    ]
+
+
+async def run_payload(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Tool calls echoing payloads of increasing size."""
+    return await _run_echo(target, "payload", config.payload_sizes, config.payload_iterations, warmup=2)
+
+
+async def run_large_payload(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Tool calls echoing payloads of tens of megabytes, over the stdio transports.
+
+    Only stdio clients frame the server's output themselves, so other transports are not measured.
+    """
+    if not target.transport.startswith("stdio"):
+        return []
+    return await _run_echo(
+        target, "large-payload", config.large_payload_sizes, config.large_payload_iterations, warmup=1
+    )
+
+
+async def _run_echo(
+    target: Target, benchmark: str, sizes: tuple[int, ...], iterations: int, warmup: int
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    async with target.connect() as session:
+        for size in sizes:
+            payload = "x" * size
+            durations = await _time_round_trips(
+                lambda: session.call_tool("echo", {"payload": payload}),
+                iterations,
+                warmup,
+            )
+            metrics = _latency_metrics(durations)
+            # The payload crosses the transport twice per round trip
+            metrics["mb_per_sec"] = 2 * size * len(durations) / sum(durations) / 1_000_000
+            results.append(BenchmarkResult(target.transport, benchmark, {"bytes": size}, metrics))
+    return results
+
+
+async def run_sessions(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Sessions opened, initialized and closed per second, `concurrency` at a time.
+
+    Servers started per session are not measured, as that would time process startup.
+    """
+    if target.transport != "memory" and target.server_pid is None:
+        return []
+
+    async def connect() -> None:
+        async with target.connect():
+            pass
+
+    for _ in range(min(config.warmup, config.session_connects)):
+        await connect()
+
+    per_task = max(config.session_connects // config.concurrency, 1)
+
+    async def worker() -> None:
+        for _ in range(per_task):
+            await connect()
+
+    started_at = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(config.concurrency):
+            tg.start_soon(worker)
+    elapsed = time.perf_counter() - started_at
+
+    total = per_task * config.concurrency
+    return [
+        BenchmarkResult(
+            target.transport,
+            "sessions",
+            {"concurrency": config.concurrency},
+            {"sessions_per_sec": total / elapsed, "elapsed_s": elapsed},
+        )
+    ]
+
+
+def _time_per_call(operation: Callable[[], Any], iterations: int, warmup: int) -> dict[str, float]:
+    for _ in range(warmup):
+        operation()
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    elapsed = time.perf_counter() - started_at
+    return {"us_per_call": elapsed / iterations * 1_000_000, "ops_per_sec": iterations / elapsed}
+
+
+async def run_decode(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Decoding a tools/call request from bytes to a typed request, as a transport and session do.
+
+    Runs in process, so it is only measured once, with the memory transport.
+    """
+    if target.transport != "memory":
+        return []
+    request = JSONRPCRequest(
+        jsonrpc="2.0", id=1, method="tools/call", params={"name": "echo", "arguments": {"payload": "x" * 64}}
+    )
+    data = request.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+    results: list[BenchmarkResult] = []
+    codec_names: tuple[JSONCodecName, ...] = ("pydantic", "orjson")
+    for codec_name in codec_names:
+        try:
+            codec = get_json_codec(codec_name)
+        except ImportError:
+            continue
+
+        def decode() -> None:
+            message = codec.decode_message(data)
+            assert isinstance(message.root, JSONRPCRequest)
+            ClientRequest.model_validate(_typed_message_data(message.root))
+
+        timing = _time_per_call(decode, config.iterations * 10, config.warmup)
+        results.append(
+            BenchmarkResult(
+                target.transport,
+                "decode",
+                {"codec": codec_name, "method": "tools/call"},
+                {"us_per_message": timing["us_per_call"], "messages_per_sec": timing["ops_per_sec"]},
+            )
+        )
+    return results
+
+
+async def run_templates(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Matching resource URIs against many registered resource templates.
+
+    Runs in process, so it is only measured once, with the memory transport.
+    """
+    if target.transport != "memory":
+        return []
+
+    def read_item(id: str) -> str:
+        return id
+
+    router = ResourceTemplateRouter()
+    for i in range(config.templates):
+        uri_template = f"resource{i}://items/{{id}}"
+        router[uri_template] = ResourceTemplate.from_function(read_item, uri_template, name=f"item{i}")
+    # Spread over the templates, including the last registered one
+    uris = [f"resource{i}://items/42" for i in range(0, config.templates, max(config.templates // 10, 1))]
+    uris.append(f"resource{config.templates - 1}://items/42")
+
+    def match() -> None:
+        for uri in uris:
+            assert router.match(uri) is not None
+
+    timing = _time_per_call(match, max(config.iterations // 10, 1), config.warmup // 10)
+    return [
+        BenchmarkResult(
+            target.transport,
+            "templates",
+            {"templates": config.templates},
+            {"us_per_match": timing["us_per_call"] / len(uris), "matches_per_sec": timing["ops_per_sec"] * len(uris)},
+        )
+    ]
+
+
+async def run_memory(target: Target, config: BenchmarkConfig) -> list[BenchmarkResult]:
+    """Memory used by each open session.
+
+    In process, this is what tracemalloc attributes to the client and server sessions.
+    For a shared server process, it is the growth of the server's resident set size,
+    read from /proc (Linux only). Servers started per session are not measured.
+    """
+    if target.transport == "memory":
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            async with AsyncExitStack() as stack:
+                for _ in range(config.sessions):
+                    await stack.enter_async_context(target.connect())
+                gc.collect()
+                used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+    elif target.server_pid is not None and sys.platform == "linux":
+        async with AsyncExitStack() as stack:
+            # The first session pays for imports and caches, not per-session state
+            session = await stack.enter_async_context(target.connect())
+            await session.call_tool("noop", {})
+            before = _rss(target.server_pid)
+            for _ in range(config.sessions):
+                session = await stack.enter_async_context(target.connect())
+                await session.call_tool("noop", {})
+            used = _rss(target.server_pid) - before
+    else:
+        return []
+
+    return [
+        BenchmarkResult(
+            target.transport,
+            "memory",
+            {"sessions": config.sessions},
+            {"bytes_per_session": used / config.sessions},
+        )
+    ]
+
+
+def _rss(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError(f"No VmRSS for process {pid}")
+
+
+BENCHMARKS: dict[str, Callable[[Target, BenchmarkConfig], Awaitable[list[BenchmarkResult]]]] = {
+    # First, before the large payloads grow and fragment the server's heap
+    "memory": run_memory,
+    "latency": run_latency,
+    "throughput": run_throughput,
+    "sessions": run_sessions,
+    "payload": run_payload,
+    "decode": run_decode,
+    "templates": run_templates,
+    # Last, as it grows the heap the most
+    "large-payload": run_large_payload,
+}
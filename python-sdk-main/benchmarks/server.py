@@ -0,0 +1,60 @@
+"""
+The FastMCP server the benchmarks run against.
+
+Out-of-process transports start it as a subprocess:
+
+    python -m benchmarks.server stdio [--stdio-mode nonblocking]
+    python -m benchmarks.server sse --port 8000
+    python -m benchmarks.server streamable-http --port 8000 [--stateless] [--json-response]
+"""
+
+import argparse
+from typing import Literal
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.stdio import StdioMode
+
+
+def create_server(
+    port: int = 8000,
+    stateless_http: bool = False,
+    json_response: bool = False,
+    stdio_mode: StdioMode = "thread",
+) -> FastMCP:
+    mcp = FastMCP(
+        "benchmark",
+        port=port,
+        stateless_http=stateless_http,
+        json_response=json_response,
+        stdio_mode=stdio_mode,
+        log_level="WARNING",
+    )
+
+    @mcp.tool()
+    def noop() -> str:
+        """Return immediately, to measure the protocol overhead of a tool call."""
+        return "ok"
+
+    @mcp.tool()
+    def echo(payload: str) -> str:
+        """Return the payload, to measure the cost of large messages."""
+        return payload
+
+    return mcp
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark server")
+    parser.add_argument("transport", choices=["stdio", "sse", "streamable-http"])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--stateless", action="store_true", help="Serve streamable HTTP without sessions")
+    parser.add_argument("--json-response", action="store_true", help="Answer streamable HTTP requests with JSON")
+    parser.add_argument("--stdio-mode", choices=["thread", "nonblocking"], default="thread", help="Stdio file access")
+    args = parser.parse_args()
+
+    transport: Literal["stdio", "sse", "streamable-http"] = args.transport
+    create_server(args.port, args.stateless, args.json_response, args.stdio_mode).run(transport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark targets: the benchmark server behind each transport."""
+
+import socket
+import sys
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from typing import Literal, get_args
+
+import anyio
+import httpx
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
+
+from benchmarks.server import create_server
+from mcp.client.session import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.shared.message import SessionMessage
+
+TransportName = Literal[
+    "memory",
+    "stdio",
+    "stdio-nonblocking",
+    "sse",
+    "http-stateful-sse",
+    "http-stateful-json",
+    "http-stateless-sse",
+    "http-stateless-json",
+]
+"""Transports the benchmarks can run over.
+
+- "memory": client and server in this process, connected by memory streams
+- "stdio": a server subprocess per session, over its stdin and stdout
+- "stdio-nonblocking": the same, with the server polling stdin and stdout on its event loop
+- "sse": a server subprocess with the SSE transport
+- "http-*": a server subprocess with the streamable HTTP transport, with or without
+  sessions, answering with SSE streams or JSON
+"""
+
+TRANSPORTS: tuple[TransportName, ...] = get_args(TransportName)
+
+Connect = Callable[[], AbstractAsyncContextManager[ClientSession]]
+
+
+@dataclass
+class Target:
+    """A running benchmark server."""
+
+    transport: TransportName
+    connect: Connect
+    """Open an initialized client session to the server."""
+    server_pid: int | None = None
+    """Process ID of a server shared by all sessions, if it runs out of process."""
+
+
+@asynccontextmanager
+async def start_target(transport: TransportName) -> AsyncGenerator[Target, None]:
+    """Start the benchmark server for a transport."""
+    if transport == "memory":
+        server = create_server()
+
+        def connect_memory() -> AbstractAsyncContextManager[ClientSession]:
+            return create_connected_server_and_client_session(server._mcp_server)  # type: ignore[reportPrivateUsage]
+
+        yield Target(transport, connect_memory)
+        return
+
+    if transport.startswith("stdio"):
+        args = ["-m", "benchmarks.server", "stdio"]
+        if transport == "stdio-nonblocking":
+            args += ["--stdio-mode", "nonblocking"]
+        parameters = StdioServerParameters(command=sys.executable, args=args)
+
+        @asynccontextmanager
+        async def connect_stdio() -> AsyncGenerator[ClientSession, None]:
+            async with stdio_client(parameters) as (read_stream, write_stream):
+                async with _initialized_session(read_stream, write_stream) as session:
+                    yield session
+
+        yield Target(transport, connect_stdio)
+        return
+
+    port = _free_port()
+    args = ["sse"] if transport == "sse" else ["streamable-http"]
+    if transport.startswith("http-stateless"):
+        args.append("--stateless")
+    if transport.endswith("-json"):
+        args.append("--json-response")
+
+    async with await anyio.open_process(
+        [sys.executable, "-m", "benchmarks.server", *args, "--port", str(port)]
+    ) as process:
+        try:
+            await _wait_for_port(port)
+            if transport == "sse":
+                url = f"http://127.0.0.1:{port}/sse"
+
+                @asynccontextmanager
+                async def connect_sse() -> AsyncGenerator[ClientSession, None]:
+                    async with sse_client(url) as (read_stream, write_stream):
+                        async with _initialized_session(read_stream, write_stream) as session:
+                            yield session
+
+                yield Target(transport, connect_sse, process.pid)
+            else:
+                url = f"http://127.0.0.1:{port}/mcp"
+
+                @asynccontextmanager
+                async def connect_http() -> AsyncGenerator[ClientSession, None]:
+                    async with streamablehttp_client(url) as (read_stream, write_stream, _):
+                        async with _initialized_session(read_stream, write_stream) as session:
+                            yield session
+
+                yield Target(transport, connect_http, process.pid)
+        finally:
+            process.terminate()
+
+
+@asynccontextmanager
+async def _initialized_session(
+    read_stream: ObjectReceiveStream[SessionMessage | Exception],
+    write_stream: ObjectSendStream[SessionMessage],
+) -> AsyncGenerator[ClientSession, None]:
+    async with ClientSession(read_stream, write_stream) as session:
+        await session.initialize()
+        yield session
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_for_port(port: int, timeout: float = 30.0) -> None:
+    with anyio.fail_after(timeout):
+        async with httpx.AsyncClient() as client:
+            while True:
+                try:
+                    await client.get(f"http://127.0.0.1:{port}/", timeout=1.0)
+                    return
+                except httpx.TransportError:
+                    await anyio.sleep(0.1)
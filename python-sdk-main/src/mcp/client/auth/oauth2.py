@@ -575,6 +575,10 @@ class OAuthClientProvider(httpx.Auth):
         if self.context.current_tokens and self.context.current_tokens.access_token:
             request.headers["Authorization"] = f"Bearer {self.context.current_tokens.access_token}"
 
+    def _current_access_token(self) -> str | None:
+        """Return the access token currently in use, if any."""
+        return self.context.current_tokens.access_token if self.context.current_tokens else None
+
     def _create_oauth_metadata_request(self, url: str) -> httpx.Request:
         return httpx.Request("GET", url, headers={MCP_PROTOCOL_VERSION: LATEST_PROTOCOL_VERSION})
 
@@ -584,7 +588,12 @@ class OAuthClientProvider(httpx.Auth):
         self.context.oauth_metadata = metadata
 
     async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
-        """HTTPX auth flow integration."""
+        """HTTPX auth flow integration.
+
+        The context lock is only held while tokens are loaded, refreshed or (re-)authorized.
+        Requests that already carry a valid token are sent without holding it, so concurrent
+        requests sharing this provider are not serialized behind each other's round trips.
+        """
         async with self.context.lock:
             if not self._initialized:
                 await self._initialize()
@@ -604,9 +613,18 @@ class OAuthClientProvider(httpx.Auth):
             if self.context.is_token_valid():
                 self._add_auth_header(request)
 
-            response = yield request
+            sent_access_token = self._current_access_token()
+
+        response = yield request
+
+        if response.status_code not in (401, 403):
+            return
 
-            if response.status_code == 401:
+        async with self.context.lock:
+            if self._current_access_token() != sent_access_token and self.context.is_token_valid():
+                # Another request re-authorized while this one was in flight; just retry with its token
+                pass
+            elif response.status_code == 401:
                 # Perform full OAuth flow
                 try:
                     # OAuth flow must be inline due to generator constraints
@@ -655,11 +673,7 @@ class OAuthClientProvider(httpx.Auth):
                 except Exception:
                     logger.exception("OAuth flow error")
                     raise
-
-                # Retry with new tokens
-                self._add_auth_header(request)
-                yield request
-            elif response.status_code == 403:
+            else:
                 # Step 1: Extract error field from WWW-Authenticate header
                 error = self._extract_field_from_www_auth(response, "error")
 
@@ -676,6 +690,7 @@ class OAuthClientProvider(httpx.Auth):
                         logger.exception("OAuth flow error")
                         raise
 
-                # Retry with new tokens
-                self._add_auth_header(request)
-                yield request
+            self._add_auth_header(request)
+
+        # Retry with new tokens
+        yield request
@@ -0,0 +1,86 @@
+"""
+Client-side cache of a server's tool, resource and prompt listings.
+
+Pass a ListCache to ClientSession to answer repeated list requests without a
+round trip to the server:
+
+    cache = ListCache()
+    async with ClientSession(read, write, list_cache=cache) as session:
+        await session.initialize()
+        await session.list_tools()  # asks the server
+        await session.list_tools()  # answered from the cache
+        tool = cache.tools_by_name["my_tool"]
+"""
+
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Literal, TypeVar, cast, get_args
+
+import mcp.types as types
+
+ListMethod = Literal["tools/list", "resources/list", "resources/templates/list", "prompts/list"]
+
+ResultT = TypeVar("ResultT", bound=types.PaginatedResult)
+
+
+class ListCache:
+    """Pages of listings received from the server, kept until the server reports a change.
+
+    Pages are cached by cursor. The session drops them when the server sends a
+    tools, resources or prompts list_changed notification. Servers that do not
+    send these notifications (see the listChanged capabilities) stay cached
+    until `invalidate()` is called, or for `ttl` seconds when it is set.
+    """
+
+    def __init__(self, ttl: float | None = None) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.ttl = ttl
+        self.hits = 0
+        """List requests answered from the cache."""
+        self.misses = 0
+        """List requests sent to the server."""
+        self._pages: dict[ListMethod, dict[str | None, tuple[types.PaginatedResult, float]]] = {
+            method: {} for method in get_args(ListMethod)
+        }
+        # Bumped on invalidation, so that a listing fetched meanwhile is not stored.
+        self._generations: dict[ListMethod, int] = dict.fromkeys(get_args(ListMethod), 0)
+        self._tools_by_name: dict[str, types.Tool] = {}
+
+    @property
+    def tools_by_name(self) -> Mapping[str, types.Tool]:
+        """The tools on the cached pages of tools/list, by name."""
+        return self._tools_by_name
+
+    def invalidate(self, *methods: ListMethod) -> None:
+        """Drops the cached pages of the given list methods, or of all of them."""
+        for method in methods or get_args(ListMethod):
+            self._pages[method].clear()
+            self._generations[method] += 1
+            if method == "tools/list":
+                self._tools_by_name.clear()
+
+    async def get_or_fetch(
+        self,
+        method: ListMethod,
+        cursor: str | None,
+        fetch: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Returns the cached page at `cursor`, or fetches and caches it."""
+        pages = self._pages[method]
+        cached = pages.get(cursor)
+        if cached is not None and (self.ttl is None or time.monotonic() - cached[1] < self.ttl):
+            self.hits += 1
+            # Pages are only stored by fetches of the same method.
+            return cast(ResultT, cached[0])
+
+        self.misses += 1
+        generation = self._generations[method]
+        result = await fetch()
+        if self._generations[method] == generation:
+            pages[cursor] = (result, time.monotonic())
+            if method == "tools/list":
+                self._tools_by_name = {
+                    tool.name: tool for page, _ in pages.values() for tool in cast(types.ListToolsResult, page).tools
+                }
+        return result
@@ -1,23 +1,29 @@
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import timedelta
-from typing import Any, Protocol, overload
+from typing import Any, Protocol, TypeVar, overload
 
 import anyio.lowlevel
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from jsonschema import SchemaError, ValidationError, validate
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
+from jsonschema import SchemaError, ValidationError
 from pydantic import AnyUrl, TypeAdapter
 from typing_extensions import deprecated
 
 import mcp.types as types
+from mcp.client.list_cache import ListCache, ListMethod
 from mcp.shared.context import RequestContext
-from mcp.shared.message import SessionMessage
-from mcp.shared.session import BaseSession, ProgressFnT, RequestResponder
-from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
+from mcp.shared.exceptions import McpError
+from mcp.shared.message import ClientMessageMetadata, RequestBatch, SessionMessage
+from mcp.shared.schema_validation import SchemaValidatorBackend, SchemaValidatorCache
+from mcp.shared.session import BaseSession, ProgressFnT, ProgressThrottle, RequestResponder
+from mcp.shared.version import BATCH_PROTOCOL_VERSIONS, SUPPORTED_PROTOCOL_VERSIONS
 
 DEFAULT_CLIENT_INFO = types.Implementation(name="mcp", version="0.1.0")
 
 logger = logging.getLogger("client")
 
+PaginatedResultT = TypeVar("PaginatedResultT", bound=types.PaginatedResult)
+
 
 class SamplingFnT(Protocol):
     async def __call__(
@@ -110,8 +116,8 @@ class ClientSession(
 ):
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        read_stream: ObjectReceiveStream[SessionMessage | Exception],
+        write_stream: ObjectSendStream[SessionMessage],
         read_timeout_seconds: timedelta | None = None,
         sampling_callback: SamplingFnT | None = None,
         elicitation_callback: ElicitationFnT | None = None,
@@ -119,6 +125,8 @@ class ClientSession(
         logging_callback: LoggingFnT | None = None,
         message_handler: MessageHandlerFnT | None = None,
         client_info: types.Implementation | None = None,
+        schema_validator_backend: SchemaValidatorBackend = "jsonschema",
+        list_cache: ListCache | None = None,
     ) -> None:
         super().__init__(
             read_stream,
@@ -134,7 +142,10 @@ class ClientSession(
         self._logging_callback = logging_callback or _default_logging_callback
         self._message_handler = message_handler or _default_message_handler
         self._tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+        self._output_validators = SchemaValidatorCache(schema_validator_backend)
         self._server_capabilities: types.ServerCapabilities | None = None
+        self._protocol_version: str | int | None = None
+        self._list_cache = list_cache
 
     async def initialize(self) -> types.InitializeResult:
         sampling = types.SamplingCapability() if self._sampling_callback is not _default_sampling_callback else None
@@ -172,6 +183,7 @@ class ClientSession(
             raise RuntimeError(f"Unsupported protocol version from the server: {result.protocolVersion}")
 
         self._server_capabilities = result.capabilities
+        self._protocol_version = result.protocolVersion
 
         await self.send_notification(types.ClientNotification(types.InitializedNotification()))
 
@@ -255,9 +267,13 @@ class ClientSession(
         else:
             request_params = None
 
-        return await self.send_request(
-            types.ClientRequest(types.ListResourcesRequest(params=request_params)),
-            types.ListResourcesResult,
+        return await self._list(
+            "resources/list",
+            request_params,
+            lambda: self.send_request(
+                types.ClientRequest(types.ListResourcesRequest(params=request_params)),
+                types.ListResourcesResult,
+            ),
         )
 
     @overload
@@ -294,9 +310,13 @@ class ClientSession(
         else:
             request_params = None
 
-        return await self.send_request(
-            types.ClientRequest(types.ListResourceTemplatesRequest(params=request_params)),
-            types.ListResourceTemplatesResult,
+        return await self._list(
+            "resources/templates/list",
+            request_params,
+            lambda: self.send_request(
+                types.ClientRequest(types.ListResourceTemplatesRequest(params=request_params)),
+                types.ListResourceTemplatesResult,
+            ),
         )
 
     async def read_resource(self, uri: AnyUrl) -> types.ReadResourceResult:
@@ -340,8 +360,13 @@ class ClientSession(
         progress_callback: ProgressFnT | None = None,
         *,
         meta: dict[str, Any] | None = None,
+        progress_throttle: ProgressThrottle | None = None,
     ) -> types.CallToolResult:
-        """Send a tools/call request with optional progress callback support."""
+        """Send a tools/call request with optional progress callback support.
+
+        With a `progress_throttle`, progress updates are coalesced before they are
+        passed to `progress_callback`; the last update is always passed on.
+        """
 
         _meta: types.RequestParams.Meta | None = None
         if meta is not None:
@@ -356,6 +381,7 @@ class ClientSession(
             types.CallToolResult,
             request_read_timeout_seconds=read_timeout_seconds,
             progress_callback=progress_callback,
+            progress_throttle=progress_throttle,
         )
 
         if not result.isError:
@@ -363,6 +389,61 @@ class ClientSession(
 
         return result
 
+    async def call_tools(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any] | None]],
+        read_timeout_seconds: timedelta | None = None,
+    ) -> list[types.CallToolResult | McpError]:
+        """Call several tools concurrently.
+
+        The calls are sent as a single JSON-RPC batch where the transport supports it
+        and the negotiated protocol version allows batches (2025-03-26 only); otherwise
+        they are sent as separate requests.
+
+        Args:
+            calls: (tool name, arguments) pairs to call
+            read_timeout_seconds: Timeout for each individual call
+
+        Returns:
+            The result of each call in the order of `calls`, or the McpError it failed with
+
+        Raises:
+            Exception: The first error other than McpError raised by a call, such as
+                a RuntimeError for a result that does not match the tool's output schema.
+                The other calls are cancelled.
+        """
+        batch = RequestBatch(size=len(calls)) if self._protocol_version in BATCH_PROTOCOL_VERSIONS else None
+        results: list[types.CallToolResult | McpError | None] = [None] * len(calls)
+        errors: list[Exception] = []
+
+        async def call(index: int, name: str, arguments: dict[str, Any] | None) -> None:
+            try:
+                result = await self.send_request(
+                    types.ClientRequest(
+                        types.CallToolRequest(params=types.CallToolRequestParams(name=name, arguments=arguments))
+                    ),
+                    types.CallToolResult,
+                    request_read_timeout_seconds=read_timeout_seconds,
+                    metadata=ClientMessageMetadata(batch=batch) if batch else None,
+                )
+                if not result.isError:
+                    await self._validate_tool_result(name, result)
+                results[index] = result
+            except McpError as e:
+                results[index] = e
+            except Exception as e:
+                # Raised as it is below rather than wrapped in an ExceptionGroup by the task group
+                errors.append(e)
+                tg.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for index, (name, arguments) in enumerate(calls):
+                tg.start_soon(call, index, name, arguments)
+
+        if errors:
+            raise errors[0]
+        return [result for result in results if result is not None]
+
     async def _validate_tool_result(self, name: str, result: types.CallToolResult) -> None:
         """Validate the structured content of a tool result against its output schema."""
         if name not in self._tool_output_schemas:
@@ -379,7 +460,7 @@ class ClientSession(
             if result.structuredContent is None:
                 raise RuntimeError(f"Tool {name} has an output schema but did not return structured content")
             try:
-                validate(result.structuredContent, output_schema)
+                self._output_validators.validate(name, result.structuredContent, output_schema)
             except ValidationError as e:
                 raise RuntimeError(f"Invalid structured content returned by tool {name}: {e}")
             except SchemaError as e:
@@ -417,9 +498,13 @@ class ClientSession(
         else:
             request_params = None
 
-        return await self.send_request(
-            types.ClientRequest(types.ListPromptsRequest(params=request_params)),
-            types.ListPromptsResult,
+        return await self._list(
+            "prompts/list",
+            request_params,
+            lambda: self.send_request(
+                types.ClientRequest(types.ListPromptsRequest(params=request_params)),
+                types.ListPromptsResult,
+            ),
         )
 
     async def get_prompt(self, name: str, arguments: dict[str, str] | None = None) -> types.GetPromptResult:
@@ -489,17 +574,37 @@ class ClientSession(
         else:
             request_params = None
 
-        result = await self.send_request(
-            types.ClientRequest(types.ListToolsRequest(params=request_params)),
-            types.ListToolsResult,
-        )
+        async def fetch() -> types.ListToolsResult:
+            result = await self.send_request(
+                types.ClientRequest(types.ListToolsRequest(params=request_params)),
+                types.ListToolsResult,
+            )
 
-        # Cache tool output schemas for future validation
-        # Note: don't clear the cache, as we may be using a cursor
-        for tool in result.tools:
-            self._tool_output_schemas[tool.name] = tool.outputSchema
+            # Cache tool output schemas for future validation
+            # Note: don't clear the cache, as we may be using a cursor
+            for tool in result.tools:
+                self._tool_output_schemas[tool.name] = tool.outputSchema
+                self._output_validators.invalidate(tool.name)
 
-        return result
+            return result
+
+        return await self._list("tools/list", request_params, fetch)
+
+    @property
+    def list_cache(self) -> ListCache | None:
+        """The cache of listings, if the session was created with one."""
+        return self._list_cache
+
+    async def _list(
+        self,
+        method: ListMethod,
+        params: types.PaginatedRequestParams | None,
+        fetch: Callable[[], Awaitable[PaginatedResultT]],
+    ) -> PaginatedResultT:
+        # Requests carrying metadata may expect more than the listing, so they always go to the server.
+        if self._list_cache is None or (params is not None and params.meta is not None):
+            return await fetch()
+        return await self._list_cache.get_or_fetch(method, params.cursor if params else None, fetch)
 
     async def send_roots_list_changed(self) -> None:
         """Send a roots/list_changed notification."""
@@ -549,5 +654,11 @@ class ClientSession(
         match notification.root:
             case types.LoggingMessageNotification(params=params):
                 await self._logging_callback(params)
+            case types.ToolListChangedNotification() if self._list_cache is not None:
+                self._list_cache.invalidate("tools/list")
+            case types.ResourceListChangedNotification() if self._list_cache is not None:
+                self._list_cache.invalidate("resources/list", "resources/templates/list")
+            case types.PromptListChangedNotification() if self._list_cache is not None:
+                self._list_cache.invalidate("prompts/list")
             case _:
                 pass
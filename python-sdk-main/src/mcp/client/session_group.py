@@ -10,12 +10,16 @@ hook.
 
 import contextlib
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import timedelta
 from types import TracebackType
-from typing import Any, TypeAlias
+from typing import Any, Literal, TypeAlias, TypeVar
 
 import anyio
+import httpx
+from anyio.abc import TaskGroup, TaskStatus
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -64,6 +68,90 @@ class StreamableHttpParameters(BaseModel):
 
 ServerParameters: TypeAlias = StdioServerParameters | SseServerParameters | StreamableHttpParameters
 
+PaginatedResultT = TypeVar("PaginatedResultT", bound=types.PaginatedResult)
+
+
+@dataclass
+class ServerConnection:
+    """Outcome of connecting to one server with `ClientSessionGroup.connect_to_servers`."""
+
+    server_params: ServerParameters
+    session: mcp.ClientSession | None = None
+    server_info: types.Implementation | None = None
+    error: Exception | None = None
+    """Why the server could not be connected, if it failed."""
+    initialize_time: float | None = None
+    """Seconds spent opening the transport and initializing the session."""
+    startup_time: float | None = None
+    """Seconds from starting to connect until the server's components were aggregated."""
+
+    @property
+    def connected(self) -> bool:
+        return self.error is None
+
+
+ReplicaRouting: TypeAlias = Literal["least_outstanding", "latency"]
+
+
+@dataclass(frozen=True)
+class ReplicaPolicy:
+    """How a ClientSessionGroup pools replicas of a server and routes tool calls.
+
+    With a replica policy, sessions to servers reporting the same name in their
+    serverInfo form a pool of replicas instead of clashing over component
+    names. Each tool call goes to one replica of the pool:
+
+    - "least_outstanding": the replica with the fewest calls in flight
+    - "latency": the replica with the lowest latency EWMA, weighted by its calls
+      in flight
+
+    A replica whose calls fail `eject_after_failures` times in a row, by
+    timing out or losing its connection, is skipped for `ejection_period`
+    seconds. Calls to tools annotated with idempotentHint are retried on
+    another replica when they fail that way.
+    """
+
+    routing: ReplicaRouting = "least_outstanding"
+    eject_after_failures: int = 3
+    ejection_period: float = 30.0
+    latency_ewma_alpha: float = 0.3
+    """Weight of the latest call in the latency EWMA."""
+
+    def __post_init__(self) -> None:
+        if self.eject_after_failures < 1:
+            raise ValueError("eject_after_failures must be at least 1")
+        if self.ejection_period < 0:
+            raise ValueError("ejection_period must not be negative")
+        if not 0 < self.latency_ewma_alpha <= 1:
+            raise ValueError("latency_ewma_alpha must be in (0, 1]")
+
+
+@dataclass
+class Replica:
+    """A session in a pool of replicas, with the statistics used to route calls to it."""
+
+    session: mcp.ClientSession
+    tools: set[str] = field(default_factory=set[str])
+    """Group names of the tools this replica serves."""
+    outstanding: int = 0
+    """Tool calls in flight."""
+    latency_ewma: float | None = None
+    """Exponentially weighted moving average of call latency in seconds."""
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    """Monotonic time until which the replica is skipped."""
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > time.monotonic()
+
+
+@dataclass
+class _ReplicaPool:
+    server_name: str
+    replicas: list[Replica]
+    """The first replica owns the pool's components in ClientSessionGroup._sessions."""
+
 
 class ClientSessionGroup:
     """Client for managing connections to multiple MCP servers.
@@ -81,6 +169,16 @@ class ClientSessionGroup:
                 await group.connect_to_server(server_param)
             ...
 
+        # Or connect to all of them concurrently, tolerating failures.
+        async with ClientSessionGroup() as group:
+            for connection in await group.connect_to_servers(server_params):
+                print(connection.server_params, connection.startup_time, connection.error)
+
+        # Spread tool calls over several replicas of the same server.
+        async with ClientSessionGroup(replica_policy=ReplicaPolicy()) as group:
+            await group.connect_to_servers([replica_params] * 3)
+            await group.call_tool("tool", {})
+
     """
 
     class _ComponentNames(BaseModel):
@@ -100,6 +198,14 @@ class ClientSessionGroup:
     _tool_to_session: dict[str, mcp.ClientSession]
     _exit_stack: contextlib.AsyncExitStack
     _session_exit_stacks: dict[mcp.ClientSession, contextlib.AsyncExitStack]
+    # Hosts the sessions opened by connect_to_servers, which must be entered
+    # and exited in the same task.
+    _task_group: TaskGroup | None
+
+    # Replica pools by server name, and the pool of each pooled session.
+    _replica_policy: ReplicaPolicy | None
+    _pools: dict[str, _ReplicaPool]
+    _session_pools: dict[mcp.ClientSession, _ReplicaPool]
 
     # Optional fn consuming (component_name, serverInfo) for custom names.
     # This is provide a means to mitigate naming conflicts across servers.
@@ -111,6 +217,7 @@ class ClientSessionGroup:
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         component_name_hook: _ComponentNameHook | None = None,
+        replica_policy: ReplicaPolicy | None = None,
     ) -> None:
         """Initializes the MCP client."""
 
@@ -128,11 +235,17 @@ class ClientSessionGroup:
             self._owns_exit_stack = False
         self._session_exit_stacks = {}
         self._component_name_hook = component_name_hook
+        self._task_group = None
+        self._replica_policy = replica_policy
+        self._pools = {}
+        self._session_pools = {}
 
     async def __aenter__(self) -> Self:
         # Enter the exit stack only if we created it ourselves
         if self._owns_exit_stack:
             await self._exit_stack.__aenter__()
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
         return self
 
     async def __aexit__(
@@ -152,6 +265,12 @@ class ClientSessionGroup:
             for exit_stack in self._session_exit_stacks.values():
                 tg.start_soon(exit_stack.aclose)
 
+        # Stop the tasks of hosted sessions that are no longer tracked.
+        if self._task_group is not None:
+            task_group, self._task_group = self._task_group, None
+            task_group.cancel_scope.cancel()
+            await task_group.__aexit__(_exc_type, _exc_val, _exc_tb)
+
     @property
     def sessions(self) -> list[mcp.ClientSession]:
         """Returns the list of sessions being managed."""
@@ -172,12 +291,92 @@ class ClientSessionGroup:
         """Returns the tools as a dictionary of names to tools."""
         return self._tools
 
+    def replicas(self, name: str) -> list[Replica]:
+        """Returns the replicas serving a tool, or an empty list if its server is not pooled."""
+        pool = self._session_pools.get(self._tool_to_session[name])
+        if pool is None:
+            return []
+        return [replica for replica in pool.replicas if name in replica.tools]
+
     async def call_tool(self, name: str, args: dict[str, Any]) -> types.CallToolResult:
         """Executes a tool given its name and arguments."""
         session = self._tool_to_session[name]
         session_tool_name = self.tools[name].name
+        pool = self._session_pools.get(session)
+        if pool is not None:
+            return await self._call_replicas(pool, name, session_tool_name, args)
         return await session.call_tool(session_tool_name, args)
 
+    async def _call_replicas(
+        self, pool: _ReplicaPool, name: str, session_tool_name: str, args: dict[str, Any]
+    ) -> types.CallToolResult:
+        """Calls a tool on the best replica, retrying idempotent tools on another one."""
+        annotations = self._tools[name].annotations
+        idempotent = annotations is not None and annotations.idempotentHint is True
+        tried: set[mcp.ClientSession] = set()
+
+        replica = self._choose_replica(pool, name, tried)
+        if replica is None:
+            return await self._tool_to_session[name].call_tool(session_tool_name, args)
+
+        while True:
+            tried.add(replica.session)
+            replica.outstanding += 1
+            started_at = time.perf_counter()
+            try:
+                try:
+                    result = await replica.session.call_tool(session_tool_name, args)
+                finally:
+                    replica.outstanding -= 1
+            except Exception as err:
+                if not _is_replica_failure(err):
+                    # The replica answered, so it is healthy.
+                    self._record_replica_success(replica, time.perf_counter() - started_at)
+                    raise
+                self._record_replica_failure(pool, replica)
+                retry = self._choose_replica(pool, name, tried) if idempotent else None
+                if retry is None:
+                    raise
+                logging.warning(f"Retrying idempotent tool {name} on another replica of {pool.server_name}: {err}")
+                replica = retry
+            else:
+                self._record_replica_success(replica, time.perf_counter() - started_at)
+                return result
+
+    def _choose_replica(self, pool: _ReplicaPool, name: str, exclude: set[mcp.ClientSession]) -> Replica | None:
+        assert self._replica_policy is not None
+        candidates = [replica for replica in pool.replicas if name in replica.tools and replica.session not in exclude]
+        # With every replica ejected, keep trying them rather than failing outright.
+        candidates = [replica for replica in candidates if not replica.ejected] or candidates
+        if not candidates:
+            return None
+        if self._replica_policy.routing == "latency":
+            return min(
+                candidates,
+                key=lambda replica: ((replica.latency_ewma or 0.0) * (replica.outstanding + 1), replica.outstanding),
+            )
+        return min(candidates, key=lambda replica: (replica.outstanding, replica.latency_ewma or 0.0))
+
+    def _record_replica_success(self, replica: Replica, latency: float) -> None:
+        assert self._replica_policy is not None
+        alpha = self._replica_policy.latency_ewma_alpha
+        if replica.latency_ewma is None:
+            replica.latency_ewma = latency
+        else:
+            replica.latency_ewma = alpha * latency + (1 - alpha) * replica.latency_ewma
+        replica.consecutive_failures = 0
+        replica.ejected_until = 0.0
+
+    def _record_replica_failure(self, pool: _ReplicaPool, replica: Replica) -> None:
+        assert self._replica_policy is not None
+        replica.consecutive_failures += 1
+        if replica.consecutive_failures >= self._replica_policy.eject_after_failures:
+            replica.ejected_until = time.monotonic() + self._replica_policy.ejection_period
+            logging.warning(
+                f"Ejecting a replica of {pool.server_name} for {self._replica_policy.ejection_period}s "
+                f"after {replica.consecutive_failures} consecutive failures"
+            )
+
     async def disconnect_from_server(self, session: mcp.ClientSession) -> None:
         """Disconnects from a single MCP server."""
 
@@ -192,7 +391,14 @@ class ClientSessionGroup:
                 )
             )
 
-        if session_known_for_components:
+        pool = self._session_pools.pop(session, None)
+        if pool is not None and len(pool.replicas) == 1:
+            del self._pools[pool.server_name]
+
+        if pool is not None and len(pool.replicas) > 1:
+            # Other replicas remain, so the pool's components stay in the group.
+            self._remove_replica(pool, session)
+        elif session_known_for_components:
             component_names = self._sessions.pop(session)  # Pop from _sessions tracking
 
             # Remove prompts associated with the session.
@@ -215,6 +421,26 @@ class ClientSessionGroup:
             session_stack_to_close = self._session_exit_stacks.pop(session)
             await session_stack_to_close.aclose()
 
+    def _remove_replica(self, pool: _ReplicaPool, session: mcp.ClientSession) -> None:
+        """Removes a replica from its pool, handing the pool's components to the next owner."""
+        owner = pool.replicas[0].session
+        pool.replicas = [replica for replica in pool.replicas if replica.session is not session]
+        component_names = self._sessions.pop(session)
+        if session is not owner:
+            component_names = self._sessions[owner]
+
+        # Drop the tools no remaining replica serves.
+        served = set[str]().union(*(replica.tools for replica in pool.replicas))
+        for name in component_names.tools - served:
+            self._tools.pop(name, None)
+            self._tool_to_session.pop(name, None)
+        component_names.tools &= served
+
+        new_owner = pool.replicas[0].session
+        self._sessions[new_owner] = component_names
+        for name in component_names.tools:
+            self._tool_to_session[name] = new_owner
+
     async def connect_with_session(
         self, server_info: types.Implementation, session: mcp.ClientSession
     ) -> mcp.ClientSession:
@@ -230,6 +456,128 @@ class ClientSessionGroup:
         server_info, session = await self._establish_session(server_params)
         return await self.connect_with_session(server_info, session)
 
+    async def connect_to_servers(
+        self,
+        server_params: Sequence[ServerParameters],
+        max_concurrency: int = 10,
+    ) -> list[ServerConnection]:
+        """Connects to several MCP servers concurrently.
+
+        At most `max_concurrency` servers are connected at once. A server that
+        fails to connect, or whose components collide with those already in the
+        group, is disconnected and reported without affecting the others.
+
+        The group must have been entered with `async with`.
+
+        Returns:
+            The outcome for each server, in the order of `server_params`.
+        """
+        if self._task_group is None:
+            raise RuntimeError("ClientSessionGroup must be entered before connecting to servers concurrently")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        task_group = self._task_group
+        limiter = anyio.CapacityLimiter(max_concurrency)
+        connections = [ServerConnection(params) for params in server_params]
+
+        async def connect(connection: ServerConnection) -> None:
+            async with limiter:
+                started_at = time.perf_counter()
+                try:
+                    server_info, session = await task_group.start(self._host_session, connection.server_params)
+                except Exception as err:
+                    logging.warning(f"Could not connect to {connection.server_params}: {err}")
+                    connection.error = err
+                    return
+                connection.initialize_time = time.perf_counter() - started_at
+                try:
+                    await self.connect_with_session(server_info, session)
+                except Exception as err:
+                    logging.warning(f"Could not aggregate components of {server_info.name}: {err}")
+                    connection.error = err
+                    await self._close_session(session)
+                    return
+                connection.startup_time = time.perf_counter() - started_at
+                connection.session = session
+                connection.server_info = server_info
+
+        async with anyio.create_task_group() as tg:
+            for connection in connections:
+                tg.start_soon(connect, connection)
+        return connections
+
+    async def _host_session(
+        self,
+        server_params: ServerParameters,
+        *,
+        task_status: TaskStatus[tuple[types.Implementation, mcp.ClientSession]],
+    ) -> None:
+        """Holds a session open in its own task until it is disconnected.
+
+        The transports and the session run task groups, which must be exited by
+        the task that entered them, so a session opened concurrently with
+        others lives in a task of the group's task group. The session's exit
+        stack only tells that task to close it.
+        """
+        closing = anyio.Event()
+        closed = anyio.Event()
+
+        async def close() -> None:
+            closing.set()
+            await closed.wait()
+
+        try:
+            async with contextlib.AsyncExitStack() as transport_stack:
+                server_info, session = await self._open_session(server_params, transport_stack)
+
+                session_stack = contextlib.AsyncExitStack()
+                session_stack.push_async_callback(close)
+                self._session_exit_stacks[session] = session_stack
+                await self._exit_stack.enter_async_context(session_stack)
+
+                task_status.started((server_info, session))
+                await closing.wait()
+        finally:
+            closed.set()
+
+    async def _close_session(self, session: mcp.ClientSession) -> None:
+        self._sessions.pop(session, None)
+        session_stack = self._session_exit_stacks.pop(session, None)
+        if session_stack is not None:
+            await session_stack.aclose()
+
+    async def _open_session(
+        self, server_params: ServerParameters, session_stack: contextlib.AsyncExitStack
+    ) -> tuple[types.Implementation, mcp.ClientSession]:
+        """Open the transport and initialize a session on the given stack."""
+
+        # Create read and write streams that facilitate io with the server.
+        if isinstance(server_params, StdioServerParameters):
+            client = mcp.stdio_client(server_params)
+            read, write = await session_stack.enter_async_context(client)
+        elif isinstance(server_params, SseServerParameters):
+            client = sse_client(
+                url=server_params.url,
+                headers=server_params.headers,
+                timeout=server_params.timeout,
+                sse_read_timeout=server_params.sse_read_timeout,
+            )
+            read, write = await session_stack.enter_async_context(client)
+        else:
+            client = streamablehttp_client(
+                url=server_params.url,
+                headers=server_params.headers,
+                timeout=server_params.timeout,
+                sse_read_timeout=server_params.sse_read_timeout,
+                terminate_on_close=server_params.terminate_on_close,
+            )
+            read, write, _ = await session_stack.enter_async_context(client)
+
+        session = await session_stack.enter_async_context(mcp.ClientSession(read, write))
+        result = await session.initialize()
+        return result.serverInfo, session
+
     async def _establish_session(
         self, server_params: ServerParameters
     ) -> tuple[types.Implementation, mcp.ClientSession]:
@@ -237,30 +585,7 @@ class ClientSessionGroup:
 
         session_stack = contextlib.AsyncExitStack()
         try:
-            # Create read and write streams that facilitate io with the server.
-            if isinstance(server_params, StdioServerParameters):
-                client = mcp.stdio_client(server_params)
-                read, write = await session_stack.enter_async_context(client)
-            elif isinstance(server_params, SseServerParameters):
-                client = sse_client(
-                    url=server_params.url,
-                    headers=server_params.headers,
-                    timeout=server_params.timeout,
-                    sse_read_timeout=server_params.sse_read_timeout,
-                )
-                read, write = await session_stack.enter_async_context(client)
-            else:
-                client = streamablehttp_client(
-                    url=server_params.url,
-                    headers=server_params.headers,
-                    timeout=server_params.timeout,
-                    sse_read_timeout=server_params.sse_read_timeout,
-                    terminate_on_close=server_params.terminate_on_close,
-                )
-                read, write, _ = await session_stack.enter_async_context(client)
-
-            session = await session_stack.enter_async_context(mcp.ClientSession(read, write))
-            result = await session.initialize()
+            server_info, session = await self._open_session(server_params, session_stack)
 
             # Session successfully initialized.
             # Store its stack and register the stack with the main group stack.
@@ -269,7 +594,7 @@ class ClientSessionGroup:
             # main _exit_stack.
             await self._exit_stack.enter_async_context(session_stack)
 
-            return result.serverInfo, session
+            return server_info, session
         except Exception:
             # If anything during this setup fails, ensure the session-specific
             # stack is closed.
@@ -292,43 +617,59 @@ class ClientSessionGroup:
         tool_to_session_temp: dict[str, mcp.ClientSession] = {}
 
         # Query the server for its prompts and aggregate to list.
-        try:
-            prompts = (await session.list_prompts()).prompts
-            for prompt in prompts:
+        async def aggregate_prompts() -> None:
+            try:
+                pages = await self._list_all_pages(lambda params: session.list_prompts(params=params))
+            except McpError as err:
+                logging.warning(f"Could not fetch prompts: {err}")
+                return
+            for prompt in (prompt for page in pages for prompt in page.prompts):
                 name = self._component_name(prompt.name, server_info)
                 prompts_temp[name] = prompt
                 component_names.prompts.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch prompts: {err}")
 
         # Query the server for its resources and aggregate to list.
-        try:
-            resources = (await session.list_resources()).resources
-            for resource in resources:
+        async def aggregate_resources() -> None:
+            try:
+                pages = await self._list_all_pages(lambda params: session.list_resources(params=params))
+            except McpError as err:
+                logging.warning(f"Could not fetch resources: {err}")
+                return
+            for resource in (resource for page in pages for resource in page.resources):
                 name = self._component_name(resource.name, server_info)
                 resources_temp[name] = resource
                 component_names.resources.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch resources: {err}")
 
         # Query the server for its tools and aggregate to list.
-        try:
-            tools = (await session.list_tools()).tools
-            for tool in tools:
+        async def aggregate_tools() -> None:
+            try:
+                pages = await self._list_all_pages(lambda params: session.list_tools(params=params))
+            except McpError as err:
+                logging.warning(f"Could not fetch tools: {err}")
+                return
+            for tool in (tool for page in pages for tool in page.tools):
                 name = self._component_name(tool.name, server_info)
                 tools_temp[name] = tool
                 tool_to_session_temp[name] = session
                 component_names.tools.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch tools: {err}")
+
+        # The three listings are independent, so make them concurrently.
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(aggregate_prompts)
+            tg.start_soon(aggregate_resources)
+            tg.start_soon(aggregate_tools)
 
         # Clean up exit stack for session if we couldn't retrieve anything
         # from the server.
         if not any((prompts_temp, resources_temp, tools_temp)):
             del self._session_exit_stacks[session]
 
+        # A replica of a pooled server shares the components of its pool.
+        pool = self._pools.get(server_info.name) if self._replica_policy is not None else None
+        pool_names = self._sessions[pool.replicas[0].session] if pool is not None else self._ComponentNames()
+
         # Check for duplicates.
-        matching_prompts = prompts_temp.keys() & self._prompts.keys()
+        matching_prompts = prompts_temp.keys() & (self._prompts.keys() - pool_names.prompts)
         if matching_prompts:
             raise McpError(
                 types.ErrorData(
@@ -336,7 +677,7 @@ class ClientSessionGroup:
                     message=f"{matching_prompts} already exist in group prompts.",
                 )
             )
-        matching_resources = resources_temp.keys() & self._resources.keys()
+        matching_resources = resources_temp.keys() & (self._resources.keys() - pool_names.resources)
         if matching_resources:
             raise McpError(
                 types.ErrorData(
@@ -344,7 +685,7 @@ class ClientSessionGroup:
                     message=f"{matching_resources} already exist in group resources.",
                 )
             )
-        matching_tools = tools_temp.keys() & self._tools.keys()
+        matching_tools = tools_temp.keys() & (self._tools.keys() - pool_names.tools)
         if matching_tools:
             raise McpError(
                 types.ErrorData(
@@ -353,14 +694,55 @@ class ClientSessionGroup:
                 )
             )
 
+        if pool is not None:
+            pool.replicas.append(Replica(session, tools=set(tools_temp)))
+            self._session_pools[session] = pool
+            self._sessions[session] = self._ComponentNames()
+
+            # Components new to the pool belong to its owner, like the rest.
+            pool_names.prompts |= component_names.prompts
+            pool_names.resources |= component_names.resources
+            pool_names.tools |= component_names.tools
+            prompts_temp = {name: prompt for name, prompt in prompts_temp.items() if name not in self._prompts}
+            resources_temp = {
+                name: resource for name, resource in resources_temp.items() if name not in self._resources
+            }
+            tools_temp = {name: tool for name, tool in tools_temp.items() if name not in self._tools}
+            tool_to_session_temp = dict.fromkeys(tools_temp, pool.replicas[0].session)
+        else:
+            if self._replica_policy is not None:
+                self._pools[server_info.name] = pool = _ReplicaPool(
+                    server_info.name, [Replica(session, tools=set(tools_temp))]
+                )
+                self._session_pools[session] = pool
+            self._sessions[session] = component_names
+
         # Aggregate components.
-        self._sessions[session] = component_names
         self._prompts.update(prompts_temp)
         self._resources.update(resources_temp)
         self._tools.update(tools_temp)
         self._tool_to_session.update(tool_to_session_temp)
 
+    @staticmethod
+    async def _list_all_pages(
+        list_page: Callable[[types.PaginatedRequestParams | None], Awaitable[PaginatedResultT]],
+    ) -> list[PaginatedResultT]:
+        """Follows nextCursor until the server has returned every page."""
+        pages = [await list_page(None)]
+        seen_cursors: set[str] = set()
+        while (cursor := pages[-1].nextCursor) and cursor not in seen_cursors:
+            seen_cursors.add(cursor)
+            pages.append(await list_page(types.PaginatedRequestParams(cursor=cursor)))
+        return pages
+
     def _component_name(self, name: str, server_info: types.Implementation) -> str:
         if self._component_name_hook:
             return self._component_name_hook(name, server_info)
         return name
+
+
+def _is_replica_failure(err: Exception) -> bool:
+    """Whether a failed call means the replica itself is unhealthy, rather than the request."""
+    if isinstance(err, McpError):
+        return err.error.code in (types.CONNECTION_CLOSED, httpx.codes.REQUEST_TIMEOUT)
+    return True
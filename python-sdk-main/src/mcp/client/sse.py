@@ -10,8 +10,8 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import aconnect_sse
 from httpx_sse._exceptions import SSEError
 
-import mcp.types as types
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,7 @@ async def sse_client(
     sse_read_timeout: float = 60 * 5,
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
+    codec: JSONCodec | JSONCodecName | None = None,
 ):
     """
     Client transport for SSE.
@@ -42,7 +43,9 @@ async def sse_client(
         timeout: HTTP timeout for regular operations.
         sse_read_timeout: Timeout for SSE read operations.
         auth: Optional HTTPX authentication handler.
+        codec: JSON codec used for messages (pydantic-core by default).
     """
+    json_codec = get_json_codec(codec)
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
@@ -93,9 +96,7 @@ async def sse_client(
 
                                     case "message":
                                         try:
-                                            message = types.JSONRPCMessage.model_validate_json(  # noqa: E501
-                                                sse.data
-                                            )
+                                            message = json_codec.decode_message(sse.data)
                                             logger.debug(f"Received server message: {message}")
                                         except Exception as exc:
                                             logger.exception("Error parsing server message")
@@ -122,11 +123,8 @@ async def sse_client(
                                     logger.debug(f"Sending client message: {session_message}")
                                     response = await client.post(
                                         endpoint_url,
-                                        json=session_message.message.model_dump(
-                                            by_alias=True,
-                                            mode="json",
-                                            exclude_none=True,
-                                        ),
+                                        content=json_codec.encode_message(session_message.message),
+                                        headers={"Content-Type": "application/json"},
                                     )
                                     response.raise_for_status()
                                     logger.debug(f"Client message sent successfully: {response.status_code}")
@@ -1,3 +1,4 @@
+import codecs
 import logging
 import os
 import sys
@@ -8,11 +9,8 @@ from typing import Literal, TextIO
 import anyio
 import anyio.lowlevel
 from anyio.abc import Process
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel, Field
 
-import mcp.types as types
 from mcp.os.posix.utilities import terminate_posix_process_tree
 from mcp.os.win32.utilities import (
     FallbackProcess,
@@ -20,7 +18,10 @@ from mcp.os.win32.utilities import (
     get_windows_executable_command,
     terminate_windows_process_tree,
 )
+from mcp.shared.framing import LineFramer, MessageTooLargeError
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import SessionMessage
+from mcp.shared.streams import BufferedReceiveStream, BufferedSendStream, StreamBuffer, create_message_stream
 
 logger = logging.getLogger(__name__)
 
@@ -101,21 +102,38 @@ class StdioServerParameters(BaseModel):
     explanations of possible values
     """
 
+    max_message_size: int | None = None
+    """
+    The maximum size in bytes of a message received from the server.
+
+    Longer messages are discarded and reported as an error on the read stream.
+    If None, messages of any size are accepted.
+    """
+
 
 @asynccontextmanager
-async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stderr):
+async def stdio_client(
+    server: StdioServerParameters,
+    errlog: TextIO = sys.stderr,
+    codec: JSONCodec | JSONCodecName | None = None,
+    stream_buffer: StreamBuffer | int = 0,
+):
     """
     Client transport for stdio: this will connect to a server by spawning a
     process and communicating with it over stdin/stdout.
+
+    `codec` selects the JSON codec used for messages (pydantic-core by default).
+    `stream_buffer` sets how many messages the read and write streams buffer.
     """
-    read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
-    read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+    json_codec = get_json_codec(codec)
+    read_stream: BufferedReceiveStream[SessionMessage | Exception]
+    read_stream_writer: BufferedSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: BufferedSendStream[SessionMessage]
+    write_stream_reader: BufferedReceiveStream[SessionMessage]
 
-    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
-    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    read_stream_writer, read_stream = create_message_stream[SessionMessage | Exception](stream_buffer)
+    write_stream, write_stream_reader = create_message_stream[SessionMessage](stream_buffer)
 
     try:
         command = _get_executable_command(server.command)
@@ -139,20 +157,23 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
     async def stdout_reader():
         assert process.stdout, "Opened process is missing stdout"
 
+        # Lines are split on the raw bytes, which requires an ASCII-compatible encoding.
+        # UTF-8 lines are validated as bytes without decoding them first.
+        utf8 = codecs.lookup(server.encoding).name == "utf-8" and server.encoding_error_handler == "strict"
+
         try:
             async with read_stream_writer:
-                buffer = ""
-                async for chunk in TextReceiveStream(
-                    process.stdout,
-                    encoding=server.encoding,
-                    errors=server.encoding_error_handler,
-                ):
-                    lines = (buffer + chunk).split("\n")
-                    buffer = lines.pop()
-
-                    for line in lines:
+                framer = LineFramer(server.max_message_size)
+                async for chunk in process.stdout:
+                    for line in framer.feed(chunk):
+                        if isinstance(line, MessageTooLargeError):
+                            logger.error(f"Discarded message from server: {line}")
+                            await read_stream_writer.send(line)
+                            continue
+
                         try:
-                            message = types.JSONRPCMessage.model_validate_json(line)
+                            data = line if utf8 else line.decode(server.encoding, server.encoding_error_handler)
+                            message = json_codec.decode_message(data)
                         except Exception as exc:
                             logger.exception("Failed to parse JSONRPC message from server")
                             await read_stream_writer.send(exc)
@@ -169,7 +190,7 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    json = json_codec.encode_message(session_message.message)
                     await process.stdin.send(
                         (json + "\n").encode(
                             encoding=server.encoding,
@@ -19,8 +19,12 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import EventSource, ServerSentEvent, aconnect_sse
 
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
-from mcp.shared.message import ClientMessageMetadata, SessionMessage
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
+from mcp.shared.message import ClientMessageMetadata, RequestBatch, SessionMessage
+from mcp.shared.version import BATCH_PROTOCOL_VERSIONS
 from mcp.types import (
+    INTERNAL_ERROR,
+    INVALID_REQUEST,
     ErrorData,
     InitializeResult,
     JSONRPCError,
@@ -81,6 +85,7 @@ class StreamableHTTPTransport:
         timeout: float | timedelta = 30,
         sse_read_timeout: float | timedelta = 60 * 5,
         auth: httpx.Auth | None = None,
+        codec: JSONCodec | JSONCodecName | None = None,
     ) -> None:
         """Initialize the StreamableHTTP transport.
 
@@ -90,6 +95,7 @@ class StreamableHTTPTransport:
             timeout: HTTP timeout for regular operations.
             sse_read_timeout: Timeout for SSE read operations.
             auth: Optional HTTPX authentication handler.
+            codec: JSON codec used for messages (pydantic-core by default).
         """
         self.url = url
         self.headers = headers or {}
@@ -98,6 +104,7 @@ class StreamableHTTPTransport:
             sse_read_timeout.total_seconds() if isinstance(sse_read_timeout, timedelta) else sse_read_timeout
         )
         self.auth = auth
+        self.codec = get_json_codec(codec)
         self.session_id = None
         self.protocol_version = None
         self.request_headers = {
@@ -159,7 +166,7 @@ class StreamableHTTPTransport:
         """Handle an SSE event, returning True if the response is complete."""
         if sse.event == "message":
             try:
-                message = JSONRPCMessage.model_validate_json(sse.data)
+                message = self.codec.decode_message(sse.data)
                 logger.debug(f"SSE message: {message}")
 
                 # Extract protocol version from initialization response
@@ -260,7 +267,7 @@ class StreamableHTTPTransport:
         async with ctx.client.stream(
             "POST",
             self.url,
-            json=message.model_dump(by_alias=True, mode="json", exclude_none=True),
+            content=self.codec.encode_message(message),
             headers=headers,
         ) as response:
             if response.status_code == 202:
@@ -293,6 +300,76 @@ class StreamableHTTPTransport:
                         ctx.read_stream_writer,
                     )
 
+    async def _handle_batch_post_request(
+        self,
+        client: httpx.AsyncClient,
+        session_messages: list[SessionMessage],
+        read_stream_writer: StreamWriter,
+    ) -> None:
+        """POST several messages as one JSON-RPC batch and route the responses."""
+        headers = self._prepare_request_headers(self.request_headers)
+        messages = [session_message.message for session_message in session_messages]
+        pending = {message.root.id for message in messages if isinstance(message.root, JSONRPCRequest)}
+
+        async def fail_pending(error: ErrorData) -> None:
+            # Each request gets exactly one error, so the fallback below finds nothing left to fail
+            while pending:
+                request_id = pending.pop()
+                await read_stream_writer.send(
+                    SessionMessage(JSONRPCMessage(JSONRPCError(jsonrpc="2.0", id=request_id, error=error)))
+                )
+
+        async def route(message: JSONRPCMessage) -> None:
+            if isinstance(message.root, JSONRPCResponse | JSONRPCError):
+                pending.discard(message.root.id)
+            await read_stream_writer.send(SessionMessage(message))
+
+        try:
+            async with client.stream(
+                "POST",
+                self.url,
+                content=self.codec.encode_messages(messages),
+                headers=headers,
+            ) as response:
+                if response.status_code == 202:
+                    return
+                if response.status_code == 404:
+                    await fail_pending(ErrorData(code=INVALID_REQUEST, message="Session terminated"))
+                    return
+                if response.is_error:
+                    await fail_pending(await self._error_from_response(response))
+                    return
+
+                content_type = response.headers.get(CONTENT_TYPE, "").lower()
+                if content_type.startswith(JSON):
+                    for message in self.codec.decode_messages(await response.aread()):
+                        await route(message)
+                elif content_type.startswith(SSE):
+                    async for sse in EventSource(response).aiter_sse():
+                        if sse.event == "message":
+                            await route(self.codec.decode_message(sse.data))
+                        if not pending:
+                            break
+                else:
+                    await self._handle_unexpected_content_type(content_type, read_stream_writer)
+        except Exception as exc:
+            logger.exception("Error handling batch response")
+            await read_stream_writer.send(exc)
+        finally:
+            if pending:
+                await fail_pending(ErrorData(code=INTERNAL_ERROR, message="No response received for batched request"))
+
+    async def _error_from_response(self, response: httpx.Response) -> ErrorData:
+        """The JSON-RPC error of a failed HTTP response, taken from its body if the server sent one."""
+        try:
+            message = self.codec.decode_message(await response.aread())
+        except Exception:
+            message = None
+        if message is not None and isinstance(message.root, JSONRPCError):
+            return message.root.error
+        code = INVALID_REQUEST if response.status_code < 500 else INTERNAL_ERROR
+        return ErrorData(code=code, message=f"HTTP {response.status_code} {response.reason_phrase}")
+
     async def _handle_json_response(
         self,
         response: httpx.Response,
@@ -302,7 +379,7 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = JSONRPCMessage.model_validate_json(content)
+            message = self.codec.decode_message(content)
 
             # Extract protocol version from initialization response
             if is_initialization:
@@ -373,6 +450,19 @@ class StreamableHTTPTransport:
         tg: TaskGroup,
     ) -> None:
         """Handle writing requests to the server."""
+        # Batched requests held back until their whole batch has been written
+        pending_batches: dict[RequestBatch, list[SessionMessage]] = {}
+
+        def send_batch(batch: RequestBatch) -> None:
+            batch_messages = pending_batches.pop(batch, None)
+            if batch_messages:
+                tg.start_soon(self._handle_batch_post_request, client, batch_messages, read_stream_writer)
+
+        async def send_batch_later(batch: RequestBatch) -> None:
+            # Sends what there is of a batch whose other requests never came
+            await anyio.sleep(batch.max_delay)
+            send_batch(batch)
+
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
@@ -386,6 +476,17 @@ class StreamableHTTPTransport:
                     # Check if this is a resumption request
                     is_resumption = bool(metadata and metadata.resumption_token)
 
+                    # Batches were removed from the protocol in 2025-06-18
+                    batching = self.protocol_version in BATCH_PROTOCOL_VERSIONS
+                    if metadata and metadata.batch and batching and not is_resumption:
+                        if metadata.batch not in pending_batches:
+                            pending_batches[metadata.batch] = []
+                            tg.start_soon(send_batch_later, metadata.batch)
+                        pending_batches[metadata.batch].append(session_message)
+                        if len(pending_batches[metadata.batch]) >= metadata.batch.size:
+                            send_batch(metadata.batch)
+                        continue
+
                     logger.debug(f"Sending client message: {message}")
 
                     # Handle initialized notification
@@ -450,6 +551,7 @@ async def streamablehttp_client(
     terminate_on_close: bool = True,
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
+    codec: JSONCodec | JSONCodecName | None = None,
 ) -> AsyncGenerator[
     tuple[
         MemoryObjectReceiveStream[SessionMessage | Exception],
@@ -463,6 +565,7 @@ async def streamablehttp_client(
 
     `sse_read_timeout` determines how long (in seconds) the client will wait for a new
     event before disconnecting. All other HTTP operations are controlled by `timeout`.
+    `codec` selects the JSON codec used for messages (pydantic-core by default).
 
     Yields:
         Tuple containing:
@@ -470,7 +573,7 @@ async def streamablehttp_client(
             - write_stream: Stream for sending messages to the server
             - get_session_id_callback: Function to retrieve the current session ID
     """
-    transport = StreamableHTTPTransport(url, headers, timeout, sse_read_timeout, auth)
+    transport = StreamableHTTPTransport(url, headers, timeout, sse_read_timeout, auth, codec)
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
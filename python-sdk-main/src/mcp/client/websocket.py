@@ -1,4 +1,3 @@
-import json
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -9,7 +8,7 @@ from pydantic import ValidationError
 from websockets.asyncio.client import connect as ws_connect
 from websockets.typing import Subprotocol
 
-import mcp.types as types
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -18,6 +17,7 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def websocket_client(
     url: str,
+    codec: JSONCodec | JSONCodecName | None = None,
 ) -> AsyncGenerator[
     tuple[MemoryObjectReceiveStream[SessionMessage | Exception], MemoryObjectSendStream[SessionMessage]],
     None,
@@ -32,7 +32,10 @@ async def websocket_client(
       JSONRPCMessage objects or Exception objects (when validation fails).
     - write_stream: Write JSONRPCMessage objects to this stream to send them
       over the WebSocket to the server.
+
+    `codec` selects the JSON codec used for messages (pydantic-core by default).
     """
+    json_codec = get_json_codec(codec)
 
     # Create two in-memory streams:
     # - One for incoming messages (read_stream, written by ws_reader)
@@ -56,7 +59,7 @@ async def websocket_client(
             async with read_stream_writer:
                 async for raw_text in ws:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(raw_text)
+                        message = json_codec.decode_message(raw_text)
                         session_message = SessionMessage(message)
                         await read_stream_writer.send(session_message)
                     except ValidationError as exc:
@@ -70,9 +73,7 @@ async def websocket_client(
             """
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    # Convert to a dict, then to JSON
-                    msg_dict = session_message.message.model_dump(by_alias=True, mode="json", exclude_none=True)
-                    await ws.send(json.dumps(msg_dict))
+                    await ws.send(json_codec.encode_message(session_message.message))
 
         async with anyio.create_task_group() as tg:
             # Start reader and writer tasks
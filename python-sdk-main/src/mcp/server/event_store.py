@@ -0,0 +1,249 @@
+"""
+Persistent event store for resumable Streamable HTTP streams.
+
+`SQLiteEventStore` keeps events in a SQLite database so that clients can resume
+their streams after a server restart:
+
+- event IDs are zero-padded sequence numbers, so they sort in the order events were stored
+- replay looks up the last event by primary key and reads the rest of its stream through
+  a (stream, sequence) index, so its cost does not grow with the size of the history
+- writes are committed in batches, bounding how often the database is synced to disk,
+  and pending writes are committed `commit_interval` seconds after they are stored
+- events older than `max_age` seconds, or beyond the newest `max_events`, are deleted
+  periodically and the freed pages returned to the file system
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
+from mcp.types import JSONRPCMessage
+
+logger = logging.getLogger(__name__)
+
+_EVENT_ID_WIDTH = 20
+_REPLAY_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_stream ON events (stream_id, seq);
+CREATE INDEX IF NOT EXISTS events_by_age ON events (created_at);
+"""
+
+
+class SQLiteEventStore(EventStore):
+    """EventStore backed by a SQLite database file.
+
+    Stored events are committed when `commit_every` events are pending, or when an
+    event is stored `commit_interval` seconds or more after the last commit. While
+    `run()` runs, events still pending are also committed `commit_interval` seconds
+    after they were stored, so the last events of a burst do not wait for the next one.
+    StreamableHTTPSessionManager runs the store and closes it, which commits what is
+    left, when it shuts down. Used on its own, run `run()` in a task group and call
+    `flush()` or `close()`; events not yet committed are lost if the process dies. The
+    store can also be used as an async context manager, which closes it on exit.
+
+    Args:
+        path: Database file, created if it does not exist (":memory:" for a non-persistent store)
+        max_age: Seconds to keep events for (None to keep them regardless of age)
+        max_events: Number of most recent events to keep (None for no limit)
+        commit_every: Number of pending events that triggers a commit
+        commit_interval: Seconds after a commit from which the next stored event is committed,
+            and after which `run()` commits events still pending
+        compaction_interval: Minimum seconds between two retention passes
+        codec: JSON codec used to store messages (pydantic-core by default)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_age: float | None = None,
+        max_events: int | None = None,
+        commit_every: int = 100,
+        commit_interval: float = 0.05,
+        compaction_interval: float = 60.0,
+        codec: JSONCodec | JSONCodecName | None = None,
+    ):
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        if commit_every < 1:
+            raise ValueError("commit_every must be at least 1")
+
+        self.path = str(path)
+        self.max_age = max_age
+        self.max_events = max_events
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self.compaction_interval = compaction_interval
+        self.codec = get_json_codec(codec)
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock = anyio.Lock()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._last_compaction = time.monotonic()
+        self._stored: anyio.Event | None = None
+
+    async def __aenter__(self) -> "SQLiteEventStore":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """Store an event and return its sortable ID."""
+        data = self.codec.encode_message(message)
+        async with self._lock:
+            event_id = await anyio.to_thread.run_sync(self._store_event, stream_id, data)
+        if self._pending and self._stored is not None:
+            self._stored.set()
+        return event_id
+
+    async def replay_events_after(
+        self,
+        last_event_id: EventId,
+        send_callback: EventCallback,
+    ) -> StreamId | None:
+        """Replay the events stored on the stream of `last_event_id` after it."""
+        try:
+            last_seq = int(last_event_id)
+        except ValueError:
+            logger.warning(f"Event ID {last_event_id} is not a valid event ID")
+            return None
+
+        async with self._lock:
+            stream_id = await anyio.to_thread.run_sync(self._stream_of, last_seq)
+        if stream_id is None:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        # Read in pages so a long history is never loaded at once
+        while True:
+            async with self._lock:
+                rows = await anyio.to_thread.run_sync(self._events_after, stream_id, last_seq)
+            for seq, data in rows:
+                await send_callback(EventMessage(self.codec.decode_message(data), _format_event_id(seq)))
+                last_seq = seq
+            if len(rows) < _REPLAY_PAGE_SIZE:
+                return stream_id
+
+    async def run(self) -> None:
+        """Commit pending events `commit_interval` seconds after they are stored, until cancelled."""
+        while True:
+            self._stored = anyio.Event()
+            if not self._pending:
+                await self._stored.wait()
+            await anyio.sleep(self.commit_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Commit all stored events to disk."""
+        async with self._lock:
+            await anyio.to_thread.run_sync(self._commit)
+
+    async def compact(self) -> None:
+        """Delete events outside the retention limits and release the freed space."""
+        async with self._lock:
+            await anyio.to_thread.run_sync(self._compact)
+
+    async def close(self) -> None:
+        """Commit pending events and close the database."""
+        async with self._lock:
+            if self._connection is not None:
+                await anyio.to_thread.run_sync(self._close)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # Used from worker threads, one at a time under self._lock
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            # auto_vacuum only takes effect before the first table is created
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = FULL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _store_event(self, stream_id: StreamId, data: str) -> EventId:
+        connection = self._connect()
+        if self._pending == 0:
+            connection.execute("BEGIN")
+        cursor = connection.execute(
+            "INSERT INTO events (stream_id, created_at, message) VALUES (?, ?, ?)",
+            (stream_id, time.time(), data),
+        )
+        self._pending += 1
+        seq = cursor.lastrowid
+        assert seq is not None
+
+        now = time.monotonic()
+        if self._pending >= self.commit_every or now - self._last_commit >= self.commit_interval:
+            self._commit()
+            if now - self._last_compaction >= self.compaction_interval:
+                self._compact()
+        return _format_event_id(seq)
+
+    def _stream_of(self, seq: int) -> StreamId | None:
+        row = self._connect().execute("SELECT stream_id FROM events WHERE seq = ?", (seq,)).fetchone()
+        return row[0] if row else None
+
+    def _events_after(self, stream_id: StreamId, seq: int) -> list[tuple[int, str]]:
+        return (
+            self._connect()
+            .execute(
+                "SELECT seq, message FROM events WHERE stream_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (stream_id, seq, _REPLAY_PAGE_SIZE),
+            )
+            .fetchall()
+        )
+
+    def _commit(self) -> None:
+        if self._pending and self._connection is not None:
+            self._connection.execute("COMMIT")
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def _compact(self) -> None:
+        self._commit()
+        self._last_compaction = time.monotonic()
+        if self.max_age is None and self.max_events is None:
+            return
+
+        connection = self._connect()
+        deleted = 0
+        if self.max_age is not None:
+            cursor = connection.execute("DELETE FROM events WHERE created_at < ?", (time.time() - self.max_age,))
+            deleted += cursor.rowcount
+        if self.max_events is not None:
+            cursor = connection.execute(
+                "DELETE FROM events WHERE seq <= (SELECT seq FROM events ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (self.max_events,),
+            )
+            deleted += cursor.rowcount
+        if deleted:
+            connection.execute("PRAGMA incremental_vacuum").fetchall()
+            logger.debug(f"Compacted event store: deleted {deleted} events")
+
+    def _close(self) -> None:
+        self._commit()
+        assert self._connection is not None
+        self._connection.close()
+        self._connection = None
+
+
+def _format_event_id(seq: int) -> EventId:
+    return str(seq).zfill(_EVENT_ID_WIDTH)
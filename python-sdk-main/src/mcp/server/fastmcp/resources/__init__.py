@@ -1,5 +1,6 @@
 from .base import Resource
 from .resource_manager import ResourceManager
+from .subscriptions import SubscriptionManager
 from .templates import ResourceTemplate
 from .types import (
     BinaryResource,
@@ -20,4 +21,5 @@ __all__ = [
     "DirectoryResource",
     "ResourceTemplate",
     "ResourceManager",
+    "SubscriptionManager",
 ]
@@ -8,7 +8,8 @@ from typing import TYPE_CHECKING, Any
 from pydantic import AnyUrl
 
 from mcp.server.fastmcp.resources.base import Resource
-from mcp.server.fastmcp.resources.templates import ResourceTemplate
+from mcp.server.fastmcp.resources.templates import ResourceTemplate, ResourceTemplateRouter
+from mcp.server.fastmcp.utilities.execution import SyncExecutor
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.types import Annotations, Icon
 
@@ -23,9 +24,10 @@ logger = get_logger(__name__)
 class ResourceManager:
     """Manages FastMCP resources."""
 
-    def __init__(self, warn_on_duplicate_resources: bool = True):
+    def __init__(self, warn_on_duplicate_resources: bool = True, *, executor: SyncExecutor | None = None):
+        self.executor = executor or SyncExecutor()
         self._resources: dict[str, Resource] = {}
-        self._templates: dict[str, ResourceTemplate] = {}
+        self._templates = ResourceTemplateRouter()
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
 
     def add_resource(self, resource: Resource) -> Resource:
@@ -79,6 +81,15 @@ class ResourceManager:
         self._templates[template.uri_template] = template
         return template
 
+    def get_template(self, uri_template: str) -> ResourceTemplate | None:
+        """Get a template by its URI template."""
+        return self._templates.get(uri_template)
+
+    def has_resource(self, uri: AnyUrl | str) -> bool:
+        """Check whether a URI names a resource or matches a template, without creating the resource."""
+        uri_str = str(uri)
+        return uri_str in self._resources or self._templates.match(uri_str) is not None
+
     async def get_resource(
         self,
         uri: AnyUrl | str,
@@ -93,12 +104,12 @@ class ResourceManager:
             return resource
 
         # Then check templates
-        for template in self._templates.values():
-            if params := template.matches(uri_str):
-                try:
-                    return await template.create_resource(uri_str, params, context=context)
-                except Exception as e:
-                    raise ValueError(f"Error creating resource from template: {e}")
+        if match := self._templates.match(uri_str):
+            template, params = match
+            try:
+                return await template.create_resource(uri_str, params, context=context, executor=self.executor)
+            except Exception as e:
+                raise ValueError(f"Error creating resource from template: {e}")
 
         raise ValueError(f"Unknown resource: {uri}")
 
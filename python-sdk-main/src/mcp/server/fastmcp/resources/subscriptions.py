@@ -0,0 +1,73 @@
+"""Resource subscriptions and the fan-out of resource updates."""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Iterable
+
+from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.session import ServerSession
+
+logger = get_logger(__name__)
+
+
+class SubscriptionManager:
+    """Sessions subscribed to resource URIs.
+
+    Updates are only sent to the sessions subscribed to the updated URI. Each
+    session sends its updates `debounce` seconds after the first one, so a
+    burst of updates to a URI reaches each subscriber as a single notification.
+
+    Sessions are held weakly: one that ends without unsubscribing is forgotten
+    once it is garbage collected, or when sending it an update fails.
+    """
+
+    def __init__(self, debounce: float = 0.0):
+        if debounce < 0:
+            raise ValueError("debounce must not be negative")
+        self.debounce = debounce
+        self._subscribers: dict[str, weakref.WeakSet[ServerSession]] = {}
+
+    def subscribe(self, uri: str, session: ServerSession) -> None:
+        """Subscribe a session to updates of a URI."""
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+
+    def unsubscribe(self, uri: str, session: ServerSession) -> None:
+        """Unsubscribe a session from updates of a URI."""
+        sessions = self._subscribers.get(uri)
+        if sessions is None:
+            return
+        sessions.discard(session)
+        if not sessions:
+            del self._subscribers[uri]
+
+    def subscribers(self, uri: str) -> set[ServerSession]:
+        """Get the sessions subscribed to a URI."""
+        return set(self._subscribers.get(uri, ()))
+
+    def subscribed_uris(self) -> list[str]:
+        """List the URIs with at least one subscribed session."""
+        return [uri for uri, sessions in self._subscribers.items() if sessions]
+
+    def notify(self, uris: Iterable[str]) -> int:
+        """Queue a resource updated notification of each URI for the sessions subscribed to it.
+
+        Returns:
+            The number of notifications queued
+        """
+        queued = 0
+        for uri in uris:
+            sessions = self._subscribers.get(uri)
+            if not sessions:
+                continue
+            for session in list(sessions):
+                try:
+                    session.queue_resource_updated(uri, self.debounce)
+                except RuntimeError:
+                    logger.debug("Dropping the subscription of a closed session", extra={"uri": uri})
+                    sessions.discard(session)
+                else:
+                    queued += 1
+            if not sessions:
+                del self._subscribers[uri]
+        return queued
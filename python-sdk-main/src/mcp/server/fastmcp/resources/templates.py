@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, MutableMapping
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, validate_call
 
 from mcp.server.fastmcp.resources.types import FunctionResource, Resource
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.fastmcp.utilities.execution import SyncExecutor
 from mcp.server.fastmcp.utilities.func_metadata import func_metadata
 from mcp.types import Annotations, Icon
 
@@ -81,9 +83,7 @@ class ResourceTemplate(BaseModel):
 
     def matches(self, uri: str) -> dict[str, Any] | None:
         """Check if URI matches template and extract parameters."""
-        # Convert template to regex pattern
-        pattern = self.uri_template.replace("{", "(?P<").replace("}", ">[^/]+)")
-        match = re.match(f"^{pattern}$", uri)
+        match = _compile_uri_template(self.uri_template).fullmatch(uri)
         if match:
             return match.groupdict()
         return None
@@ -93,14 +93,23 @@ class ResourceTemplate(BaseModel):
         uri: str,
         params: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
+        executor: SyncExecutor | None = None,
     ) -> Resource:
-        """Create a resource from the template with the given parameters."""
+        """Create a resource from the template with the given parameters.
+
+        Synchronous template functions are run on `executor` when one is given. The
+        validating wrapper around the function cannot be pickled, so a process-pool
+        executor runs template functions in its thread pool instead.
+        """
         try:
             # Add context to params if needed
             params = inject_context(self.fn, params, context, self.context_kwarg)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**params)
+            if executor is not None and not inspect.iscoroutinefunction(self.fn):
+                result = await executor.run(self.fn, params, mode="thread" if executor.mode == "process" else None)
+            else:
+                result = self.fn(**params)
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -116,3 +125,83 @@ class ResourceTemplate(BaseModel):
             )
         except Exception as e:
             raise ValueError(f"Error creating resource from template: {e}")
+
+
+@functools.cache
+def _compile_uri_template(uri_template: str) -> re.Pattern[str]:
+    """Compile a URI template to a regex in which each {param} matches one path segment."""
+    parts = re.split(r"\{([^{}]+)\}", uri_template)
+    # Even parts are literal text, odd parts are parameter names
+    pattern = "".join(f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part) for index, part in enumerate(parts))
+    return re.compile(pattern)
+
+
+class _PrefixNode:
+    __slots__ = ("children", "templates")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.templates: list[str] = []
+
+
+class ResourceTemplateRouter(MutableMapping[str, ResourceTemplate]):
+    """Templates keyed by URI template, indexed for matching URIs against them.
+
+    Templates are indexed in a trie by the literal text before their first parameter,
+    so matching a URI only tries the templates whose literal prefix the URI starts
+    with. When several templates match, the one registered first wins.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[str, ResourceTemplate] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._root = _PrefixNode()
+
+    def __getitem__(self, uri_template: str) -> ResourceTemplate:
+        return self._templates[uri_template]
+
+    def __setitem__(self, uri_template: str, template: ResourceTemplate) -> None:
+        if uri_template not in self._templates:
+            self._order[uri_template] = self._next_order
+            self._next_order += 1
+            self._node(uri_template, create=True).templates.append(uri_template)
+        self._templates[uri_template] = template
+
+    def __delitem__(self, uri_template: str) -> None:
+        del self._templates[uri_template]
+        del self._order[uri_template]
+        self._node(uri_template, create=False).templates.remove(uri_template)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._templates)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def match(self, uri: str) -> tuple[ResourceTemplate, dict[str, Any]] | None:
+        """Find the template matching `uri` and the parameters extracted from it."""
+        candidates = list(self._root.templates)
+        node = self._root
+        for char in uri:
+            next_node = node.children.get(char)
+            if next_node is None:
+                break
+            node = next_node
+            candidates.extend(node.templates)
+
+        candidates.sort(key=self._order.__getitem__)
+        for uri_template in candidates:
+            template = self._templates[uri_template]
+            if params := template.matches(uri):
+                return template, params
+        return None
+
+    def _node(self, uri_template: str, create: bool) -> _PrefixNode:
+        node = self._root
+        for char in uri_template.split("{", 1)[0]:
+            if create:
+                node = node.children.setdefault(char, _PrefixNode())
+            else:
+                node = node.children[char]
+        return node
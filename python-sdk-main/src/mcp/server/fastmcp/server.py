@@ -2,6 +2,7 @@
 
 from __future__ import annotations as _annotations
 
+import functools
 import inspect
 import re
 from collections.abc import (
@@ -46,22 +47,26 @@ from mcp.server.elicitation import (
 )
 from mcp.server.fastmcp.exceptions import ResourceError
 from mcp.server.fastmcp.prompts import Prompt, PromptManager
-from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager
-from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager, SubscriptionManager
+from mcp.server.fastmcp.tools import CachePolicy, Tool, ToolManager, ToolResultCache
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.utilities.execution import ExecutionMode, SyncExecutor
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.server.instrumentation import Instrumentation
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.lowlevel.server import lifespan as default_lifespan
-from mcp.server.session import ServerSession, ServerSessionT
+from mcp.server.session import LogRateLimit, ServerSession, ServerSessionT
 from mcp.server.sse import SseServerTransport
-from mcp.server.stdio import stdio_server
+from mcp.server.stdio import StdioMode, stdio_server
 from mcp.server.streamable_http import EventStore
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.shared.context import LifespanContextT, RequestContext, RequestT
-from mcp.types import Annotations, AnyFunction, ContentBlock, GetPromptResult, Icon, ToolAnnotations
+from mcp.shared.json_codec import JSONCodecName
+from mcp.shared.session import ProgressReporter, ProgressThrottle
+from mcp.types import Annotations, AnyFunction, ContentBlock, GetPromptResult, Icon, LoggingLevel, ToolAnnotations
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from mcp.types import Resource as MCPResource
@@ -98,20 +103,39 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     message_path: str
     streamable_http_path: str
 
+    # transport settings
+    json_codec: JSONCodecName
+    """JSON codec used by the stdio, SSE and StreamableHTTP transports for messages."""
+    stdio_mode: StdioMode
+    """How the stdio transport accesses stdin and stdout: worker threads, or non-blocking I/O on the event loop."""
+
     # StreamableHTTP settings
     json_response: bool
     stateless_http: bool
     """Define if the server should create a new transport per request."""
+    session_idle_timeout: float | None
+    """Seconds a stateful session may stay idle before it is evicted (None keeps idle sessions)."""
+    max_sessions: int | None
+    """Maximum number of stateful sessions; the least recently used idle session is evicted beyond it."""
 
     # resource settings
     warn_on_duplicate_resources: bool
 
+    resource_update_debounce: float
+    """Seconds to collect resource updates before notifying the sessions subscribed to them."""
+
     # tool settings
     warn_on_duplicate_tools: bool
 
     # prompt settings
     warn_on_duplicate_prompts: bool
 
+    # sync function execution settings
+    sync_execution: ExecutionMode
+    """Where synchronous tools and resource templates run: inline, in a thread pool or in a process pool."""
+    max_sync_workers: int
+    """Maximum number of synchronous functions running concurrently in each pool."""
+
     # TODO(Marcelo): Investigate if this is used. If it is, it's probably a good idea to remove it.
     dependencies: list[str]
     """A list of dependencies to install in the server environment."""
@@ -124,6 +148,12 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     # Transport security settings (DNS rebinding protection)
     transport_security: TransportSecuritySettings | None
 
+    log_rate_limit: LogRateLimit | None
+    """Limit on the log messages sent to a client for each request."""
+
+    progress_throttle: ProgressThrottle | None
+    """Coalescing of the progress notifications tools report through their context."""
+
 
 def lifespan_wrapper(
     app: FastMCP[LifespanResultT],
@@ -159,15 +189,25 @@ class FastMCP(Generic[LifespanResultT]):
         sse_path: str = "/sse",
         message_path: str = "/messages/",
         streamable_http_path: str = "/mcp",
+        json_codec: JSONCodecName = "pydantic",
+        stdio_mode: StdioMode = "thread",
         json_response: bool = False,
         stateless_http: bool = False,
+        session_idle_timeout: float | None = None,
+        max_sessions: int | None = None,
         warn_on_duplicate_resources: bool = True,
+        resource_update_debounce: float = 0.05,
         warn_on_duplicate_tools: bool = True,
         warn_on_duplicate_prompts: bool = True,
+        sync_execution: ExecutionMode = "inline",
+        max_sync_workers: int = 40,
         dependencies: Collection[str] = (),
         lifespan: (Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None) = None,
         auth: AuthSettings | None = None,
         transport_security: TransportSecuritySettings | None = None,
+        log_rate_limit: LogRateLimit | None = None,
+        progress_throttle: ProgressThrottle | None = None,
+        instrumentation: Instrumentation | None = None,
     ):
         self.settings = Settings(
             debug=debug,
@@ -178,15 +218,24 @@ class FastMCP(Generic[LifespanResultT]):
             sse_path=sse_path,
             message_path=message_path,
             streamable_http_path=streamable_http_path,
+            json_codec=json_codec,
+            stdio_mode=stdio_mode,
             json_response=json_response,
             stateless_http=stateless_http,
+            session_idle_timeout=session_idle_timeout,
+            max_sessions=max_sessions,
             warn_on_duplicate_resources=warn_on_duplicate_resources,
+            resource_update_debounce=resource_update_debounce,
             warn_on_duplicate_tools=warn_on_duplicate_tools,
             warn_on_duplicate_prompts=warn_on_duplicate_prompts,
+            sync_execution=sync_execution,
+            max_sync_workers=max_sync_workers,
             dependencies=list(dependencies),
             lifespan=lifespan,
             auth=auth,
             transport_security=transport_security,
+            log_rate_limit=log_rate_limit,
+            progress_throttle=progress_throttle,
         )
 
         self._mcp_server = MCPServer(
@@ -197,9 +246,20 @@ class FastMCP(Generic[LifespanResultT]):
             # TODO(Marcelo): It seems there's a type mismatch between the lifespan type from an FastMCP and Server.
             # We need to create a Lifespan type that is a generic on the server type, like Starlette does.
             lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),  # type: ignore
+            log_rate_limit=self.settings.log_rate_limit,
+            instrumentation=instrumentation,
         )
-        self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
-        self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
+        self._sync_executor = SyncExecutor(self.settings.sync_execution, self.settings.max_sync_workers)
+        self._tool_manager = ToolManager(
+            tools=tools,
+            warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools,
+            executor=self._sync_executor,
+        )
+        self._resource_manager = ResourceManager(
+            warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources,
+            executor=self._sync_executor,
+        )
+        self._subscriptions = SubscriptionManager(debounce=self.settings.resource_update_debounce)
         self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
         # Validate auth configuration
         if self.settings.auth is not None:
@@ -243,6 +303,14 @@ class FastMCP(Generic[LifespanResultT]):
     def icons(self) -> list[Icon] | None:
         return self._mcp_server.icons
 
+    @property
+    def sync_executor(self) -> SyncExecutor:
+        """Get the executor that runs synchronous tools and resource templates.
+
+        Its statistics() report running, queued and completed calls per worker pool.
+        """
+        return self._sync_executor
+
     @property
     def session_manager(self) -> StreamableHTTPSessionManager:
         """Get the StreamableHTTP session manager.
@@ -297,6 +365,16 @@ class FastMCP(Generic[LifespanResultT]):
         self._mcp_server.list_prompts()(self.list_prompts)
         self._mcp_server.get_prompt()(self.get_prompt)
         self._mcp_server.list_resource_templates()(self.list_resource_templates)
+        self._mcp_server.subscribe_resource()(self.subscribe_resource)
+        self._mcp_server.unsubscribe_resource()(self.unsubscribe_resource)
+        self._mcp_server.set_logging_level()(self.set_logging_level)
+
+    async def set_logging_level(self, level: LoggingLevel) -> None:
+        """Set the minimum level of log messages sent to the client.
+
+        The session records the level itself and drops log messages below it.
+        """
+        logger.debug("Client set log level to %s", level)
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
@@ -324,12 +402,15 @@ class FastMCP(Generic[LifespanResultT]):
             request_context = self._mcp_server.request_context
         except LookupError:
             request_context = None
-        return Context(request_context=request_context, fastmcp=self)
+        return Context(request_context=request_context, fastmcp=self, progress_throttle=self.settings.progress_throttle)
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[ContentBlock] | dict[str, Any]:
         """Call a tool by name with arguments."""
         context = self.get_context()
-        return await self._tool_manager.call_tool(name, arguments, context=context, convert_result=True)
+        try:
+            return await self._tool_manager.call_tool(name, arguments, context=context, convert_result=True)
+        finally:
+            await context.flush_progress()
 
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
@@ -378,6 +459,39 @@ class FastMCP(Generic[LifespanResultT]):
             logger.exception(f"Error reading resource {uri}")
             raise ResourceError(str(e))
 
+    async def subscribe_resource(self, uri: AnyUrl | str) -> None:
+        """Subscribe the requesting session to updates of a resource.
+
+        The URI can be that of a resource or one matching a resource template.
+        """
+        if not self._resource_manager.has_resource(uri):
+            raise ResourceError(f"Unknown resource: {uri}")
+        self._subscriptions.subscribe(str(uri), self.get_context().session)
+
+    async def unsubscribe_resource(self, uri: AnyUrl | str) -> None:
+        """Unsubscribe the requesting session from updates of a resource."""
+        self._subscriptions.unsubscribe(str(uri), self.get_context().session)
+
+    async def notify_resource_updated(self, uri: AnyUrl | str) -> int:
+        """Notify the sessions subscribed to a resource that it changed.
+
+        Passing the URI template of a resource template notifies the subscribers of
+        every URI matching it. Notifications are sent in the background after the
+        server's resource_update_debounce, so that a burst of updates to the same
+        resource reaches each subscriber once.
+
+        Returns:
+            The number of notifications queued
+        """
+        template = self._resource_manager.get_template(str(uri))
+        if template is not None:
+            return self._subscriptions.notify(
+                subscribed
+                for subscribed in self._subscriptions.subscribed_uris()
+                if template.matches(subscribed) is not None
+            )
+        return self._subscriptions.notify([str(AnyUrl(uri)) if isinstance(uri, str) else str(uri)])
+
     def add_tool(
         self,
         fn: AnyFunction,
@@ -388,6 +502,8 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        execution: ExecutionMode | None = None,
+        cache: CachePolicy | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -404,6 +520,10 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            execution: Where to run the tool if it is synchronous ("inline", "thread" or "process")
+                - If None, uses the server's sync_execution setting
+            cache: Optional CachePolicy to cache the tool's results by arguments; the tool must be
+                annotated with readOnlyHint or idempotentHint and must not take a Context
         """
         self._tool_manager.add_tool(
             fn,
@@ -414,6 +534,8 @@ class FastMCP(Generic[LifespanResultT]):
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            execution=execution,
+            cache=cache,
         )
 
     def remove_tool(self, name: str) -> None:
@@ -427,6 +549,19 @@ class FastMCP(Generic[LifespanResultT]):
         """
         self._tool_manager.remove_tool(name)
 
+    def get_tool_cache(self, name: str) -> ToolResultCache | None:
+        """Get the result cache of a tool, with its hit metrics, if it caches its results."""
+        return self._tool_manager.get_result_cache(name)
+
+    def invalidate_tool_cache(self, name: str | None = None, arguments: dict[str, Any] | None = None) -> None:
+        """Drop cached results, for example after a tool changed the data that others read.
+
+        Args:
+            name: The tool whose results to drop, or None for every tool
+            arguments: Only drop the result for these arguments
+        """
+        self._tool_manager.invalidate_cache(name, arguments)
+
     def tool(
         self,
         name: str | None = None,
@@ -436,6 +571,8 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        execution: ExecutionMode | None = None,
+        cache: CachePolicy | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a tool.
 
@@ -452,6 +589,10 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            execution: Where to run the tool if it is synchronous ("inline", "thread" or "process")
+                - If None, uses the server's sync_execution setting
+            cache: Optional CachePolicy to cache the tool's results by arguments; the tool must be
+                annotated with readOnlyHint or idempotentHint and must not take a Context
 
         Example:
             @server.tool()
@@ -467,6 +608,14 @@ class FastMCP(Generic[LifespanResultT]):
             async def async_tool(x: int, context: Context) -> str:
                 await context.report_progress(50, 100)
                 return str(x)
+
+            @server.tool(execution="process")
+            def cpu_bound_tool(n: int) -> int:
+                return sum(i * i for i in range(n))
+
+            @server.tool(annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy(ttl=60))
+            def lookup(key: str) -> str:
+                return database[key]
         """
         # Check if user passed function directly instead of calling decorator
         if callable(name):
@@ -484,6 +633,8 @@ class FastMCP(Generic[LifespanResultT]):
                 icons=icons,
                 meta=meta,
                 structured_output=structured_output,
+                execution=execution,
+                cache=cache,
             )
             return fn
 
@@ -728,7 +879,10 @@ class FastMCP(Generic[LifespanResultT]):
 
     async def run_stdio_async(self) -> None:
         """Run the server using stdio transport."""
-        async with stdio_server() as (read_stream, write_stream):
+        async with stdio_server(codec=self.settings.json_codec, mode=self.settings.stdio_mode) as (
+            read_stream,
+            write_stream,
+        ):
             await self._mcp_server.run(
                 read_stream,
                 write_stream,
@@ -808,6 +962,8 @@ class FastMCP(Generic[LifespanResultT]):
         sse = SseServerTransport(
             normalized_message_endpoint,
             security_settings=self.settings.transport_security,
+            codec=self.settings.json_codec,
+            instrumentation=self._mcp_server.instrumentation,
         )
 
         async def handle_sse(scope: Scope, receive: Receive, send: Send):
@@ -935,6 +1091,9 @@ class FastMCP(Generic[LifespanResultT]):
                 json_response=self.settings.json_response,
                 stateless=self.settings.stateless_http,  # Use the stateless setting
                 security_settings=self.settings.transport_security,
+                session_idle_timeout=self.settings.session_idle_timeout,
+                max_sessions=self.settings.max_sessions,
+                json_codec=self.settings.json_codec,
             )
 
         # Create the ASGI handler
@@ -1106,17 +1265,22 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
 
     _request_context: RequestContext[ServerSessionT, LifespanContextT, RequestT] | None
     _fastmcp: FastMCP | None
+    _progress_throttle: ProgressThrottle | None
+    _progress_reporter: ProgressReporter | None
 
     def __init__(
         self,
         *,
         request_context: (RequestContext[ServerSessionT, LifespanContextT, RequestT] | None) = None,
         fastmcp: FastMCP | None = None,
+        progress_throttle: ProgressThrottle | None = None,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
         self._request_context = request_context
         self._fastmcp = fastmcp
+        self._progress_throttle = progress_throttle
+        self._progress_reporter = None
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -1141,12 +1305,27 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
             progress: Current progress value e.g. 24
             total: Optional total value e.g. 100
             message: Optional message e.g. Starting render...
+
+        With a progress throttle (the server's `progress_throttle` setting), updates
+        are coalesced; an update held back by the throttle is sent when the tool returns.
         """
+        if self._progress_reporter is not None:
+            await self._progress_reporter(progress, total, message)
+            return
+
         progress_token = self.request_context.meta.progressToken if self.request_context.meta else None
 
         if progress_token is None:
             return
 
+        if self._progress_throttle is not None:
+            self._progress_reporter = ProgressReporter(
+                functools.partial(self.request_context.session.send_progress_notification, progress_token),
+                self._progress_throttle,
+            )
+            await self._progress_reporter(progress, total, message)
+            return
+
         await self.request_context.session.send_progress_notification(
             progress_token=progress_token,
             progress=progress,
@@ -1154,6 +1333,11 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
             message=message,
         )
 
+    async def flush_progress(self) -> None:
+        """Send the progress update held back by the progress throttle, if there is one."""
+        if self._progress_reporter is not None:
+            await self._progress_reporter.flush()
+
     async def read_resource(self, uri: str | AnyUrl) -> Iterable[ReadResourceContents]:
         """Read a resource by URI.
 
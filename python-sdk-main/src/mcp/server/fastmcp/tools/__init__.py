@@ -1,4 +1,5 @@
 from .base import Tool
+from .result_cache import CachePolicy, ToolResultCache
 from .tool_manager import ToolManager
 
-__all__ = ["Tool", "ToolManager"]
+__all__ = ["Tool", "ToolManager", "CachePolicy", "ToolResultCache"]
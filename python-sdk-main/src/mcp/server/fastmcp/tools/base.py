@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.utilities.execution import ExecutionMode, SyncExecutor
 from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
 from mcp.types import Icon, ToolAnnotations
 
@@ -35,6 +36,9 @@ class Tool(BaseModel):
     annotations: ToolAnnotations | None = Field(None, description="Optional annotations for the tool")
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this tool")
     meta: dict[str, Any] | None = Field(default=None, description="Optional metadata for this tool")
+    execution: ExecutionMode | None = Field(
+        default=None, description="Where to run the tool if it is synchronous (defaults to the server setting)"
+    )
 
     @cached_property
     def output_schema(self) -> dict[str, Any] | None:
@@ -52,6 +56,7 @@ class Tool(BaseModel):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        execution: ExecutionMode | None = None,
     ) -> Tool:
         """Create a Tool from a function."""
         func_name = name or fn.__name__
@@ -84,6 +89,7 @@ class Tool(BaseModel):
             annotations=annotations,
             icons=icons,
             meta=meta,
+            execution=execution,
         )
 
     async def run(
@@ -91,6 +97,7 @@ class Tool(BaseModel):
         arguments: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
         convert_result: bool = False,
+        executor: SyncExecutor | None = None,
     ) -> Any:
         """Run the tool with arguments."""
         try:
@@ -99,6 +106,8 @@ class Tool(BaseModel):
                 self.is_async,
                 arguments,
                 {self.context_kwarg: context} if self.context_kwarg is not None else None,
+                executor=executor,
+                execution=self.execution,
             )
 
             if convert_result:
@@ -108,6 +117,13 @@ class Tool(BaseModel):
         except Exception as e:
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
 
+    def convert_result(self, result: Any) -> Any:
+        """Convert a result returned by `run` without `convert_result`."""
+        try:
+            return self.fn_metadata.convert_result(result)
+        except Exception as e:
+            raise ToolError(f"Error executing tool {self.name}: {e}") from e
+
 
 def _is_async_callable(obj: Any) -> bool:
     while isinstance(obj, functools.partial):
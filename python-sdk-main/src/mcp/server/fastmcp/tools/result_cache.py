@@ -0,0 +1,156 @@
+"""Caching of the results of read-only and idempotent tools."""
+
+from __future__ import annotations as _annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long and how many results of a tool to cache.
+
+    Only tools annotated as read-only or idempotent can be cached, since a
+    cached call does not run the tool.
+    """
+
+    ttl: float | None = 300.0
+    """Seconds a result stays cached, or None to keep it until evicted or invalidated."""
+    max_entries: int = 128
+    """Results kept for distinct arguments before the least recently used is evicted."""
+
+    def __post_init__(self) -> None:
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class _Flight:
+    """A call whose result identical concurrent calls wait for."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.completed = False
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class ToolResultCache:
+    """Results of one tool, keyed by its validated arguments.
+
+    Concurrent calls with the same arguments share a single execution of the
+    tool. Errors are shared with the calls waiting for them but not cached.
+    """
+
+    def __init__(self, policy: CachePolicy, fn_metadata: FuncMetadata) -> None:
+        self.policy = policy
+        self._fn_metadata = fn_metadata
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, _Flight] = {}
+        # Bumped on invalidation, so that a result computed meanwhile is not stored.
+        self._generation = 0
+        self.hits = 0
+        """Calls answered from the cache."""
+        self.coalesced = 0
+        """Calls that waited for an identical call in flight instead of running the tool."""
+        self.misses = 0
+        """Calls that ran the tool."""
+        self.evictions = 0
+        """Results dropped to stay within max_entries."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls that did not run the tool."""
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, arguments: dict[str, Any]) -> str | None:
+        """Canonical form of the arguments after validation, or None if they cannot be keyed.
+
+        Arguments that fail validation are left for the call to report.
+        """
+        try:
+            model = self._fn_metadata.arg_model.model_validate(self._fn_metadata.pre_parse_json(arguments))
+            return json.dumps(model.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        except Exception:
+            return None
+
+    def invalidate(self, arguments: dict[str, Any] | None = None) -> None:
+        """Drops the result for the given arguments, or every result.
+
+        Calls made afterwards do not wait for calls already in flight either.
+        """
+        self._generation += 1
+        if arguments is None:
+            self._entries.clear()
+            self._in_flight.clear()
+        elif (key := self.key(arguments)) is not None:
+            self._entries.pop(key, None)
+            self._in_flight.pop(key, None)
+
+    async def get_or_call(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the cached result for `key`, or calls the tool once for all concurrent callers."""
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+                del self._entries[key]
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                break
+            await flight.done.wait()
+            if flight.error is not None:
+                self.coalesced += 1
+                raise flight.error
+            if flight.completed:
+                self.coalesced += 1
+                return flight.value
+            # The call was cancelled, so make it again.
+
+        self.misses += 1
+        flight = self._in_flight[key] = _Flight()
+        generation = self._generation
+        try:
+            flight.value = await call()
+            flight.completed = True
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+            flight.done.set()
+
+        if generation == self._generation:
+            self._store(key, flight.value)
+        return flight.value
+
+    def _store(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.policy.ttl if self.policy.ttl is not None else float("inf")
+        self._entries[key] = _Entry(value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.policy.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
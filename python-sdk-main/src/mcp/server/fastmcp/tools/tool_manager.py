@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.tools.result_cache import CachePolicy, ToolResultCache
+from mcp.server.fastmcp.utilities.execution import ExecutionMode, SyncExecutor
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.shared.context import LifespanContextT, RequestT
 from mcp.types import Icon, ToolAnnotations
@@ -24,8 +26,11 @@ class ToolManager:
         warn_on_duplicate_tools: bool = True,
         *,
         tools: list[Tool] | None = None,
+        executor: SyncExecutor | None = None,
     ):
+        self.executor = executor or SyncExecutor()
         self._tools: dict[str, Tool] = {}
+        self._result_caches: dict[str, ToolResultCache] = {}
         if tools is not None:
             for tool in tools:
                 if warn_on_duplicate_tools and tool.name in self._tools:
@@ -52,8 +57,14 @@ class ToolManager:
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        execution: ExecutionMode | None = None,
+        cache: CachePolicy | None = None,
     ) -> Tool:
         """Add a tool to the server."""
+        if cache is not None and not (
+            annotations is not None and (annotations.readOnlyHint or annotations.idempotentHint)
+        ):
+            raise ValueError("Only tools annotated with readOnlyHint or idempotentHint can cache their results")
         tool = Tool.from_function(
             fn,
             name=name,
@@ -63,13 +74,21 @@ class ToolManager:
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            execution=execution,
         )
+        if not tool.is_async and tool.context_kwarg is not None and (execution or self.executor.mode) == "process":
+            raise ValueError(f"Tool {tool.name} takes a Context and cannot run in a process pool")
+        if cache is not None and tool.context_kwarg is not None:
+            # Results are keyed by arguments only, so one session's result would be served to all
+            raise ValueError(f"Tool {tool.name} takes a Context and cannot cache its results")
         existing = self._tools.get(tool.name)
         if existing:
             if self.warn_on_duplicate_tools:
                 logger.warning(f"Tool already exists: {tool.name}")
             return existing
         self._tools[tool.name] = tool
+        if cache is not None:
+            self._result_caches[tool.name] = ToolResultCache(cache, tool.fn_metadata)
         return tool
 
     def remove_tool(self, name: str) -> None:
@@ -77,6 +96,22 @@ class ToolManager:
         if name not in self._tools:
             raise ToolError(f"Unknown tool: {name}")
         del self._tools[name]
+        self._result_caches.pop(name, None)
+
+    def get_result_cache(self, name: str) -> ToolResultCache | None:
+        """Get the result cache of a tool, if it caches its results."""
+        return self._result_caches.get(name)
+
+    def invalidate_cache(self, name: str | None = None, arguments: dict[str, Any] | None = None) -> None:
+        """Drop cached results of a tool, or of every tool.
+
+        With `arguments`, only the result for those arguments is dropped.
+        """
+        if name is None:
+            for cache in self._result_caches.values():
+                cache.invalidate(arguments)
+        elif (cache := self._result_caches.get(name)) is not None:
+            cache.invalidate(arguments)
 
     async def call_tool(
         self,
@@ -90,4 +125,11 @@ class ToolManager:
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
-        return await tool.run(arguments, context=context, convert_result=convert_result)
+        cache = self._result_caches.get(name)
+        key = cache.key(arguments) if cache is not None else None
+        if cache is None or key is None:
+            return await tool.run(arguments, context=context, convert_result=convert_result, executor=self.executor)
+
+        # Cache what the function returned, and convert it for each call.
+        result = await cache.get_or_call(key, lambda: tool.run(arguments, context=context, executor=self.executor))
+        return tool.convert_result(result) if convert_result else result
@@ -0,0 +1,103 @@
+"""Execution of synchronous functions off the event loop."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import anyio
+import anyio.to_process
+import anyio.to_thread
+
+ExecutionMode = Literal["inline", "thread", "process"]
+"""Where a synchronous tool or resource function runs.
+
+- "inline": call the function directly on the event loop (blocks other requests)
+- "thread": run the function in a worker thread
+- "process": run the function in a worker process (arguments and return value must be picklable)
+"""
+
+
+@dataclass(frozen=True)
+class SyncExecutorStatistics:
+    """Point-in-time statistics for one worker pool of a SyncExecutor."""
+
+    max_workers: int
+    """Maximum number of functions that may run concurrently in the pool."""
+    running: int
+    """Number of functions currently running in the pool."""
+    queued: int
+    """Number of calls waiting for a free worker."""
+    completed: int
+    """Number of calls that have finished, successfully or not."""
+
+
+class SyncExecutor:
+    """Runs synchronous functions inline, in a thread pool or in a process pool.
+
+    Each pool is bounded by `max_workers`; calls beyond that limit wait for a free
+    worker and are reported as queued in `statistics()`.
+    """
+
+    def __init__(self, mode: ExecutionMode = "inline", max_workers: int = 40):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.mode: ExecutionMode = mode
+        self.max_workers = max_workers
+        self._limiters: dict[ExecutionMode, anyio.CapacityLimiter] = {}
+        self._completed: dict[ExecutionMode, int] = {"thread": 0, "process": 0}
+
+    def _get_limiter(self, mode: ExecutionMode) -> anyio.CapacityLimiter:
+        # Created lazily so the limiter belongs to the running async backend
+        limiter = self._limiters.get(mode)
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(self.max_workers)
+            self._limiters[mode] = limiter
+        return limiter
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        kwargs: dict[str, Any],
+        mode: ExecutionMode | None = None,
+    ) -> Any:
+        """Call a synchronous function with keyword arguments.
+
+        Args:
+            fn: The synchronous function to call
+            kwargs: Keyword arguments to call the function with
+            mode: Execution mode for this call (defaults to the executor's mode)
+
+        Returns:
+            The function's return value
+        """
+        mode = mode or self.mode
+        if mode == "inline":
+            return fn(**kwargs)
+
+        call = functools.partial(fn, **kwargs)
+        limiter = self._get_limiter(mode)
+        try:
+            if mode == "thread":
+                return await anyio.to_thread.run_sync(call, limiter=limiter)
+            else:
+                return await anyio.to_process.run_sync(call, cancellable=True, limiter=limiter)
+        finally:
+            self._completed[mode] += 1
+
+    def statistics(self) -> dict[str, SyncExecutorStatistics]:
+        """Return statistics for the thread and process pools."""
+        stats: dict[str, SyncExecutorStatistics] = {}
+        pools: tuple[ExecutionMode, ...] = ("thread", "process")
+        for mode in pools:
+            limiter = self._limiters.get(mode)
+            limiter_stats = limiter.statistics() if limiter is not None else None
+            stats[mode] = SyncExecutorStatistics(
+                max_workers=self.max_workers,
+                running=limiter_stats.borrowed_tokens if limiter_stats else 0,
+                queued=limiter_stats.tasks_waiting if limiter_stats else 0,
+                completed=self._completed[mode],
+            )
+        return stats
@@ -21,6 +21,7 @@ from pydantic.json_schema import GenerateJsonSchema, JsonSchemaWarningKind
 from pydantic_core import PydanticUndefined
 
 from mcp.server.fastmcp.exceptions import InvalidSignature
+from mcp.server.fastmcp.utilities.execution import ExecutionMode, SyncExecutor
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.server.fastmcp.utilities.types import Audio, Image
 from mcp.types import CallToolResult, ContentBlock, TextContent
@@ -72,11 +73,16 @@ class FuncMetadata(BaseModel):
         fn_is_async: bool,
         arguments_to_validate: dict[str, Any],
         arguments_to_pass_directly: dict[str, Any] | None,
+        executor: SyncExecutor | None = None,
+        execution: ExecutionMode | None = None,
     ) -> Any:
         """Call the given function with arguments validated and injected.
 
         Arguments are first attempted to be parsed from JSON, then validated against
         the argument model, before being passed to the function.
+
+        Synchronous functions are handed to `executor` when one is given, using
+        `execution` to override its default mode; otherwise they are called directly.
         """
         arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
         arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
@@ -86,6 +92,8 @@ class FuncMetadata(BaseModel):
 
         if fn_is_async:
             return await fn(**arguments_parsed_dict)
+        elif executor is not None:
+            return await executor.run(fn, arguments_parsed_dict, mode=execution)
         else:
             return fn(**arguments_parsed_dict)
 
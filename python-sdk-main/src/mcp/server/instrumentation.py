@@ -0,0 +1,249 @@
+"""
+Metrics and tracing hooks for the server's message path.
+
+An `Instrumentation` passed to `Server(instrumentation=...)` (or FastMCP) is told how
+long each stage of handling a message took:
+
+- "decode": parsing and validating an incoming HTTP request body (HTTP transports)
+- "queue": waiting for the request dispatcher to start a request (low-level server)
+- "handler": running the request handler (low-level server)
+- "encode": turning a handler's result into a JSON-RPC response (ServerSession)
+- "write": serializing and writing a response to the HTTP client (HTTP transports)
+
+It is also told when requests start and finish, so it can track requests in flight.
+Without an instrumentation the server does not even read the clock.
+
+Two implementations are included: `PrometheusInstrumentation`, which keeps metrics in
+process and renders them in the Prometheus text format, and
+`OpenTelemetryInstrumentation`, which reports to the OpenTelemetry API (requires the
+optional `opentelemetry-api` package).
+"""
+
+import importlib
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from mcp.types import JSONRPCMessage
+
+Stage = Literal["decode", "queue", "handler", "encode", "write"]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Histogram bucket upper bounds in seconds."""
+
+
+class Instrumentation:
+    """Receives measurements from the server's message path.
+
+    Methods are called on the event loop and must not block. This base class ignores
+    every measurement; subclasses override the methods they need.
+    """
+
+    def record_stage(self, stage: Stage, duration: float, method: str | None = None) -> None:
+        """Record how long a stage took, in seconds.
+
+        `method` is the JSON-RPC method when it is known at that stage.
+        """
+
+    def request_started(self, method: str) -> None:
+        """Called when the server starts handling a request."""
+
+    def request_finished(self, method: str, duration: float, error: bool) -> None:
+        """Called when the server has handled a request.
+
+        `duration` is the time since `request_started`, in seconds, and `error` tells
+        whether the request was answered with an error.
+        """
+
+
+def message_method(message: JSONRPCMessage) -> str | None:
+    """Return the method of a request or notification, or None for responses and errors."""
+    return getattr(message.root, "method", None)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Keeps metrics in process and renders them in the Prometheus text format.
+
+    Expose them from a FastMCP server with a custom route, for example:
+
+    ```python
+    metrics = PrometheusInstrumentation()
+    mcp = FastMCP("server", instrumentation=metrics)
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def serve_metrics(request: Request) -> Response:
+        return PlainTextResponse(metrics.render(), media_type=PrometheusInstrumentation.CONTENT_TYPE)
+    ```
+
+    Args:
+        namespace: Prefix of the metric names
+        buckets: Histogram bucket upper bounds in seconds
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, namespace: str = "mcp_server", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be strictly increasing")
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self._stages: dict[tuple[Stage, str | None], _Histogram] = {}
+        self._requests: dict[str, _Histogram] = {}
+        self._outcomes: dict[tuple[str, bool], int] = {}
+        self._in_flight: dict[str, int] = {}
+
+    def _observe(self, histogram: _Histogram | None, duration: float) -> _Histogram:
+        if histogram is None:
+            histogram = _Histogram(len(self.buckets))
+        histogram.counts[bisect_left(self.buckets, duration)] += 1
+        histogram.sum += duration
+        return histogram
+
+    def record_stage(self, stage: Stage, duration: float, method: str | None = None) -> None:
+        key = (stage, method)
+        self._stages[key] = self._observe(self._stages.get(key), duration)
+
+    def request_started(self, method: str) -> None:
+        self._in_flight[method] = self._in_flight.get(method, 0) + 1
+
+    def request_finished(self, method: str, duration: float, error: bool) -> None:
+        self._in_flight[method] -= 1
+        self._requests[method] = self._observe(self._requests.get(method), duration)
+        self._outcomes[method, error] = self._outcomes.get((method, error), 0) + 1
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        name = f"{self.namespace}_stage_duration_seconds"
+        lines.append(f"# HELP {name} Time spent in each stage of handling messages.")
+        lines.append(f"# TYPE {name} histogram")
+        for (stage, method), histogram in sorted(self._stages.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            labels = {"stage": stage} if method is None else {"stage": stage, "method": method}
+            self._render_histogram(lines, name, labels, histogram)
+
+        name = f"{self.namespace}_request_duration_seconds"
+        lines.append(f"# HELP {name} Time from the start of a request to its response.")
+        lines.append(f"# TYPE {name} histogram")
+        for method, histogram in sorted(self._requests.items()):
+            self._render_histogram(lines, name, {"method": method}, histogram)
+
+        name = f"{self.namespace}_requests_total"
+        lines.append(f"# HELP {name} Requests handled, by outcome.")
+        lines.append(f"# TYPE {name} counter")
+        for (method, error), count in sorted(self._outcomes.items()):
+            outcome = "error" if error else "ok"
+            lines.append(f"{name}{_labels({'method': method, 'outcome': outcome})} {count}")
+
+        name = f"{self.namespace}_requests_in_flight"
+        lines.append(f"# HELP {name} Requests currently being handled.")
+        lines.append(f"# TYPE {name} gauge")
+        for method, count in sorted(self._in_flight.items()):
+            lines.append(f"{name}{_labels({'method': method})} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(self, lines: list[str], name: str, labels: dict[str, str], histogram: _Histogram) -> None:
+        cumulative = 0
+        for bound, count in zip(self.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(bound)})} {cumulative}")
+        cumulative += histogram.counts[-1]
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports metrics and request spans through the OpenTelemetry API.
+
+    Measurements go to the configured (or given) meter and tracer providers, so any
+    OpenTelemetry SDK reader or exporter set up in the process receives them:
+
+    - histogram `mcp.server.stage.duration` (s), with `mcp.stage` and `rpc.method` attributes
+    - histogram `mcp.server.request.duration` (s), with `rpc.method` and `error` attributes
+    - up-down counter `mcp.server.requests.in_flight`, with the `rpc.method` attribute
+    - a span per request, named after its method
+
+    Args:
+        meter_provider: Meter provider to use instead of the global one
+        tracer_provider: Tracer provider to use instead of the global one
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None):
+        try:
+            metrics: Any = importlib.import_module("opentelemetry.metrics")
+            self._trace: Any = importlib.import_module("opentelemetry.trace")
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetry instrumentation requires opentelemetry-api. "
+                "Install it with 'pip install opentelemetry-api'"
+            )
+
+        meter = metrics.get_meter("mcp.server", meter_provider=meter_provider)
+        self._stage_duration = meter.create_histogram(
+            "mcp.server.stage.duration", unit="s", description="Time spent in each stage of handling messages"
+        )
+        self._request_duration = meter.create_histogram(
+            "mcp.server.request.duration", unit="s", description="Time from the start of a request to its response"
+        )
+        self._in_flight = meter.create_up_down_counter(
+            "mcp.server.requests.in_flight", description="Requests currently being handled"
+        )
+        self._tracer = self._trace.get_tracer("mcp.server", tracer_provider=tracer_provider)
+
+    def record_stage(self, stage: Stage, duration: float, method: str | None = None) -> None:
+        attributes = {"mcp.stage": stage} if method is None else {"mcp.stage": stage, "rpc.method": method}
+        self._stage_duration.record(duration, attributes)
+
+    def request_started(self, method: str) -> None:
+        self._in_flight.add(1, {"rpc.method": method})
+
+    def request_finished(self, method: str, duration: float, error: bool) -> None:
+        self._in_flight.add(-1, {"rpc.method": method})
+        self._request_duration.record(duration, {"rpc.method": method, "error": error})
+
+        # The span is recorded after the fact, so handling a request costs no tracing work
+        end = time.time_ns()
+        span = self._tracer.start_span(
+            method,
+            kind=self._trace.SpanKind.SERVER,
+            attributes={"rpc.system": "jsonrpc", "rpc.method": method},
+            start_time=end - int(duration * 1e9),
+        )
+        if error:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=end)
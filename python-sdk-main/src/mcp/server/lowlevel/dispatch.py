@@ -0,0 +1,171 @@
+"""
+Bounded, prioritized dispatch of incoming requests.
+
+Without limits, `Server.run` starts a task for every request as soon as it arrives.
+A `RequestDispatcher` caps how many requests run at once, per session and across all
+sessions served by one `Server`. Requests over the cap wait in per-session queues
+and are started as running requests finish:
+
+- queued requests with a lower priority number start first
+- sessions with queued requests of the same priority take turns (round-robin)
+- a request that finds its session's queue full is rejected with a SERVER_BUSY error
+
+Requests of priority 0 (by default `ping`, `initialize` and `logging/setLevel`) are
+never queued or rejected, so liveness checks keep working under load.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from typing import Any
+
+from anyio.abc import TaskGroup
+
+DEFAULT_METHOD_PRIORITIES: dict[str, int] = {
+    "ping": 0,
+    "initialize": 0,
+    "logging/setLevel": 0,
+    "tools/list": 1,
+    "resources/list": 1,
+    "resources/templates/list": 1,
+    "prompts/list": 1,
+    "resources/subscribe": 1,
+    "resources/unsubscribe": 1,
+}
+"""Priority of each request method; methods not listed get DEFAULT_PRIORITY."""
+
+DEFAULT_PRIORITY = 2
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class SessionDispatchQueue:
+    """Requests of one session that are running or waiting to run."""
+
+    def __init__(self, task_group: TaskGroup):
+        self.task_group = task_group
+        self.in_flight = 0
+        self.pending: dict[int, deque[Job]] = {}
+        self.closed = False
+
+    @property
+    def queued(self) -> int:
+        return sum(len(jobs) for jobs in self.pending.values())
+
+    def next_priority(self) -> int | None:
+        """Return the most urgent priority with waiting requests, if any."""
+        priorities = [priority for priority, jobs in self.pending.items() if jobs]
+        return min(priorities) if priorities else None
+
+
+class RequestDispatcher:
+    """Limits concurrently running requests per session and across sessions.
+
+    Args:
+        max_in_flight: Maximum requests running at once across all sessions (None for no limit)
+        max_in_flight_per_session: Maximum requests running at once in one session (None for no limit)
+        max_queued_per_session: Maximum requests waiting in one session before new ones are rejected
+        method_priorities: Priority per request method, lower runs first (defaults to DEFAULT_METHOD_PRIORITIES)
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        max_in_flight_per_session: int | None = None,
+        max_queued_per_session: int = 100,
+        method_priorities: dict[str, int] | None = None,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_session = max_in_flight_per_session
+        self.max_queued_per_session = max_queued_per_session
+        self.method_priorities = DEFAULT_METHOD_PRIORITIES if method_priorities is None else method_priorities
+        self._sessions: deque[SessionDispatchQueue] = deque()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of limited requests currently running across all sessions."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting to run across all sessions."""
+        return sum(queue.queued for queue in self._sessions)
+
+    def priority(self, method: str) -> int:
+        return self.method_priorities.get(method, DEFAULT_PRIORITY)
+
+    @contextmanager
+    def session(self, task_group: TaskGroup) -> Generator[SessionDispatchQueue, None, None]:
+        """Register a session whose requests are started in `task_group`."""
+        queue = SessionDispatchQueue(task_group)
+        self._sessions.append(queue)
+        try:
+            yield queue
+        finally:
+            queue.closed = True
+            queue.pending.clear()
+            self._sessions.remove(queue)
+
+    def submit(self, queue: SessionDispatchQueue, method: str, job: Job) -> bool:
+        """Start a request now or queue it for later.
+
+        Returns:
+            False if the session's queue is full and the request was rejected
+        """
+        priority = self.priority(method)
+        if priority == 0:
+            queue.task_group.start_soon(job)
+            return True
+
+        if queue.next_priority() is None and self._has_capacity(queue):
+            self._start(queue, job)
+            return True
+
+        if queue.queued >= self.max_queued_per_session:
+            return False
+
+        queue.pending.setdefault(priority, deque()).append(job)
+        self._schedule()
+        return True
+
+    def _has_capacity(self, queue: SessionDispatchQueue) -> bool:
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return False
+        return self.max_in_flight_per_session is None or queue.in_flight < self.max_in_flight_per_session
+
+    def _start(self, queue: SessionDispatchQueue, job: Job) -> None:
+        queue.in_flight += 1
+        self._in_flight += 1
+        # Move the session to the back so other sessions get the next turn
+        self._sessions.remove(queue)
+        self._sessions.append(queue)
+
+        async def run() -> None:
+            try:
+                await job()
+            finally:
+                queue.in_flight -= 1
+                self._in_flight -= 1
+                self._schedule()
+
+        queue.task_group.start_soon(run)
+
+    def _schedule(self) -> None:
+        """Start queued requests while there is capacity, most urgent first and fair across sessions."""
+        while self.max_in_flight is None or self._in_flight < self.max_in_flight:
+            best: tuple[int, int] | None = None
+            for position, queue in enumerate(self._sessions):
+                priority = queue.next_priority()
+                if priority is None or queue.closed or not self._has_capacity(queue):
+                    continue
+                if best is None or priority < best[0]:
+                    best = (priority, position)
+            if best is None:
+                return
+
+            priority, position = best
+            queue = self._sessions[position]
+            self._start(queue, queue.pending[priority].popleft())
@@ -68,8 +68,10 @@ messages from the client.
 from __future__ import annotations as _annotations
 
 import contextvars
+import functools
 import json
 import logging
+import time
 import warnings
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
@@ -77,19 +79,23 @@ from typing import Any, Generic, TypeAlias, cast
 
 import anyio
 import jsonschema
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
 from pydantic import AnyUrl
 from typing_extensions import TypeVar
 
 import mcp.types as types
+from mcp.server.instrumentation import Instrumentation
+from mcp.server.lowlevel.dispatch import RequestDispatcher
 from mcp.server.lowlevel.func_inspection import create_call_wrapper
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.models import InitializationOptions
-from mcp.server.session import ServerSession
+from mcp.server.session import LogRateLimit, ServerSession
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.schema_validation import SchemaValidatorBackend, SchemaValidatorCache
 from mcp.shared.session import RequestResponder
+from mcp.shared.streams import StreamBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +148,10 @@ class Server(Generic[LifespanResultT, RequestT]):
             [Server[LifespanResultT, RequestT]],
             AbstractAsyncContextManager[LifespanResultT],
         ] = lifespan,
+        schema_validator_backend: SchemaValidatorBackend = "jsonschema",
+        request_dispatcher: RequestDispatcher | None = None,
+        log_rate_limit: LogRateLimit | None = None,
+        instrumentation: Instrumentation | None = None,
     ):
         self.name = name
         self.version = version
@@ -154,6 +164,14 @@ class Server(Generic[LifespanResultT, RequestT]):
         }
         self.notification_handlers: dict[type, Callable[..., Awaitable[None]]] = {}
         self._tool_cache: dict[str, types.Tool] = {}
+        self._input_validators = SchemaValidatorCache(schema_validator_backend)
+        self._output_validators = SchemaValidatorCache(schema_validator_backend)
+        # Shared by every session this server runs, so its limits apply process-wide
+        self.request_dispatcher = request_dispatcher or RequestDispatcher()
+        # Applied to the log message notifications of each session
+        self.log_rate_limit = log_rate_limit
+        # Measures the message path of every session and of the HTTP transports
+        self.instrumentation = instrumentation
         logger.debug("Initializing server %r", name)
 
     def create_initialization_options(
@@ -162,20 +180,9 @@ class Server(Generic[LifespanResultT, RequestT]):
         experimental_capabilities: dict[str, dict[str, Any]] | None = None,
     ) -> InitializationOptions:
         """Create initialization options from this server instance."""
-
-        def pkg_version(package: str) -> str:
-            try:
-                from importlib.metadata import version
-
-                return version(package)
-            except Exception:
-                pass
-
-            return "unknown"
-
         return InitializationOptions(
             server_name=self.name,
-            server_version=self.version if self.version else pkg_version("mcp"),
+            server_version=self.version if self.version else _pkg_version("mcp"),
             capabilities=self.get_capabilities(
                 notification_options or NotificationOptions(),
                 experimental_capabilities or {},
@@ -204,7 +211,8 @@ class Server(Generic[LifespanResultT, RequestT]):
         # Set resource capabilities if handler exists
         if types.ListResourcesRequest in self.request_handlers:
             resources_capability = types.ResourcesCapability(
-                subscribe=False, listChanged=notification_options.resources_changed
+                subscribe=types.SubscribeRequest in self.request_handlers,
+                listChanged=notification_options.resources_changed,
             )
 
         # Set tool capabilities if handler exists
@@ -423,11 +431,15 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # Refresh the tool cache with returned tools
                     for tool in result.tools:
                         self._tool_cache[tool.name] = tool
+                        self._input_validators.invalidate(tool.name)
+                        self._output_validators.invalidate(tool.name)
                     return types.ServerResult(result)
                 else:
                     # Old style returns list[Tool]
                     # Clear and refresh the entire tool cache
                     self._tool_cache.clear()
+                    self._input_validators.invalidate()
+                    self._output_validators.invalidate()
                     for tool in result:
                         self._tool_cache[tool.name] = tool
                     return types.ServerResult(types.ListToolsResult(tools=result))
@@ -494,7 +506,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # input validation
                     if validate_input and tool:
                         try:
-                            jsonschema.validate(instance=arguments, schema=tool.inputSchema)
+                            self._input_validators.validate(tool_name, arguments, tool.inputSchema)
                         except jsonschema.ValidationError as e:
                             return self._make_error_result(f"Input validation error: {e.message}")
 
@@ -528,7 +540,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                             )
                         else:
                             try:
-                                jsonschema.validate(instance=maybe_structured_content, schema=tool.outputSchema)
+                                self._output_validators.validate(tool_name, maybe_structured_content, tool.outputSchema)
                             except jsonschema.ValidationError as e:
                                 return self._make_error_result(f"Output validation error: {e.message}")
 
@@ -599,8 +611,8 @@ class Server(Generic[LifespanResultT, RequestT]):
 
     async def run(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        read_stream: ObjectReceiveStream[SessionMessage | Exception],
+        write_stream: ObjectSendStream[SessionMessage],
         initialization_options: InitializationOptions,
         # When False, exceptions are returned as messages to the client.
         # When True, exceptions are raised, which will cause the server to shut down
@@ -612,29 +624,97 @@ class Server(Generic[LifespanResultT, RequestT]):
         # the initialization lifecycle, but can do so with any available node
         # rather than requiring initialization for each connection.
         stateless: bool = False,
+        # Number of incoming messages the session buffers before the transport has to
+        # wait, or their StreamBuffer settings.
+        stream_buffer: StreamBuffer | int = 0,
+    ):
+        async with self.lifespan(self) as lifespan_context:
+            await self.run_session(
+                read_stream,
+                write_stream,
+                initialization_options,
+                lifespan_context,
+                raise_exceptions=raise_exceptions,
+                stateless=stateless,
+                stream_buffer=stream_buffer,
+            )
+
+    async def run_session(
+        self,
+        read_stream: ObjectReceiveStream[SessionMessage | Exception],
+        write_stream: ObjectSendStream[SessionMessage],
+        initialization_options: InitializationOptions,
+        lifespan_context: LifespanResultT,
+        raise_exceptions: bool = False,
+        stateless: bool = False,
+        stream_buffer: StreamBuffer | int = 0,
     ):
+        """Serve one session using a lifespan context that has already been entered.
+
+        `run` enters the server's lifespan for a single session. Transports that serve
+        many short-lived sessions, such as stateless streamable HTTP, enter the lifespan
+        once and call this for every session instead.
+        """
         async with AsyncExitStack() as stack:
-            lifespan_context = await stack.enter_async_context(self.lifespan(self))
             session = await stack.enter_async_context(
                 ServerSession(
                     read_stream,
                     write_stream,
                     initialization_options,
                     stateless=stateless,
+                    stream_buffer=stream_buffer,
+                    log_rate_limit=self.log_rate_limit,
+                    instrumentation=self.instrumentation,
                 )
             )
 
             async with anyio.create_task_group() as tg:
-                async for message in session.incoming_messages:
-                    logger.debug("Received message: %s", message)
-
-                    tg.start_soon(
-                        self._handle_message,
-                        message,
-                        session,
-                        lifespan_context,
-                        raise_exceptions,
-                    )
+                with self.request_dispatcher.session(tg) as dispatch_queue:
+                    async for message in session.incoming_messages:
+                        logger.debug("Received message: %s", message)
+
+                        if not isinstance(message, RequestResponder):
+                            tg.start_soon(
+                                self._handle_message,
+                                message,
+                                session,
+                                lifespan_context,
+                                raise_exceptions,
+                            )
+                            continue
+
+                        received_at = time.perf_counter() if self.instrumentation is not None else None
+                        accepted = self.request_dispatcher.submit(
+                            dispatch_queue,
+                            message.request.root.method,
+                            functools.partial(
+                                self._handle_dispatched_request,
+                                message,
+                                session,
+                                lifespan_context,
+                                raise_exceptions,
+                                received_at,
+                            ),
+                        )
+                        if not accepted:
+                            logger.warning("Rejecting request %s: server busy", message.request_id)
+                            with message:
+                                await message.respond(
+                                    types.ErrorData(code=types.SERVER_BUSY, message="Server busy, try again later")
+                                )
+
+    async def _handle_dispatched_request(
+        self,
+        responder: RequestResponder[types.ClientRequest, types.ServerResult],
+        session: ServerSession,
+        lifespan_context: LifespanResultT,
+        raise_exceptions: bool,
+        received_at: float | None,
+    ):
+        if responder.cancelled:
+            # Cancelled while queued by the dispatcher, and already answered
+            return
+        await self._handle_message(responder, session, lifespan_context, raise_exceptions, received_at)
 
     async def _handle_message(
         self,
@@ -642,12 +722,15 @@ class Server(Generic[LifespanResultT, RequestT]):
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool = False,
+        received_at: float | None = None,
     ):
         with warnings.catch_warnings(record=True) as w:
             match message:
                 case RequestResponder(request=types.ClientRequest(root=req)) as responder:
                     with responder:
-                        await self._handle_request(message, req, session, lifespan_context, raise_exceptions)
+                        await self._handle_request(
+                            message, req, session, lifespan_context, raise_exceptions, received_at
+                        )
                 case types.ClientNotification(root=notify):
                     await self._handle_notification(notify)
                 case Exception():
@@ -670,12 +753,43 @@ class Server(Generic[LifespanResultT, RequestT]):
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool,
+        received_at: float | None = None,
     ):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            await self._dispatch_request(message, req, session, lifespan_context, raise_exceptions)
+            return
+
+        method: str = req.method
+        started_at = time.perf_counter()
+        if received_at is not None:
+            instrumentation.record_stage("queue", started_at - received_at, method)
+        instrumentation.request_started(method)
+        response: types.ServerResult | types.ErrorData | None = None
+        try:
+            response = await self._dispatch_request(
+                message, req, session, lifespan_context, raise_exceptions, instrumentation
+            )
+        finally:
+            instrumentation.request_finished(
+                method, time.perf_counter() - started_at, error=not isinstance(response, types.ServerResult)
+            )
+
+    async def _dispatch_request(
+        self,
+        message: RequestResponder[types.ClientRequest, types.ServerResult],
+        req: Any,
+        session: ServerSession,
+        lifespan_context: LifespanResultT,
+        raise_exceptions: bool,
+        instrumentation: Instrumentation | None = None,
+    ) -> types.ServerResult | types.ErrorData | None:
         logger.info("Processing request of type %s", type(req).__name__)
         if handler := self.request_handlers.get(type(req)):  # type: ignore
             logger.debug("Dispatching request of type %s", type(req).__name__)
 
             token = None
+            handler_started_at = time.perf_counter() if instrumentation is not None else 0.0
             try:
                 # Extract request context from message metadata
                 request_data = None
@@ -701,7 +815,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     "Request %s cancelled - duplicate response suppressed",
                     message.request_id,
                 )
-                return
+                return None
             except Exception as err:
                 if raise_exceptions:
                     raise err
@@ -710,17 +824,19 @@ class Server(Generic[LifespanResultT, RequestT]):
                 # Reset the global state after we are done
                 if token is not None:
                     request_ctx.reset(token)
+                if instrumentation is not None:
+                    instrumentation.record_stage("handler", time.perf_counter() - handler_started_at, req.method)
 
             await message.respond(response)
         else:
-            await message.respond(
-                types.ErrorData(
-                    code=types.METHOD_NOT_FOUND,
-                    message="Method not found",
-                )
+            response = types.ErrorData(
+                code=types.METHOD_NOT_FOUND,
+                message="Method not found",
             )
+            await message.respond(response)
 
         logger.debug("Response sent")
+        return response
 
     async def _handle_notification(self, notify: Any):
         if handler := self.notification_handlers.get(type(notify)):  # type: ignore
@@ -732,5 +848,18 @@ class Server(Generic[LifespanResultT, RequestT]):
                 logger.exception("Uncaught exception in notification handler")
 
 
+@functools.cache
+def _pkg_version(package: str) -> str:
+    # importlib.metadata scans the installed distributions, so look each package up once
+    try:
+        from importlib.metadata import version
+
+        return version(package)
+    except Exception:
+        pass
+
+    return "unknown"
+
+
 async def _ping_handler(request: types.PingRequest) -> types.ServerResult:
     return types.ServerResult(types.EmptyResult())
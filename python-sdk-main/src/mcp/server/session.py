@@ -37,23 +37,57 @@ The ServerSession class is typically used internally by the Server class and sho
 be instantiated directly by users of the MCP framework.
 """
 
+import time
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, TypeVar
 
 import anyio
 import anyio.lowlevel
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
 from pydantic import AnyUrl
 
 import mcp.types as types
+from mcp.server.instrumentation import Instrumentation
 from mcp.server.models import InitializationOptions
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 from mcp.shared.session import (
     BaseSession,
     RequestResponder,
 )
+from mcp.shared.streams import BufferedReceiveStream, StreamBuffer, create_message_stream
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 
+_LOGGING_LEVEL_SEVERITY: dict[types.LoggingLevel, int] = {
+    "debug": 0,
+    "info": 1,
+    "notice": 2,
+    "warning": 3,
+    "error": 4,
+    "critical": 5,
+    "alert": 6,
+    "emergency": 7,
+}
+
+
+@dataclass(frozen=True)
+class LogRateLimit:
+    """Limit on the log message notifications a session sends.
+
+    At most `max_messages` log messages are sent for each request (and for messages
+    not related to a request) in every `period` seconds; further messages in the
+    same period are dropped.
+    """
+
+    max_messages: int
+    period: float = 1.0
+
+    def __post_init__(self):
+        if self.max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+        if self.period <= 0:
+            raise ValueError("period must be positive")
+
 
 class InitializationState(Enum):
     NotInitialized = 1
@@ -82,26 +116,56 @@ class ServerSession(
 
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        read_stream: ObjectReceiveStream[SessionMessage | Exception],
+        write_stream: ObjectSendStream[SessionMessage],
         init_options: InitializationOptions,
         stateless: bool = False,
+        stream_buffer: StreamBuffer | int = 0,
+        log_rate_limit: LogRateLimit | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         super().__init__(read_stream, write_stream, types.ClientRequest, types.ClientNotification)
         self._initialization_state = (
             InitializationState.Initialized if stateless else InitializationState.NotInitialized
         )
 
+        # Minimum severity of log messages sent, as requested with logging/setLevel
+        self._logging_level: types.LoggingLevel | None = None
+        self._min_log_severity = 0
+        self._log_rate_limit = log_rate_limit
+        self._log_window_start = 0.0
+        self._log_window_counts: dict[types.RequestId | None, int] = {}
+        self._log_messages_dropped = 0
+        self._instrumentation = instrumentation
+
+        # URIs of resource updates waiting to be sent, in the order they were queued
+        self._pending_resource_updates: dict[str, None] = {}
+        self._resource_updates_scheduled = False
+
         self._init_options = init_options
-        self._incoming_message_stream_writer, self._incoming_message_stream_reader = anyio.create_memory_object_stream[
+        self._incoming_message_stream_writer, self._incoming_message_stream_reader = create_message_stream[
             ServerRequestResponder
-        ](0)
+        ](stream_buffer)
         self._exit_stack.push_async_callback(lambda: self._incoming_message_stream_reader.aclose())
 
     @property
     def client_params(self) -> types.InitializeRequestParams | None:
         return self._client_params
 
+    @property
+    def logging_level(self) -> types.LoggingLevel | None:
+        """The minimum log level the client requested, or None if it has not set one."""
+        return self._logging_level
+
+    @property
+    def log_messages_dropped(self) -> int:
+        """Number of log messages dropped by the session's log rate limit."""
+        return self._log_messages_dropped
+
+    def is_log_level_enabled(self, level: types.LoggingLevel) -> bool:
+        """Check whether log messages of the given level are sent to the client."""
+        return _LOGGING_LEVEL_SEVERITY[level] >= self._min_log_severity
+
     def check_client_capability(self, capability: types.ClientCapabilities) -> bool:
         """Check if the client supports a specific capability."""
         if self._client_params is None:
@@ -167,6 +231,13 @@ class ServerSession(
             case types.PingRequest():
                 # Ping requests are allowed at any time
                 pass
+            case types.SetLevelRequest(params=params):
+                if self._initialization_state != InitializationState.Initialized:
+                    raise RuntimeError("Received request before initialization was complete")
+                # Recorded here so that log messages are filtered even when the server
+                # does not handle the request itself
+                self._logging_level = params.level
+                self._min_log_severity = _LOGGING_LEVEL_SEVERITY[params.level]
             case _:
                 if self._initialization_state != InitializationState.Initialized:
                     raise RuntimeError("Received request before initialization was complete")
@@ -188,7 +259,17 @@ class ServerSession(
         logger: str | None = None,
         related_request_id: types.RequestId | None = None,
     ) -> None:
-        """Send a log message notification."""
+        """Send a log message notification.
+
+        Messages below the level the client set with logging/setLevel, or over the
+        session's log rate limit, are dropped without being sent.
+        """
+        if _LOGGING_LEVEL_SEVERITY[level] < self._min_log_severity:
+            return
+        if self._log_rate_limit is not None and not self._log_rate_allowed(self._log_rate_limit, related_request_id):
+            self._log_messages_dropped += 1
+            return
+
         await self.send_notification(
             types.ServerNotification(
                 types.LoggingMessageNotification(
@@ -202,6 +283,20 @@ class ServerSession(
             related_request_id,
         )
 
+    def _log_rate_allowed(self, rate_limit: LogRateLimit, related_request_id: types.RequestId | None) -> bool:
+        # Fixed windows shared by all requests, so counts of finished requests are
+        # discarded when the next window starts
+        now = anyio.current_time()
+        if now - self._log_window_start >= rate_limit.period:
+            self._log_window_start = now
+            self._log_window_counts.clear()
+
+        count = self._log_window_counts.get(related_request_id, 0)
+        if count >= rate_limit.max_messages:
+            return False
+        self._log_window_counts[related_request_id] = count + 1
+        return True
+
     async def send_resource_updated(self, uri: AnyUrl) -> None:
         """Send a resource updated notification."""
         await self.send_notification(
@@ -212,6 +307,32 @@ class ServerSession(
             )
         )
 
+    def queue_resource_updated(self, uri: AnyUrl | str, delay: float = 0.0) -> None:
+        """Send a resource updated notification in the background after `delay` seconds.
+
+        Updates of the same URI queued before the notifications go out are sent
+        as one notification.
+
+        Raises:
+            RuntimeError: If the session is not running.
+        """
+        if not self._resource_updates_scheduled:
+            self._task_group.start_soon(self._send_resource_updates, delay)
+            self._resource_updates_scheduled = True
+        self._pending_resource_updates[str(uri)] = None
+
+    async def _send_resource_updates(self, delay: float) -> None:
+        await anyio.sleep(delay)
+        # Updates queued from here on are sent by the next batch
+        self._resource_updates_scheduled = False
+        uris, self._pending_resource_updates = self._pending_resource_updates, {}
+        try:
+            for uri in uris:
+                await self.send_resource_updated(AnyUrl(uri))
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            # The session closed before the updates went out, so no one is left to tell
+            pass
+
     async def create_message(
         self,
         messages: list[types.SamplingMessage],
@@ -324,11 +445,23 @@ class ServerSession(
         """Send a prompt list changed notification."""
         await self.send_notification(types.ServerNotification(types.PromptListChangedNotification()))
 
+    async def _send_response(self, request_id: types.RequestId, response: types.ServerResult | types.ErrorData) -> None:
+        if self._instrumentation is None:
+            await super()._send_response(request_id, response)
+            return
+
+        started_at = time.perf_counter()
+        session_message = self._response_message(request_id, response)
+        responder = self._in_flight.get(request_id)
+        method = responder.request.root.method if responder is not None else None
+        self._instrumentation.record_stage("encode", time.perf_counter() - started_at, method)
+        await self._write_stream.send(session_message)
+
     async def _handle_incoming(self, req: ServerRequestResponder) -> None:
         await self._incoming_message_stream_writer.send(req)
 
     @property
     def incoming_messages(
         self,
-    ) -> MemoryObjectReceiveStream[ServerRequestResponder]:
+    ) -> BufferedReceiveStream[ServerRequestResponder]:
         return self._incoming_message_stream_reader
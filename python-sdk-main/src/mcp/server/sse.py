@@ -38,25 +38,27 @@ See SseServerTransport class documentation for more details.
 """
 
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import quote
 from uuid import UUID, uuid4
 
 import anyio
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
-import mcp.types as types
+from mcp.server.instrumentation import Instrumentation, message_method
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.streams import BufferedReceiveStream, BufferedSendStream, StreamBuffer, create_message_stream
 
 logger = logging.getLogger(__name__)
 
@@ -74,10 +76,17 @@ class SseServerTransport:
     """
 
     _endpoint: str
-    _read_stream_writers: dict[UUID, MemoryObjectSendStream[SessionMessage | Exception]]
+    _read_stream_writers: dict[UUID, BufferedSendStream[SessionMessage | Exception]]
     _security: TransportSecurityMiddleware
 
-    def __init__(self, endpoint: str, security_settings: TransportSecuritySettings | None = None) -> None:
+    def __init__(
+        self,
+        endpoint: str,
+        security_settings: TransportSecuritySettings | None = None,
+        codec: JSONCodec | JSONCodecName | None = None,
+        stream_buffer: StreamBuffer | int = 0,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         """
         Creates a new SSE server transport, which will direct the client to POST
         messages to the relative path given.
@@ -86,6 +95,11 @@ class SseServerTransport:
             endpoint: A relative path where messages should be posted
                     (e.g., "/messages/").
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: JSON codec used for messages (pydantic-core by default).
+            stream_buffer: Number of messages the session's read and write streams
+                           buffer, or their StreamBuffer settings.
+            instrumentation: Optional instrumentation told how long decoding posted
+                             messages and writing messages to the SSE stream takes.
 
         Note:
             We use relative paths instead of full URLs for several reasons:
@@ -116,6 +130,9 @@ class SseServerTransport:
         self._endpoint = endpoint
         self._read_stream_writers = {}
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = get_json_codec(codec)
+        self._stream_buffer = stream_buffer
+        self._instrumentation = instrumentation
         logger.debug(f"SseServerTransport initialized with endpoint: {endpoint}")
 
     @asynccontextmanager
@@ -132,14 +149,14 @@ class SseServerTransport:
             raise ValueError("Request validation failed")
 
         logger.debug("Setting up SSE connection")
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
-        read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+        read_stream: BufferedReceiveStream[SessionMessage | Exception]
+        read_stream_writer: BufferedSendStream[SessionMessage | Exception]
 
-        write_stream: MemoryObjectSendStream[SessionMessage]
-        write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+        write_stream: BufferedSendStream[SessionMessage]
+        write_stream_reader: BufferedReceiveStream[SessionMessage]
 
-        read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
-        write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+        read_stream_writer, read_stream = create_message_stream[SessionMessage | Exception](self._stream_buffer)
+        write_stream, write_stream_reader = create_message_stream[SessionMessage](self._stream_buffer)
 
         session_id = uuid4()
         self._read_stream_writers[session_id] = read_stream_writer
@@ -170,12 +187,17 @@ class SseServerTransport:
 
                 async for session_message in write_stream_reader:
                     logger.debug(f"Sending message via SSE: {session_message}")
+                    started_at = time.perf_counter() if self._instrumentation is not None else 0.0
                     await sse_stream_writer.send(
                         {
                             "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
+                            "data": self._codec.encode_message(session_message.message),
                         }
                     )
+                    if self._instrumentation is not None:
+                        self._instrumentation.record_stage(
+                            "write", time.perf_counter() - started_at, message_method(session_message.message)
+                        )
 
         async with anyio.create_task_group() as tg:
 
@@ -230,9 +252,10 @@ class SseServerTransport:
         body = await request.body()
         logger.debug(f"Received JSON: {body}")
 
+        started_at = time.perf_counter() if self._instrumentation is not None else 0.0
         try:
-            message = types.JSONRPCMessage.model_validate_json(body)
-            logger.debug(f"Validated client message: {message}")
+            messages = self._codec.decode_messages(body)
+            logger.debug(f"Validated client messages: {messages}")
         except ValidationError as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
@@ -240,10 +263,16 @@ class SseServerTransport:
             await writer.send(err)
             return
 
+        if self._instrumentation is not None:
+            method = message_method(messages[0]) if len(messages) == 1 else None
+            self._instrumentation.record_stage("decode", time.perf_counter() - started_at, method)
+
         # Pass the ASGI scope for framework-agnostic access to request data
         metadata = ServerMessageMetadata(request_context=request)
-        session_message = SessionMessage(message, metadata=metadata)
-        logger.debug(f"Sending session message to writer: {session_message}")
         response = Response("Accepted", status_code=202)
         await response(scope, receive, send)
-        await writer.send(session_message)
+        # Responses to a batch are sent over the SSE stream one by one as they complete
+        for message in messages:
+            session_message = SessionMessage(message, metadata=metadata)
+            logger.debug(f"Sending session message to writer: {session_message}")
+            await writer.send(session_message)
@@ -18,71 +18,220 @@ Example usage:
 ```
 """
 
+import functools
+import os
+import stat
 import sys
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
 from contextlib import asynccontextmanager
 from io import TextIOWrapper
+from typing import Literal, TextIO
 
 import anyio
 import anyio.lowlevel
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
-import mcp.types as types
+from mcp.shared.framing import LineFramer
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import SessionMessage
+from mcp.shared.streams import BufferedReceiveStream, BufferedSendStream, StreamBuffer, create_message_stream
+from mcp.types import JSONRPCError, JSONRPCMessage, JSONRPCRequest, JSONRPCResponse, RequestId
+
+StdioMode = Literal["auto", "thread", "nonblocking"]
+"""How stdio_server reads from stdin and writes to stdout.
+
+- "thread": through file objects wrapped with `anyio.wrap_file`, so every read, write
+  and flush runs in a worker thread
+- "nonblocking": through the file descriptors, switched to non-blocking mode and
+  polled on the event loop (POSIX pipes and sockets only)
+- "auto": "nonblocking" when stdin and stdout support it, "thread" otherwise
+"""
+
+_READ_CHUNK_SIZE = 65536
 
 
 @asynccontextmanager
 async def stdio_server(
     stdin: anyio.AsyncFile[str] | None = None,
     stdout: anyio.AsyncFile[str] | None = None,
+    codec: JSONCodec | JSONCodecName | None = None,
+    stream_buffer: StreamBuffer | int = 0,
+    mode: StdioMode = "thread",
 ):
     """
     Server transport for stdio: this communicates with an MCP client by reading
     from the current process' stdin and writing to stdout.
+
+    `codec` selects the JSON codec used for messages (pydantic-core by default).
+    `stream_buffer` sets how many messages the read and write streams buffer.
+    `mode` selects how the process' stdin and stdout are accessed; it only applies
+    when `stdin` and `stdout` are not given. The default keeps the thread-based file
+    access; pass "nonblocking" or "auto" to opt into polling the file descriptors on
+    the event loop. Messages that are ready to be sent at
+    the same time are written to stdout together, and the responses to a JSON-RPC
+    batch are written as a single array once all of them are ready.
+
+    In non-blocking mode the process must not write to stdout itself (which would
+    corrupt the protocol stream anyway), as such writes may fail with BlockingIOError.
     """
+    json_codec = get_json_codec(codec)
+
+    nonblocking = False
+    if stdin is None and stdout is None and mode != "thread":
+        nonblocking = _supports_nonblocking(sys.stdin) and _supports_nonblocking(sys.stdout)
+        if mode == "nonblocking" and not nonblocking:
+            raise ValueError("Non-blocking stdio requires stdin and stdout to be POSIX pipes or sockets")
+
     # Purposely not using context managers for these, as we don't want to close
     # standard process handles. Encoding of stdin/stdout as text streams on
     # python is platform-dependent (Windows is particularly problematic), so we
     # re-wrap the underlying binary stream to ensure UTF-8.
-    if not stdin:
-        stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8"))
-    if not stdout:
-        stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+    if not nonblocking:
+        if not stdin:
+            stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8"))
+        if not stdout:
+            stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+
+    read_stream: BufferedReceiveStream[SessionMessage | Exception]
+    read_stream_writer: BufferedSendStream[SessionMessage | Exception]
 
-    read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
-    read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+    write_stream: BufferedSendStream[SessionMessage]
+    write_stream_reader: BufferedReceiveStream[SessionMessage]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    read_stream_writer, read_stream = create_message_stream[SessionMessage | Exception](stream_buffer)
+    write_stream, write_stream_reader = create_message_stream[SessionMessage](stream_buffer)
 
-    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
-    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batches = _BatchResponses(json_codec)
 
-    async def stdin_reader():
+    async def stdin_reader(lines: AsyncIterable[str | bytes]):
         try:
             async with read_stream_writer:
-                async for line in stdin:
+                async for line in lines:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(line)
+                        messages = json_codec.decode_messages(line)
                     except Exception as exc:
                         await read_stream_writer.send(exc)
                         continue
 
-                    session_message = SessionMessage(message)
-                    await read_stream_writer.send(session_message)
+                    if line.lstrip()[:1] in ("[", b"["):
+                        batches.add(messages)
+
+                    for message in messages:
+                        await read_stream_writer.send(SessionMessage(message))
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
-    async def stdout_writer():
+    async def stdout_writer(write: Callable[[str], Awaitable[None]]):
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await stdout.write(json + "\n")
-                    await stdout.flush()
+                    lines = [batches.encode(session_message.message)]
+                    # Write every message that is already waiting along with this one
+                    while True:
+                        try:
+                            waiting = write_stream_reader.receive_nowait()
+                        except (anyio.WouldBlock, anyio.EndOfStream):
+                            break
+                        lines.append(batches.encode(waiting.message))
+                    ready = [line for line in lines if line is not None]
+                    if ready:
+                        await write("\n".join(ready) + "\n")
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
-    async with anyio.create_task_group() as tg:
-        tg.start_soon(stdin_reader)
-        tg.start_soon(stdout_writer)
-        yield read_stream, write_stream
+    if not nonblocking:
+        assert stdin is not None and stdout is not None
+        text_stdout = stdout
+
+        async def write_text(data: str) -> None:
+            await text_stdout.write(data)
+            await text_stdout.flush()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(stdin_reader, stdin)
+            tg.start_soon(stdout_writer, write_text)
+            yield read_stream, write_stream
+        return
+
+    stdin_fd, stdout_fd = sys.stdin.fileno(), sys.stdout.fileno()
+    blocking = {fd: os.get_blocking(fd) for fd in (stdin_fd, stdout_fd)}
+    sys.stdout.flush()
+    try:
+        for fd in blocking:
+            os.set_blocking(fd, False)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(stdin_reader, _read_lines(stdin_fd))
+            tg.start_soon(stdout_writer, functools.partial(_write, stdout_fd))
+            yield read_stream, write_stream
+    finally:
+        # The file descriptions are shared with the parent process, restore their state
+        for fd, was_blocking in blocking.items():
+            os.set_blocking(fd, was_blocking)
+
+
+class _BatchResponses:
+    """Holds back the responses to JSON-RPC batches, so that each batch is answered with one array."""
+
+    def __init__(self, codec: JSONCodec) -> None:
+        self._codec = codec
+        # The responses of each batch still being answered, by request ID, in request order
+        self._pending: dict[RequestId, dict[RequestId, JSONRPCMessage | None]] = {}
+
+    def add(self, batch: list[JSONRPCMessage]) -> None:
+        responses: dict[RequestId, JSONRPCMessage | None] = {
+            message.root.id: None for message in batch if isinstance(message.root, JSONRPCRequest)
+        }
+        for request_id in responses:
+            self._pending[request_id] = responses
+
+    def encode(self, message: JSONRPCMessage) -> str | None:
+        """Encode `message`, or None if it is a response to a batch that is not complete yet."""
+        if not isinstance(message.root, JSONRPCResponse | JSONRPCError) or message.root.id not in self._pending:
+            return self._codec.encode_message(message)
+
+        responses = self._pending.pop(message.root.id)
+        responses[message.root.id] = message
+        completed = [response for response in responses.values() if response is not None]
+        if len(completed) < len(responses):
+            return None
+        return self._codec.encode_messages(completed)
+
+
+async def _read_lines(fd: int) -> AsyncGenerator[bytes, None]:
+    """Read newline-delimited lines from a non-blocking file descriptor until end of file."""
+    framer = LineFramer()
+    while True:
+        await anyio.wait_readable(fd)
+        try:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            break
+        for line in framer.feed(chunk):
+            assert isinstance(line, bytes)  # No size limit
+            yield line
+
+    line = framer.flush()
+    if line is not None:
+        yield line
+
+
+async def _write(fd: int, data: str) -> None:
+    """Write all of `data` to a non-blocking file descriptor."""
+    view = memoryview(data.encode())
+    while view:
+        try:
+            view = view[os.write(fd, view) :]
+        except BlockingIOError:
+            await anyio.wait_writable(fd)
+
+
+def _supports_nonblocking(file: TextIO) -> bool:
+    # anyio.wait_readable() only exists from anyio 4.7 and cannot poll pipes on Windows
+    if sys.platform == "win32" or not hasattr(anyio, "wait_readable"):
+        return False
+    try:
+        mode = os.fstat(file.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
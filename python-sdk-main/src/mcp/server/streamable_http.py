@@ -7,28 +7,31 @@ The transport handles bidirectional communication using HTTP requests and
 responses, with streaming support for long-running operations.
 """
 
-import json
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from http import HTTPStatus
+from typing import Any, cast
 
 import anyio
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
+from mcp.server.instrumentation import Instrumentation, Stage, message_method
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.streams import BufferedReceiveStream, BufferedSendStream, StreamBuffer, create_message_stream
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import (
     DEFAULT_NEGOTIATED_VERSION,
@@ -37,6 +40,7 @@ from mcp.types import (
     INVALID_REQUEST,
     PARSE_ERROR,
     ErrorData,
+    JSONRPCBatch,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCRequest,
@@ -118,6 +122,20 @@ class EventStore(ABC):
         """
         pass
 
+    async def run(self) -> None:
+        """
+        Does the store's background work until cancelled.
+
+        StreamableHTTPSessionManager runs this while it runs. The default does nothing.
+        """
+
+    async def close(self) -> None:
+        """
+        Releases the store's resources.
+
+        StreamableHTTPSessionManager calls this when it shuts down. The default does nothing.
+        """
+
 
 class StreamableHTTPServerTransport:
     """
@@ -128,10 +146,10 @@ class StreamableHTTPServerTransport:
     """
 
     # Server notification streams for POST requests as well as standalone SSE stream
-    _read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception] | None = None
-    _read_stream: MemoryObjectReceiveStream[SessionMessage | Exception] | None = None
-    _write_stream: MemoryObjectSendStream[SessionMessage] | None = None
-    _write_stream_reader: MemoryObjectReceiveStream[SessionMessage] | None = None
+    _read_stream_writer: BufferedSendStream[SessionMessage | Exception] | None = None
+    _read_stream: BufferedReceiveStream[SessionMessage | Exception] | None = None
+    _write_stream: BufferedSendStream[SessionMessage] | None = None
+    _write_stream_reader: BufferedReceiveStream[SessionMessage] | None = None
     _security: TransportSecurityMiddleware
 
     def __init__(
@@ -140,6 +158,9 @@ class StreamableHTTPServerTransport:
         is_json_response_enabled: bool = False,
         event_store: EventStore | None = None,
         security_settings: TransportSecuritySettings | None = None,
+        codec: JSONCodec | JSONCodecName | None = None,
+        stream_buffer: StreamBuffer | int = 0,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         """
         Initialize a new StreamableHTTP server transport.
@@ -153,6 +174,11 @@ class StreamableHTTPServerTransport:
                         resumability will be enabled, allowing clients to
                         reconnect and resume messages.
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: JSON codec used for messages (pydantic-core by default).
+            stream_buffer: Number of messages the session's read and write streams and
+                           each request's stream buffer, or their StreamBuffer settings.
+            instrumentation: Optional instrumentation told how long decoding request
+                             bodies and writing responses takes.
 
         Raises:
             ValueError: If the session ID contains invalid characters.
@@ -164,11 +190,14 @@ class StreamableHTTPServerTransport:
         self.is_json_response_enabled = is_json_response_enabled
         self._event_store = event_store
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = get_json_codec(codec)
+        self._stream_buffer = stream_buffer
+        self._instrumentation = instrumentation
         self._request_streams: dict[
             RequestId,
             tuple[
-                MemoryObjectSendStream[EventMessage],
-                MemoryObjectReceiveStream[EventMessage],
+                BufferedSendStream[EventMessage],
+                BufferedReceiveStream[EventMessage],
             ],
         ] = {}
         self._terminated = False
@@ -204,7 +233,7 @@ class StreamableHTTPServerTransport:
         )
 
         return Response(
-            error_response.model_dump_json(by_alias=True, exclude_none=True),
+            self._codec.encode_message(JSONRPCMessage(error_response)),
             status_code=status_code,
             headers=response_headers,
         )
@@ -224,11 +253,28 @@ class StreamableHTTPServerTransport:
             response_headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
         return Response(
-            response_message.model_dump_json(by_alias=True, exclude_none=True) if response_message else None,
+            self._codec.encode_message(response_message) if response_message else None,
             status_code=status_code,
             headers=response_headers,
         )
 
+    def _clock(self) -> float:
+        """Read the clock for a stage measurement, or return 0 without instrumentation."""
+        return time.perf_counter() if self._instrumentation is not None else 0.0
+
+    def _record_stage(self, stage: Stage, started_at: float, method: str | None = None) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.record_stage(stage, time.perf_counter() - started_at, method)
+
+    async def _send_json_response(
+        self, response_message: JSONRPCMessage, method: str, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Write the JSON response to a request."""
+        started_at = self._clock()
+        response = self._create_json_response(response_message)
+        await response(scope, receive, send)
+        self._record_stage("write", started_at, method)
+
     def _get_session_id(self, request: Request) -> str | None:
         """Extract the session ID from request headers."""
         return request.headers.get(MCP_SESSION_ID_HEADER)
@@ -237,7 +283,7 @@ class StreamableHTTPServerTransport:
         """Create event data dictionary from an EventMessage."""
         event_data = {
             "event": "message",
-            "data": event_message.message.model_dump_json(by_alias=True, exclude_none=True),
+            "data": self._codec.encode_message(event_message.message),
         }
 
         # If an event ID was provided, include it
@@ -350,13 +396,20 @@ class StreamableHTTPServerTransport:
             # Parse the body - only read it once
             body = await request.body()
 
+            decode_started_at = self._clock()
             try:
-                raw_message = json.loads(body)
-            except json.JSONDecodeError as e:
+                raw_message = self._codec.loads(body)
+            except ValueError as e:
                 response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
                 await response(scope, receive, send)
                 return
 
+            if isinstance(raw_message, list):
+                await self._handle_batch_post_request(
+                    cast(list[Any], raw_message), scope, request, send, writer, decode_started_at
+                )
+                return
+
             try:
                 message = JSONRPCMessage.model_validate(raw_message)
             except ValidationError as e:
@@ -367,6 +420,7 @@ class StreamableHTTPServerTransport:
                 )
                 await response(scope, receive, send)
                 return
+            self._record_stage("decode", decode_started_at, message_method(message))
 
             # Check if this is an initialization request
             is_initialization_request = isinstance(message.root, JSONRPCRequest) and message.root.method == "initialize"
@@ -406,8 +460,9 @@ class StreamableHTTPServerTransport:
 
             # Extract the request ID outside the try block for proper scope
             request_id = str(message.root.id)
+            method = message.root.method
             # Register this stream for the request ID
-            self._request_streams[request_id] = anyio.create_memory_object_stream[EventMessage](0)
+            self._request_streams[request_id] = create_message_stream[EventMessage](self._stream_buffer)
             request_stream_reader = self._request_streams[request_id][1]
 
             if self.is_json_response_enabled:
@@ -432,9 +487,7 @@ class StreamableHTTPServerTransport:
 
                     # At this point we should have a response
                     if response_message:
-                        # Create JSON response
-                        response = self._create_json_response(response_message)
-                        await response(scope, receive, send)
+                        await self._send_json_response(response_message, method, scope, receive, send)
                     else:
                         # This shouldn't happen in normal operation
                         logger.error("No response message received before stream closed")
@@ -464,8 +517,10 @@ class StreamableHTTPServerTransport:
                             # Process messages from the request-specific stream
                             async for event_message in request_stream_reader:
                                 # Build the event data
+                                write_started_at = self._clock()
                                 event_data = self._create_event_data(event_message)
                                 await sse_stream_writer.send(event_data)
+                                self._record_stage("write", write_started_at, method)
 
                                 # If response, remove from pending streams and close
                                 if isinstance(
@@ -521,6 +576,175 @@ class StreamableHTTPServerTransport:
                 await writer.send(Exception(err))
             return
 
+    async def _handle_batch_post_request(
+        self,
+        raw_messages: list[Any],
+        scope: Scope,
+        request: Request,
+        send: Send,
+        writer: BufferedSendStream[SessionMessage | Exception],
+        decode_started_at: float = 0.0,
+    ) -> None:
+        """Handle a POST whose body is a JSON-RPC batch.
+
+        All messages of the batch are passed to the server at once, so its requests are
+        handled concurrently. The responses are returned together as a JSON array, or
+        streamed over a single SSE stream that closes once every request is answered.
+        """
+        receive = request.receive
+        try:
+            messages = JSONRPCBatch.model_validate(raw_messages).root
+        except ValidationError as e:
+            response = self._create_error_response(
+                f"Validation error: {str(e)}",
+                HTTPStatus.BAD_REQUEST,
+                INVALID_PARAMS,
+            )
+            await response(scope, receive, send)
+            return
+        self._record_stage("decode", decode_started_at)
+
+        if any(
+            isinstance(message.root, JSONRPCRequest) and message.root.method == "initialize" for message in messages
+        ):
+            response = self._create_error_response(
+                "Invalid Request: initialize must not be part of a batch",
+                HTTPStatus.BAD_REQUEST,
+                INVALID_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        if not await self._validate_request_headers(request, send):
+            return
+
+        request_ids = [str(message.root.id) for message in messages if isinstance(message.root, JSONRPCRequest)]
+        if len(set(request_ids)) != len(request_ids) or any(
+            request_id in self._request_streams for request_id in request_ids
+        ):
+            response = self._create_error_response(
+                "Invalid Request: duplicate request ID in batch",
+                HTTPStatus.BAD_REQUEST,
+                INVALID_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        metadata = ServerMessageMetadata(request_context=request)
+
+        async def submit_messages() -> None:
+            for message in messages:
+                await writer.send(SessionMessage(message, metadata=metadata))
+
+        # A batch of notifications and responses only is acknowledged like a single one
+        if not request_ids:
+            response = self._create_json_response(None, HTTPStatus.ACCEPTED)
+            await response(scope, receive, send)
+            await submit_messages()
+            return
+
+        readers: dict[str, BufferedReceiveStream[EventMessage]] = {}
+        for request_id in request_ids:
+            self._request_streams[request_id] = create_message_stream[EventMessage](self._stream_buffer)
+            readers[request_id] = self._request_streams[request_id][1]
+
+        try:
+            if self.is_json_response_enabled:
+                await self._send_batch_json_response(readers, submit_messages, scope, receive, send)
+            else:
+                await self._send_batch_sse_response(readers, submit_messages, scope, receive, send)
+        finally:
+            for request_id in request_ids:
+                await self._clean_up_memory_streams(request_id)
+
+    async def _send_batch_json_response(
+        self,
+        readers: dict[str, BufferedReceiveStream[EventMessage]],
+        submit_messages: Callable[[], Awaitable[None]],
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Wait for the response to every request of a batch and return them as a JSON array."""
+        responses: dict[str, JSONRPCMessage] = {}
+
+        async def collect(request_id: str, reader: BufferedReceiveStream[EventMessage]) -> None:
+            async for event_message in reader:
+                if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                    responses[request_id] = event_message.message
+                    return
+
+        async with anyio.create_task_group() as tg:
+            for request_id, reader in readers.items():
+                tg.start_soon(collect, request_id, reader)
+            await submit_messages()
+
+        if len(responses) != len(readers):
+            logger.error("Not every request of the batch received a response before its stream closed")
+            response = self._create_error_response(
+                "Error processing request: No response received",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+            await response(scope, receive, send)
+            return
+
+        write_started_at = self._clock()
+        body = self._codec.encode_messages([responses[request_id] for request_id in readers])
+        headers = {"Content-Type": CONTENT_TYPE_JSON}
+        if self.mcp_session_id:
+            headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
+        response = Response(body, status_code=HTTPStatus.OK, headers=headers)
+        await response(scope, receive, send)
+        self._record_stage("write", write_started_at)
+
+    async def _send_batch_sse_response(
+        self,
+        readers: dict[str, BufferedReceiveStream[EventMessage]],
+        submit_messages: Callable[[], Awaitable[None]],
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Stream the messages related to every request of a batch over one SSE stream."""
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+
+        async def forward(reader: BufferedReceiveStream[EventMessage]) -> None:
+            async with reader:
+                async for event_message in reader:
+                    write_started_at = self._clock()
+                    await sse_stream_writer.send(self._create_event_data(event_message))
+                    self._record_stage("write", write_started_at)
+                    if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                        return
+
+        async def sse_writer():
+            try:
+                async with sse_stream_writer, anyio.create_task_group() as tg:
+                    for reader in readers.values():
+                        tg.start_soon(forward, reader)
+            except Exception:
+                logger.exception("Error in batch SSE writer")
+
+        headers = {
+            "Cache-Control": "no-cache, no-transform",
+            "Connection": "keep-alive",
+            "Content-Type": CONTENT_TYPE_SSE,
+            **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
+        }
+        response = EventSourceResponse(
+            content=sse_stream_reader,
+            data_sender_callable=sse_writer,
+            headers=headers,
+        )
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(response, scope, receive, send)
+                await submit_messages()
+        except Exception:
+            logger.exception("Batch SSE response error")
+            await sse_stream_writer.aclose()
+            await sse_stream_reader.aclose()
+
     async def _handle_get_request(self, request: Request, send: Send) -> None:
         """
         Handle GET request to establish SSE.
@@ -577,7 +801,7 @@ class StreamableHTTPServerTransport:
             try:
                 # Create a standalone message stream for server-initiated messages
 
-                self._request_streams[GET_STREAM_KEY] = anyio.create_memory_object_stream[EventMessage](0)
+                self._request_streams[GET_STREAM_KEY] = create_message_stream[EventMessage](self._stream_buffer)
                 standalone_stream_reader = self._request_streams[GET_STREAM_KEY][1]
 
                 async with sse_stream_writer, standalone_stream_reader:
@@ -776,7 +1000,7 @@ class StreamableHTTPServerTransport:
 
                         # If stream ID not in mapping, create it
                         if stream_id and stream_id not in self._request_streams:
-                            self._request_streams[stream_id] = anyio.create_memory_object_stream[EventMessage](0)
+                            self._request_streams[stream_id] = create_message_stream[EventMessage](self._stream_buffer)
                             msg_reader = self._request_streams[stream_id][1]
 
                             # Forward messages to SSE
@@ -817,8 +1041,8 @@ class StreamableHTTPServerTransport:
         self,
     ) -> AsyncGenerator[
         tuple[
-            MemoryObjectReceiveStream[SessionMessage | Exception],
-            MemoryObjectSendStream[SessionMessage],
+            BufferedReceiveStream[SessionMessage | Exception],
+            BufferedSendStream[SessionMessage],
         ],
         None,
     ]:
@@ -830,8 +1054,8 @@ class StreamableHTTPServerTransport:
 
         # Create the memory streams for this connection
 
-        read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
-        write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
+        read_stream_writer, read_stream = create_message_stream[SessionMessage | Exception](self._stream_buffer)
+        write_stream, write_stream_reader = create_message_stream[SessionMessage](self._stream_buffer)
 
         # Store the streams
         self._read_stream_writer = read_stream_writer
@@ -891,6 +1115,12 @@ class StreamableHTTPServerTransport:
                                 for message. Still processing message as the client
                                 might reconnect and replay."""
                             )
+                except anyio.ClosedResourceError:
+                    if self._terminated:
+                        # terminate() closes the streams, which ends every stateless session
+                        logger.debug("Message router stopped by termination")
+                    else:
+                        logger.exception("Unexpected closure of the write stream in message router")
                 except Exception:
                     logger.exception("Error in message router")
 
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any
 from uuid import uuid4
@@ -16,16 +18,35 @@ from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
 from mcp.server.lowlevel.server import Server as MCPServer
+from mcp.server.models import InitializationOptions
 from mcp.server.streamable_http import (
     MCP_SESSION_ID_HEADER,
     EventStore,
     StreamableHTTPServerTransport,
 )
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
+from mcp.shared.streams import StreamBuffer
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SessionManagerStatistics:
+    """Point-in-time session gauges of a StreamableHTTPSessionManager."""
+
+    live_sessions: int
+    """Number of sessions currently tracked by the manager."""
+    active_sessions: int
+    """Number of sessions with at least one HTTP request in progress."""
+    evicted_idle: int
+    """Number of sessions evicted after exceeding the idle timeout."""
+    evicted_capacity: int
+    """Number of least recently used sessions evicted to make room for new ones."""
+    rejected: int
+    """Number of new sessions rejected because every tracked session was busy."""
+
+
 class StreamableHTTPSessionManager:
     """
     Manages StreamableHTTP sessions with optional resumability via event store.
@@ -48,9 +69,25 @@ class StreamableHTTPSessionManager:
                      If provided, enables resumable connections where clients
                      can reconnect and receive missed events.
                      If None, sessions are still tracked but not resumable.
+                     The manager runs the store's background work while it
+                     runs and closes the store when it shuts down.
         json_response: Whether to use JSON responses instead of SSE streams
         stateless: If True, creates a completely fresh transport for each request
                    with no session tracking or state persistence between requests.
+                   The server's lifespan is entered once in run() and its context,
+                   along with the initialization options, is shared by all requests.
+        session_idle_timeout: Seconds a session may go without any HTTP request in
+                              progress before it is terminated and forgotten.
+                              If None, idle sessions are kept until deleted.
+        max_sessions: Maximum number of sessions tracked at once. When a new session
+                      would exceed it, the least recently used session without a
+                      request in progress is evicted; if every session is busy the
+                      new session is rejected with 503 Service Unavailable.
+                      If None, the number of sessions is unbounded.
+        json_codec: JSON codec used by every transport for messages
+                    (pydantic-core by default).
+        stream_buffer: Number of messages each transport's memory streams buffer,
+                       or their StreamBuffer settings.
     """
 
     def __init__(
@@ -60,19 +97,39 @@ class StreamableHTTPSessionManager:
         json_response: bool = False,
         stateless: bool = False,
         security_settings: TransportSecuritySettings | None = None,
+        session_idle_timeout: float | None = None,
+        max_sessions: int | None = None,
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        stream_buffer: StreamBuffer | int = 0,
     ):
+        if session_idle_timeout is not None and session_idle_timeout <= 0:
+            raise ValueError("session_idle_timeout must be positive")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
         self.app = app
         self.event_store = event_store
         self.json_response = json_response
         self.stateless = stateless
         self.security_settings = security_settings
+        self.session_idle_timeout = session_idle_timeout
+        self.max_sessions = max_sessions
+        self.json_codec = get_json_codec(json_codec)
+        self.stream_buffer = stream_buffer
 
-        # Session tracking (only used if not stateless)
+        # Session tracking (only used if not stateless), least recently used first
         self._session_creation_lock = anyio.Lock()
-        self._server_instances: dict[str, StreamableHTTPServerTransport] = {}
+        self._server_instances: OrderedDict[str, StreamableHTTPServerTransport] = OrderedDict()
+        self._last_activity: dict[str, float] = {}
+        self._active_requests: dict[str, int] = {}
+        self._evicted_idle = 0
+        self._evicted_capacity = 0
+        self._rejected = 0
 
         # The task group will be set during lifespan
         self._task_group = None
+        # Shared by all requests in stateless mode, set during lifespan
+        self._stateless_runtime: tuple[InitializationOptions, Any] | None = None
         # Thread-safe tracking of run() calls
         self._run_lock = anyio.Lock()
         self._has_started = False
@@ -104,9 +161,24 @@ class StreamableHTTPSessionManager:
                 )
             self._has_started = True
 
-        async with anyio.create_task_group() as tg:
+        async with contextlib.AsyncExitStack() as stack:
+            if self.stateless:
+                # Set up once what every stateless request would otherwise rebuild
+                lifespan_context = await stack.enter_async_context(self.app.lifespan(self.app))
+                self._stateless_runtime = (self.app.create_initialization_options(), lifespan_context)
+                stack.callback(setattr, self, "_stateless_runtime", None)
+
+            if self.event_store is not None:
+                # Closed once every task below has stopped storing events
+                stack.push_async_callback(self.event_store.close)
+
+            tg = await stack.enter_async_context(anyio.create_task_group())
             # Store the task group for later use
             self._task_group = tg
+            if self.event_store is not None:
+                tg.start_soon(self.event_store.run)
+            if self.session_idle_timeout is not None and not self.stateless:
+                tg.start_soon(self._sweep_idle_sessions, self.session_idle_timeout)
             logger.info("StreamableHTTP session manager started")
             try:
                 yield  # Let the application run
@@ -117,6 +189,18 @@ class StreamableHTTPSessionManager:
                 self._task_group = None
                 # Clear any remaining server instances
                 self._server_instances.clear()
+                self._last_activity.clear()
+                self._active_requests.clear()
+
+    def statistics(self) -> SessionManagerStatistics:
+        """Return the current session gauges."""
+        return SessionManagerStatistics(
+            live_sessions=len(self._server_instances),
+            active_sessions=sum(1 for count in self._active_requests.values() if count > 0),
+            evicted_idle=self._evicted_idle,
+            evicted_capacity=self._evicted_capacity,
+            rejected=self._rejected,
+        )
 
     async def handle_request(
         self,
@@ -164,18 +248,25 @@ class StreamableHTTPSessionManager:
             is_json_response_enabled=self.json_response,
             event_store=None,  # No event store in stateless mode
             security_settings=self.security_settings,
+            codec=self.json_codec,
+            stream_buffer=self.stream_buffer,
+            instrumentation=self.app.instrumentation,
         )
 
+        assert self._stateless_runtime is not None
+        initialization_options, lifespan_context = self._stateless_runtime
+
         # Start server in a new task
         async def run_stateless_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED):
             async with http_transport.connect() as streams:
                 read_stream, write_stream = streams
                 task_status.started()
                 try:
-                    await self.app.run(
+                    await self.app.run_session(
                         read_stream,
                         write_stream,
-                        self.app.create_initialization_options(),
+                        initialization_options,
+                        lifespan_context,
                         stateless=True,
                     )
                 except Exception:
@@ -213,56 +304,56 @@ class StreamableHTTPSessionManager:
         if request_mcp_session_id is not None and request_mcp_session_id in self._server_instances:
             transport = self._server_instances[request_mcp_session_id]
             logger.debug("Session already exists, handling request directly")
-            await transport.handle_request(scope, receive, send)
+            await self._handle_session_request(request_mcp_session_id, transport, scope, receive, send)
             return
 
         if request_mcp_session_id is None:
             # New session case
             logger.debug("Creating new transport")
-            async with self._session_creation_lock:
-                new_session_id = uuid4().hex
-                http_transport = StreamableHTTPServerTransport(
-                    mcp_session_id=new_session_id,
-                    is_json_response_enabled=self.json_response,
-                    event_store=self.event_store,  # May be None (no resumability)
-                    security_settings=self.security_settings,
+            http_transport = await self._register_session()
+            if http_transport is None:
+                self._rejected += 1
+                response = Response(
+                    "Service Unavailable: Too many active sessions",
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
                 )
-
-                assert http_transport.mcp_session_id is not None
-                self._server_instances[http_transport.mcp_session_id] = http_transport
-                logger.info(f"Created new transport with session ID: {new_session_id}")
-
-                # Define the server runner
-                async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
-                    async with http_transport.connect() as streams:
-                        read_stream, write_stream = streams
-                        task_status.started()
-                        try:
-                            await self.app.run(
-                                read_stream,
-                                write_stream,
-                                self.app.create_initialization_options(),
-                                stateless=False,  # Stateful mode
+                await response(scope, receive, send)
+                return
+
+            new_session_id = http_transport.mcp_session_id
+            assert new_session_id is not None
+            logger.info(f"Created new transport with session ID: {new_session_id}")
+
+            # Define the server runner
+            async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
+                async with http_transport.connect() as streams:
+                    read_stream, write_stream = streams
+                    task_status.started()
+                    try:
+                        await self.app.run(
+                            read_stream,
+                            write_stream,
+                            self.app.create_initialization_options(),
+                            stateless=False,  # Stateful mode
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Session {http_transport.mcp_session_id} crashed: {e}",
+                            exc_info=True,
+                        )
+                    finally:
+                        # Only remove from instances if not terminated
+                        if (
+                            http_transport.mcp_session_id
+                            and http_transport.mcp_session_id in self._server_instances
+                            and not http_transport.is_terminated
+                        ):
+                            logger.info(
+                                f"Cleaning up crashed session {http_transport.mcp_session_id} from active instances."
                             )
-                        except Exception as e:
-                            logger.error(
-                                f"Session {http_transport.mcp_session_id} crashed: {e}",
-                                exc_info=True,
-                            )
-                        finally:
-                            # Only remove from instances if not terminated
-                            if (
-                                http_transport.mcp_session_id
-                                and http_transport.mcp_session_id in self._server_instances
-                                and not http_transport.is_terminated
-                            ):
-                                logger.info(
-                                    "Cleaning up crashed session "
-                                    f"{http_transport.mcp_session_id} from "
-                                    "active instances."
-                                )
-                                del self._server_instances[http_transport.mcp_session_id]
+                            self._forget_session(http_transport.mcp_session_id)
 
+            try:
                 # Assert task group is not None for type checking
                 assert self._task_group is not None
                 # Start the server task
@@ -270,6 +361,8 @@ class StreamableHTTPSessionManager:
 
                 # Handle the HTTP request and return the response
                 await http_transport.handle_request(scope, receive, send)
+            finally:
+                self._touch_session(new_session_id, -1)
         else:
             # Invalid session ID
             response = Response(
@@ -277,3 +370,103 @@ class StreamableHTTPSessionManager:
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             await response(scope, receive, send)
+
+    async def _register_session(self) -> StreamableHTTPServerTransport | None:
+        """Create and track the transport of a new session.
+
+        Only the capacity check and registration are serialized, so the first request
+        of a new session is served concurrently with other new sessions. The new
+        session is counted as having a request in progress, which the caller must
+        release, so it cannot be evicted before its first request is served.
+
+        Returns:
+            None if the manager is full and every session has a request in progress
+        """
+        async with self._session_creation_lock:
+            if not await self._make_room_for_session():
+                return None
+
+            new_session_id = uuid4().hex
+            http_transport = StreamableHTTPServerTransport(
+                mcp_session_id=new_session_id,
+                is_json_response_enabled=self.json_response,
+                event_store=self.event_store,  # May be None (no resumability)
+                security_settings=self.security_settings,
+                codec=self.json_codec,
+                stream_buffer=self.stream_buffer,
+                instrumentation=self.app.instrumentation,
+            )
+            self._server_instances[new_session_id] = http_transport
+            self._touch_session(new_session_id, 1)
+            return http_transport
+
+    async def _handle_session_request(
+        self,
+        session_id: str,
+        transport: StreamableHTTPServerTransport,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle a request of a tracked session, recording it as the session's latest activity."""
+        self._touch_session(session_id, 1)
+        try:
+            await transport.handle_request(scope, receive, send)
+        finally:
+            self._touch_session(session_id, -1)
+
+    def _touch_session(self, session_id: str, active_delta: int) -> None:
+        if session_id not in self._server_instances:
+            return
+        self._server_instances.move_to_end(session_id)
+        self._last_activity[session_id] = anyio.current_time()
+        self._active_requests[session_id] = self._active_requests.get(session_id, 0) + active_delta
+
+    def _forget_session(self, session_id: str) -> StreamableHTTPServerTransport | None:
+        self._last_activity.pop(session_id, None)
+        self._active_requests.pop(session_id, None)
+        return self._server_instances.pop(session_id, None)
+
+    async def _evict_session(self, session_id: str) -> None:
+        transport = self._forget_session(session_id)
+        if transport is not None and not transport.is_terminated:
+            await transport.terminate()
+
+    async def _make_room_for_session(self) -> bool:
+        """Evict the least recently used idle session if the manager is at capacity.
+
+        Returns:
+            False if the manager is full and every session has a request in progress
+        """
+        if self.max_sessions is None or len(self._server_instances) < self.max_sessions:
+            return True
+
+        for session_id in self._server_instances:
+            if not self._active_requests.get(session_id):
+                logger.info(f"Evicting least recently used session {session_id} to stay under max_sessions")
+                self._evicted_capacity += 1
+                await self._evict_session(session_id)
+                return True
+        return False
+
+    async def _sweep_idle_sessions(self, idle_timeout: float) -> None:
+        """Periodically evict sessions without a request in progress for longer than `idle_timeout`."""
+        while True:
+            await anyio.sleep(idle_timeout / 2)
+            deadline = anyio.current_time() - idle_timeout
+            expired: list[str] = []
+            # Sessions are ordered by last activity, so stop at the first recently used one
+            for session_id in self._server_instances:
+                if self._last_activity[session_id] > deadline:
+                    break
+                if not self._active_requests.get(session_id):
+                    expired.append(session_id)
+
+            for session_id in expired:
+                # A request may have come in while an earlier session was being terminated
+                last_activity = self._last_activity.get(session_id)
+                if last_activity is None or last_activity > deadline or self._active_requests.get(session_id):
+                    continue
+                logger.info(f"Evicting session {session_id} after {idle_timeout}s of inactivity")
+                self._evicted_idle += 1
+                await self._evict_session(session_id)
@@ -2,42 +2,52 @@ import logging
 from contextlib import asynccontextmanager
 
 import anyio
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic_core import ValidationError
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket
 
-import mcp.types as types
+from mcp.shared.json_codec import JSONCodec, JSONCodecName, get_json_codec
 from mcp.shared.message import SessionMessage
+from mcp.shared.streams import BufferedReceiveStream, BufferedSendStream, StreamBuffer, create_message_stream
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def websocket_server(scope: Scope, receive: Receive, send: Send):
+async def websocket_server(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    codec: JSONCodec | JSONCodecName | None = None,
+    stream_buffer: StreamBuffer | int = 0,
+):
     """
     WebSocket server transport for MCP. This is an ASGI application, suitable to be
     used with a framework like Starlette and a server like Hypercorn.
+
+    `codec` selects the JSON codec used for messages (pydantic-core by default).
+    `stream_buffer` sets how many messages the read and write streams buffer.
     """
+    json_codec = get_json_codec(codec)
 
     websocket = WebSocket(scope, receive, send)
     await websocket.accept(subprotocol="mcp")
 
-    read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
-    read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+    read_stream: BufferedReceiveStream[SessionMessage | Exception]
+    read_stream_writer: BufferedSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: BufferedSendStream[SessionMessage]
+    write_stream_reader: BufferedReceiveStream[SessionMessage]
 
-    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
-    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    read_stream_writer, read_stream = create_message_stream[SessionMessage | Exception](stream_buffer)
+    write_stream, write_stream_reader = create_message_stream[SessionMessage](stream_buffer)
 
     async def ws_reader():
         try:
             async with read_stream_writer:
                 async for msg in websocket.iter_text():
                     try:
-                        client_message = types.JSONRPCMessage.model_validate_json(msg)
+                        client_message = json_codec.decode_message(msg)
                     except ValidationError as exc:
                         await read_stream_writer.send(exc)
                         continue
@@ -51,7 +61,7 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    obj = json_codec.encode_message(session_message.message)
                     await websocket.send_text(obj)
         except anyio.ClosedResourceError:
             await websocket.close()
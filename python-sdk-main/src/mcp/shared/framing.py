@@ -0,0 +1,76 @@
+"""Newline-delimited framing of byte streams, as used by the stdio transports.
+
+`LineFramer` keeps unfinished input in a bytearray and only scans the newly received
+bytes for newlines, so a line spread over many chunks costs time proportional to
+its length rather than to the square of the number of chunks.
+"""
+
+
+class MessageTooLargeError(ValueError):
+    """A line exceeded the framer's maximum size and was discarded."""
+
+    def __init__(self, max_size: int):
+        super().__init__(f"Message exceeds the maximum size of {max_size} bytes and was discarded")
+        self.max_size = max_size
+
+
+class LineFramer:
+    """Splits a byte stream into newline-delimited lines.
+
+    Args:
+        max_line_size: Maximum length of a line in bytes, excluding the newline (None for no limit).
+            Longer lines are discarded as they arrive, so they are never held in memory
+            in full, and reported as a MessageTooLargeError in their place.
+    """
+
+    def __init__(self, max_line_size: int | None = None):
+        if max_line_size is not None and max_line_size < 1:
+            raise ValueError("max_line_size must be at least 1")
+        self.max_line_size = max_line_size
+        self._buffer = bytearray()
+        self._discarding = False
+
+    @property
+    def buffered(self) -> int:
+        """Number of bytes of the unfinished line held in the buffer."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> list[bytes | MessageTooLargeError]:
+        """Add received bytes and return the lines they complete, in order."""
+        lines: list[bytes | MessageTooLargeError] = []
+        start = 0
+        if self._discarding:
+            newline = data.find(b"\n")
+            if newline == -1:
+                return lines
+            self._discarding = False
+            start = newline + 1
+
+        # Only the new bytes can contain the newline ending the buffered line
+        scan = len(self._buffer)
+        buffer = self._buffer
+        buffer += memoryview(data)[start:]
+        line_start = 0
+        newline = buffer.find(b"\n", scan)
+        while newline != -1:
+            if self.max_line_size is not None and newline - line_start > self.max_line_size:
+                lines.append(MessageTooLargeError(self.max_line_size))
+            else:
+                lines.append(bytes(buffer[line_start:newline]))
+            line_start = newline + 1
+            newline = buffer.find(b"\n", line_start)
+        del buffer[:line_start]
+
+        if self.max_line_size is not None and len(buffer) > self.max_line_size:
+            lines.append(MessageTooLargeError(self.max_line_size))
+            buffer.clear()
+            self._discarding = True
+        return lines
+
+    def flush(self) -> bytes | None:
+        """Return the unfinished line at the end of the stream, if there is one."""
+        if not self._buffer:
+            return None
+        line = bytes(self._buffer)
+        self._buffer.clear()
+        return line
@@ -0,0 +1,128 @@
+"""JSON encoding and decoding of JSON-RPC messages for the transports.
+
+Every transport turns messages into JSON text and back through a `JSONCodec`, so the
+implementation can be chosen once per server or client:
+
+- "pydantic": pydantic-core's JSON parser and serializer (the default)
+- "orjson": the optional `orjson` package for parsing and serializing plain JSON values,
+  with pydantic validating the decoded messages
+"""
+
+import importlib
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+import pydantic_core
+
+from mcp.types import JSONRPCBatch, JSONRPCMessage
+
+JSONCodecName = Literal["pydantic", "orjson"]
+
+
+class JSONCodec(ABC):
+    """Converts JSON-RPC messages and plain JSON values to and from JSON text."""
+
+    name: JSONCodecName
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Parse JSON text into plain Python values.
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Serialize plain Python values to compact JSON text."""
+
+    def decode_message(self, data: str | bytes) -> JSONRPCMessage:
+        """Parse and validate a single JSON-RPC message.
+
+        Raises:
+            pydantic.ValidationError: If the data is not a valid JSON-RPC message
+        """
+        return JSONRPCMessage.model_validate_json(data)
+
+    def decode_messages(self, data: str | bytes) -> list[JSONRPCMessage]:
+        """Parse and validate a single JSON-RPC message or a batch of them.
+
+        Raises:
+            pydantic.ValidationError: If the data is not a valid JSON-RPC message or batch
+        """
+        if data.lstrip()[:1] in ("[", b"["):
+            return JSONRPCBatch.model_validate_json(data).root
+        return [self.decode_message(data)]
+
+    def encode_message(self, message: JSONRPCMessage) -> str:
+        """Serialize a JSON-RPC message to compact JSON text."""
+        return message.model_dump_json(by_alias=True, exclude_none=True)
+
+    def encode_messages(self, messages: list[JSONRPCMessage]) -> str:
+        """Serialize JSON-RPC messages to a JSON array."""
+        return "[" + ",".join(self.encode_message(message) for message in messages) + "]"
+
+
+class PydanticJSONCodec(JSONCodec):
+    """JSON codec using pydantic-core, which validates messages straight from JSON text."""
+
+    name: JSONCodecName = "pydantic"
+
+    def loads(self, data: str | bytes) -> Any:
+        return pydantic_core.from_json(data)
+
+    def dumps(self, obj: Any) -> str:
+        return pydantic_core.to_json(obj).decode()
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """JSON codec using the optional orjson package."""
+
+    name: JSONCodecName = "orjson"
+
+    def __init__(self):
+        try:
+            self._orjson: Any = importlib.import_module("orjson")
+        except ImportError:
+            raise ImportError("The 'orjson' JSON codec requires orjson. Install it with 'pip install orjson'")
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+    def decode_message(self, data: str | bytes) -> JSONRPCMessage:
+        try:
+            obj = self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # Let pydantic report the invalid JSON like the default codec does
+            return JSONRPCMessage.model_validate_json(data)
+        return JSONRPCMessage.model_validate(obj)
+
+    def decode_messages(self, data: str | bytes) -> list[JSONRPCMessage]:
+        try:
+            obj = self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return super().decode_messages(data)
+        if isinstance(obj, list):
+            return JSONRPCBatch.model_validate(obj).root
+        return [JSONRPCMessage.model_validate(obj)]
+
+    def encode_message(self, message: JSONRPCMessage) -> str:
+        return self.dumps(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+
+
+DEFAULT_JSON_CODEC: JSONCodec = PydanticJSONCodec()
+
+
+def get_json_codec(codec: JSONCodec | JSONCodecName | None = None) -> JSONCodec:
+    """Return the codec for a codec name, passing codec instances through.
+
+    None selects the default pydantic-core codec.
+    """
+    if codec is None or codec == "pydantic":
+        return DEFAULT_JSON_CODEC
+    if codec == "orjson":
+        return OrjsonJSONCodec()
+    return codec
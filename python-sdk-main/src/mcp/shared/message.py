@@ -15,12 +15,30 @@ ResumptionToken = str
 ResumptionTokenUpdateCallback = Callable[[ResumptionToken], Awaitable[None]]
 
 
+@dataclass(eq=False)
+class RequestBatch:
+    """Groups client requests that a transport may send together as one JSON-RPC batch.
+
+    Every request of the batch carries the same RequestBatch in its metadata. Transports
+    that support batching hold the requests back until `size` of them have been written
+    and then send them as a single JSON array, if the negotiated protocol version allows
+    batches (see BATCH_PROTOCOL_VERSIONS); otherwise the requests are sent one by one.
+    If fewer than `size` requests arrive, for example because a caller was cancelled
+    before sending its request, the ones that did are sent `max_delay` seconds after
+    the first.
+    """
+
+    size: int
+    max_delay: float = 0.05
+
+
 @dataclass
 class ClientMessageMetadata:
     """Metadata specific to client messages."""
 
     resumption_token: ResumptionToken | None = None
     on_resumption_token_update: Callable[[ResumptionToken], Awaitable[None]] | None = None
+    batch: RequestBatch | None = None
 
 
 @dataclass
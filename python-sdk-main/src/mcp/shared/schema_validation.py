@@ -0,0 +1,99 @@
+"""Cached JSON Schema validation for tool inputs and outputs.
+
+`jsonschema.validate` checks the schema and builds a new validator on every call.
+Tool schemas rarely change between calls, so both the server and the client keep
+compiled validators in a `SchemaValidatorCache` and only recompile when a tool
+listing hands them a new schema.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any, Literal
+
+from jsonschema import ValidationError, exceptions, validators
+
+SchemaValidatorBackend = Literal["jsonschema", "fastjsonschema"]
+"""Validator implementation used by a SchemaValidatorCache.
+
+- "jsonschema": validators from the `jsonschema` package
+- "fastjsonschema": validators compiled to Python code by the optional `fastjsonschema`
+  package, falling back to `jsonschema` for error reporting and unsupported schemas
+"""
+
+
+class SchemaValidatorCache:
+    """Caches compiled JSON Schema validators keyed by name and schema identity.
+
+    A cached validator is reused for as long as it is asked to validate against the
+    same schema object it was compiled from; a different schema object for the same
+    name triggers a recompile. Errors are reported exactly as `jsonschema.validate`
+    reports them.
+    """
+
+    def __init__(self, backend: SchemaValidatorBackend = "jsonschema"):
+        self._fastjsonschema: Any = None
+        if backend == "fastjsonschema":
+            try:
+                self._fastjsonschema = importlib.import_module("fastjsonschema")
+            except ImportError:
+                raise ImportError(
+                    "The 'fastjsonschema' validator backend requires fastjsonschema. "
+                    "Install it with 'pip install fastjsonschema'"
+                )
+        self.backend: SchemaValidatorBackend = backend
+        self._validators: dict[str, tuple[dict[str, Any], Callable[[Any], None]]] = {}
+
+    def validate(self, name: str, instance: Any, schema: dict[str, Any]) -> None:
+        """Validate an instance against the schema registered under `name`.
+
+        Raises:
+            jsonschema.ValidationError: If the instance does not match the schema
+            jsonschema.SchemaError: If the schema itself is invalid
+        """
+        cached = self._validators.get(name)
+        if cached is not None and cached[0] is schema:
+            validator = cached[1]
+        else:
+            validator = self._compile(schema)
+            self._validators[name] = (schema, validator)
+        validator(instance)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop the cached validator for `name`, or every cached validator if no name is given."""
+        if name is None:
+            self._validators.clear()
+        else:
+            self._validators.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def _compile(self, schema: dict[str, Any]) -> Callable[[Any], None]:
+        cls = validators.validator_for(schema)
+        cls.check_schema(schema)
+        # The Validator protocol omits the default of `registry` that every validator class has
+        validator = cls(schema)  # pyright: ignore[reportCallIssue]
+
+        def check(instance: Any) -> None:
+            # Same error selection as jsonschema.validate
+            error: ValidationError | None = exceptions.best_match(validator.iter_errors(instance))  # type: ignore
+            if error is not None:
+                raise error
+
+        fastjsonschema = self._fastjsonschema
+        if fastjsonschema is None:
+            return check
+
+        try:
+            fast_check = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            return check
+
+        def compiled_check(instance: Any) -> None:
+            try:
+                fast_check(instance)
+            except fastjsonschema.JsonSchemaValueException:
+                # Let jsonschema have the final word and produce the usual error
+                check(instance)
+
+        return compiled_check
@@ -1,13 +1,14 @@
 import logging
 from collections.abc import Callable
 from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from datetime import timedelta
 from types import TracebackType
 from typing import Any, Generic, Protocol, TypeVar
 
 import anyio
 import httpx
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -43,12 +44,104 @@ ReceiveNotificationT = TypeVar("ReceiveNotificationT", ClientNotification, Serve
 RequestId = str | int
 
 
+class _PendingResponse:
+    """One-shot slot for the response to an outgoing request."""
+
+    __slots__ = ("_event", "response")
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self.response: JSONRPCResponse | JSONRPCError | None = None
+
+    def set(self, response: JSONRPCResponse | JSONRPCError) -> None:
+        if self.response is None:
+            self.response = response
+            self._event.set()
+
+    async def wait(self) -> JSONRPCResponse | JSONRPCError:
+        await self._event.wait()
+        assert self.response is not None
+        return self.response
+
+
 class ProgressFnT(Protocol):
     """Protocol for progress notification callbacks."""
 
     async def __call__(self, progress: float, total: float | None, message: str | None) -> None: ...
 
 
+@dataclass(frozen=True)
+class ProgressThrottle:
+    """Coalescing of progress updates by a `ProgressReporter`.
+
+    An update is passed on once at least `min_interval` seconds have passed since the
+    last one and progress has moved by at least `min_delta`. Other updates are held,
+    each replacing the one held before it, until an update is passed on or the
+    reporter is flushed. Updates that reach the total are always passed on.
+    """
+
+    min_interval: float = 0.0
+    """Minimum number of seconds between updates."""
+    min_delta: float = 0.0
+    """Minimum change in progress between updates."""
+
+    def __post_init__(self):
+        if self.min_interval < 0 or self.min_delta < 0:
+            raise ValueError("min_interval and min_delta must not be negative")
+
+
+class ProgressReporter:
+    """Progress callback that coalesces updates before passing them to another one.
+
+    Servers wrap their progress notifications in a reporter to limit how many are sent,
+    and clients wrap their progress callbacks to debounce them. Call `flush()` once
+    the operation is done so that a held update is not lost.
+    """
+
+    def __init__(self, callback: ProgressFnT, throttle: ProgressThrottle):
+        self.callback = callback
+        self.throttle = throttle
+        self.passed = 0
+        """Number of updates passed on to the callback."""
+        self.coalesced = 0
+        """Number of updates replaced by a later one."""
+        self._last_progress: float | None = None
+        self._last_time = 0.0
+        self._held: tuple[float, float | None, str | None] | None = None
+
+    async def __call__(self, progress: float, total: float | None, message: str | None) -> None:
+        now = anyio.current_time()
+        if not (
+            self._last_progress is None
+            or (total is not None and progress >= total)
+            or (
+                now - self._last_time >= self.throttle.min_interval
+                and abs(progress - self._last_progress) >= self.throttle.min_delta
+            )
+        ):
+            if self._held is not None:
+                self.coalesced += 1
+            self._held = (progress, total, message)
+            return
+
+        if self._held is not None:
+            self.coalesced += 1
+            self._held = None
+        await self._pass(progress, total, message, now)
+
+    async def flush(self) -> None:
+        """Pass on the held update, if there is one."""
+        if self._held is not None:
+            held, self._held = self._held, None
+            await self._pass(*held, anyio.current_time())
+
+    async def _pass(self, progress: float, total: float | None, message: str | None, now: float) -> None:
+        self._last_progress = progress
+        self._last_time = now
+        self.passed += 1
+        await self.callback(progress, total, message)
+
+
 class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     """Handles responding to MCP requests and manages request lifecycle.
 
@@ -93,7 +186,8 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     def __enter__(self) -> "RequestResponder[ReceiveRequestT, SendResultT]":
         """Enter the context manager, enabling request cancellation tracking."""
         self._entered = True
-        self._cancel_scope = anyio.CancelScope()
+        if not self._cancel_scope.cancel_called:
+            self._cancel_scope = anyio.CancelScope()
         self._cancel_scope.__enter__()
         return self
 
@@ -133,14 +227,18 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
             )
 
     async def cancel(self) -> None:
-        """Cancel this request and mark it as completed."""
-        if not self._entered:
-            raise RuntimeError("RequestResponder must be used as a context manager")
+        """Cancel this request and mark it as completed.
+
+        A request that has not started yet, for example one waiting for the server's
+        dispatcher, is answered now and must be skipped instead of handled.
+        """
         if not self._cancel_scope:
             raise RuntimeError("No active cancel scope")
 
         self._cancel_scope.cancel()
         self._completed = True  # Mark as completed so it's removed from in_flight
+        if not self._entered:
+            self._on_complete(self)
         # Send an error response to indicate cancellation
         await self._session._send_response(  # type: ignore[reportPrivateUsage]
             request_id=self.request_id,
@@ -173,15 +271,15 @@ class BaseSession(
     messages when entered.
     """
 
-    _response_streams: dict[RequestId, MemoryObjectSendStream[JSONRPCResponse | JSONRPCError]]
+    _pending_responses: dict[RequestId, _PendingResponse]
     _request_id: int
     _in_flight: dict[RequestId, RequestResponder[ReceiveRequestT, SendResultT]]
     _progress_callbacks: dict[RequestId, ProgressFnT]
 
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        read_stream: ObjectReceiveStream[SessionMessage | Exception],
+        write_stream: ObjectSendStream[SessionMessage],
         receive_request_type: type[ReceiveRequestT],
         receive_notification_type: type[ReceiveNotificationT],
         # If none, reading will never time out
@@ -189,7 +287,7 @@ class BaseSession(
     ) -> None:
         self._read_stream = read_stream
         self._write_stream = write_stream
-        self._response_streams = {}
+        self._pending_responses = {}
         self._request_id = 0
         self._receive_request_type = receive_request_type
         self._receive_notification_type = receive_notification_type
@@ -224,11 +322,14 @@ class BaseSession(
         request_read_timeout_seconds: timedelta | None = None,
         metadata: MessageMetadata = None,
         progress_callback: ProgressFnT | None = None,
+        progress_throttle: ProgressThrottle | None = None,
     ) -> ReceiveResultT:
         """
         Sends a request and wait for a response. Raises an McpError if the
         response contains an error. If a request read timeout is provided, it
-        will take precedence over the session read timeout.
+        will take precedence over the session read timeout. If a progress
+        throttle is provided, progress updates are coalesced before they are
+        passed to the progress callback.
 
         Do not use this method to emit notifications! Use send_notification()
         instead.
@@ -236,26 +337,29 @@ class BaseSession(
         request_id = self._request_id
         self._request_id = request_id + 1
 
-        response_stream, response_stream_reader = anyio.create_memory_object_stream[JSONRPCResponse | JSONRPCError](1)
-        self._response_streams[request_id] = response_stream
+        pending = _PendingResponse()
+        self._pending_responses[request_id] = pending
 
-        # Set up progress token if progress callback is provided
-        request_data = request.model_dump(by_alias=True, mode="json", exclude_none=True)
+        # Only the params need dumping; the progress token is added to the dumped dict
+        params = request.root.params
+        params_data = params.model_dump(by_alias=True, mode="json", exclude_none=True) if params is not None else None
+        reporter: ProgressReporter | None = None
         if progress_callback is not None:
+            if progress_throttle is not None:
+                progress_callback = reporter = ProgressReporter(progress_callback, progress_throttle)
             # Use request_id as progress token
-            if "params" not in request_data:
-                request_data["params"] = {}
-            if "_meta" not in request_data["params"]:
-                request_data["params"]["_meta"] = {}
-            request_data["params"]["_meta"]["progressToken"] = request_id
+            if params_data is None:
+                params_data = {}
+            params_data.setdefault("_meta", {})["progressToken"] = request_id
             # Store the callback for this request
             self._progress_callbacks[request_id] = progress_callback
 
         try:
-            jsonrpc_request = JSONRPCRequest(
+            jsonrpc_request = JSONRPCRequest.model_construct(
                 jsonrpc="2.0",
                 id=request_id,
-                **request_data,
+                method=request.root.method,
+                params=params_data,
             )
 
             await self._write_stream.send(SessionMessage(message=JSONRPCMessage(jsonrpc_request), metadata=metadata))
@@ -269,7 +373,9 @@ class BaseSession(
 
             try:
                 with anyio.fail_after(timeout):
-                    response_or_error = await response_stream_reader.receive()
+                    response_or_error = await pending.wait()
+                if reporter is not None:
+                    await self._flush_progress(reporter)
             except TimeoutError:
                 raise McpError(
                     ErrorData(
@@ -288,10 +394,14 @@ class BaseSession(
                 return result_type.model_validate(response_or_error.result)
 
         finally:
-            self._response_streams.pop(request_id, None)
+            self._pending_responses.pop(request_id, None)
             self._progress_callbacks.pop(request_id, None)
-            await response_stream.aclose()
-            await response_stream_reader.aclose()
+
+    async def _flush_progress(self, reporter: ProgressReporter) -> None:
+        try:
+            await reporter.flush()
+        except Exception as e:
+            logging.error("Progress callback raised an exception: %s", e)
 
     async def send_notification(
         self,
@@ -315,18 +425,21 @@ class BaseSession(
         await self._write_stream.send(session_message)
 
     async def _send_response(self, request_id: RequestId, response: SendResultT | ErrorData) -> None:
+        await self._write_stream.send(self._response_message(request_id, response))
+
+    def _response_message(self, request_id: RequestId, response: SendResultT | ErrorData) -> SessionMessage:
         if isinstance(response, ErrorData):
             jsonrpc_error = JSONRPCError(jsonrpc="2.0", id=request_id, error=response)
-            session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_error))
-            await self._write_stream.send(session_message)
-        else:
-            jsonrpc_response = JSONRPCResponse(
-                jsonrpc="2.0",
-                id=request_id,
-                result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
-            )
-            session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_response))
-            await self._write_stream.send(session_message)
+            return SessionMessage(message=JSONRPCMessage(jsonrpc_error))
+        # Not the JSON codec: this only converts the result for the envelope, and the
+        # transport's codec serializes the whole message once. Encoding here and parsing
+        # the result back would cost more than the conversion.
+        jsonrpc_response = JSONRPCResponse(
+            jsonrpc="2.0",
+            id=request_id,
+            result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
+        )
+        return SessionMessage(message=JSONRPCMessage(jsonrpc_response))
 
     async def _receive_loop(self) -> None:
         async with (
@@ -340,7 +453,7 @@ class BaseSession(
                     elif isinstance(message.message.root, JSONRPCRequest):
                         try:
                             validated_request = self._receive_request_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
+                                _typed_message_data(message.message.root)
                             )
                             responder = RequestResponder(
                                 request_id=message.message.root.id,
@@ -377,7 +490,7 @@ class BaseSession(
                     elif isinstance(message.message.root, JSONRPCNotification):
                         try:
                             notification = self._receive_notification_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
+                                _typed_message_data(message.message.root)
                             )
                             # Handle cancellation notifications
                             if isinstance(notification.root, CancelledNotification):
@@ -411,9 +524,9 @@ class BaseSession(
                                 f"Failed to validate notification: {e}. Message was: {message.message.root}"
                             )
                     else:  # Response or error
-                        stream = self._response_streams.pop(message.message.root.id, None)
-                        if stream:
-                            await stream.send(message.message.root)
+                        pending = self._pending_responses.pop(message.message.root.id, None)
+                        if pending:
+                            pending.set(message.message.root)
                         else:
                             await self._handle_incoming(
                                 RuntimeError(f"Received response with an unknown request ID: {message}")
@@ -431,15 +544,10 @@ class BaseSession(
             finally:
                 # after the read stream is closed, we need to send errors
                 # to any pending requests
-                for id, stream in self._response_streams.items():
+                for id, pending in self._pending_responses.items():
                     error = ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
-                    try:
-                        await stream.send(JSONRPCError(jsonrpc="2.0", id=id, error=error))
-                        await stream.aclose()
-                    except Exception:
-                        # Stream might already be closed
-                        pass
-                self._response_streams.clear()
+                    pending.set(JSONRPCError(jsonrpc="2.0", id=id, error=error))
+                self._pending_responses.clear()
 
     async def _received_request(self, responder: RequestResponder[ReceiveRequestT, SendResultT]) -> None:
         """
@@ -474,3 +582,16 @@ class BaseSession(
     ) -> None:
         """A generic handler for incoming messages. Overwritten by subclasses."""
         pass
+
+
+def _typed_message_data(message: JSONRPCRequest | JSONRPCNotification) -> dict[str, Any]:
+    """Return the method and params of a wire message for validation as a typed request or notification.
+
+    The params are still the JSON values decoded by the transport, so they are passed on
+    as they are instead of dumping the whole message again. The typed unions are
+    discriminated by method, so only the model for that method validates them.
+    """
+    data: dict[str, Any] = {"method": message.method}
+    if message.params is not None:
+        data["params"] = message.params
+    return data
@@ -0,0 +1,225 @@
+"""Buffered memory object streams between transports and sessions.
+
+By default transports hand every message from one task to another through a
+zero-capacity memory stream, so each message costs a task switch on both sides.
+`create_message_stream` creates streams that buffer up to `StreamBuffer.max_buffer_size`
+messages (the high-water mark). Once a sender finds the buffer full, senders stay
+paused until the receiver has drained it down to `low_water_mark`, so a fast
+producer and a slower consumer alternate in batches instead of message by message.
+
+The streams wrap a pair created by `anyio.create_memory_object_stream` and only use
+its public API. Both ends report their buffer depth through `buffer_statistics()`.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TypeVar
+
+import anyio
+import anyio.lowlevel
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream, MemoryObjectStreamStatistics
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class StreamBuffer:
+    """Buffering of a memory stream."""
+
+    max_buffer_size: int = 0
+    """Number of messages buffered before senders are paused (the high-water mark)."""
+    low_water_mark: int | None = None
+    """Buffer depth at which paused senders resume (defaults to half of max_buffer_size)."""
+
+    def __post_init__(self):
+        if self.max_buffer_size < 0:
+            raise ValueError("max_buffer_size must not be negative")
+        if self.low_water_mark is not None and not 0 <= self.low_water_mark <= self.max_buffer_size:
+            raise ValueError("low_water_mark must be between 0 and max_buffer_size")
+
+
+@dataclass(frozen=True)
+class StreamBufferStatistics:
+    """Point-in-time statistics for a buffered message stream."""
+
+    max_buffer_size: int
+    """Number of messages buffered before senders are paused."""
+    low_water_mark: int
+    """Buffer depth at which paused senders resume."""
+    depth: int
+    """Number of messages currently in the buffer."""
+    peak_depth: int
+    """Largest number of messages that have been in the buffer at once."""
+    sent: int
+    """Number of messages sent through the stream."""
+    pauses: int
+    """Number of times senders were paused because the buffer was full."""
+    senders_waiting: int
+    """Number of tasks currently waiting to send."""
+
+
+class _Watermarks:
+    def __init__(self, stream_statistics: Callable[[], MemoryObjectStreamStatistics], buffer: StreamBuffer):
+        self.stream_statistics = stream_statistics
+        self.max_buffer_size = buffer.max_buffer_size
+        if buffer.low_water_mark is None:
+            self.low_water_mark = buffer.max_buffer_size // 2
+        else:
+            self.low_water_mark = buffer.low_water_mark
+        self.peak_depth = 0
+        self.sent = 0
+        self.pauses = 0
+        self.resumed: anyio.Event | None = None
+
+    def received(self) -> None:
+        if self.resumed is None:
+            return
+        stats = self.stream_statistics()
+        if stats.current_buffer_used <= self.low_water_mark or not stats.open_receive_streams:
+            self.resume()
+
+    def resume(self) -> None:
+        if self.resumed is not None:
+            self.resumed.set()
+            self.resumed = None
+
+    def statistics(self) -> StreamBufferStatistics:
+        stats = self.stream_statistics()
+        return StreamBufferStatistics(
+            max_buffer_size=self.max_buffer_size,
+            low_water_mark=self.low_water_mark,
+            depth=stats.current_buffer_used,
+            peak_depth=self.peak_depth,
+            sent=self.sent,
+            pauses=self.pauses,
+            senders_waiting=stats.tasks_waiting_send,
+        )
+
+
+class BufferedSendStream(ObjectSendStream[T]):
+    """Sending end of a stream created by `create_message_stream`."""
+
+    def __init__(self, stream: MemoryObjectSendStream[T], watermarks: _Watermarks):
+        self._stream = stream
+        self._watermarks = watermarks
+
+    def send_nowait(self, item: T) -> None:
+        self._stream.send_nowait(item)
+        self._sent()
+
+    async def send(self, item: T) -> None:
+        watermarks = self._watermarks
+        while watermarks.resumed is not None:
+            await watermarks.resumed.wait()
+
+        await anyio.lowlevel.checkpoint()
+        try:
+            self._stream.send_nowait(item)
+        except anyio.WouldBlock:
+            if watermarks.max_buffer_size:
+                watermarks.pauses += 1
+                watermarks.resumed = anyio.Event()
+            await self._stream.send(item)
+        self._sent()
+
+    def _sent(self) -> None:
+        watermarks = self._watermarks
+        watermarks.sent += 1
+        watermarks.peak_depth = max(watermarks.peak_depth, self._stream.statistics().current_buffer_used)
+
+    def clone(self) -> "BufferedSendStream[T]":
+        return BufferedSendStream(self._stream.clone(), self._watermarks)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def statistics(self) -> MemoryObjectStreamStatistics:
+        return self._stream.statistics()
+
+    def buffer_statistics(self) -> StreamBufferStatistics:
+        return self._watermarks.statistics()
+
+    def __enter__(self) -> "BufferedSendStream[T]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class BufferedReceiveStream(ObjectReceiveStream[T]):
+    """Receiving end of a stream created by `create_message_stream`."""
+
+    def __init__(self, stream: MemoryObjectReceiveStream[T], watermarks: _Watermarks):
+        self._stream = stream
+        self._watermarks = watermarks
+
+    def receive_nowait(self) -> T:
+        try:
+            return self._stream.receive_nowait()
+        finally:
+            self._watermarks.received()
+
+    async def receive(self) -> T:
+        try:
+            return await self._stream.receive()
+        finally:
+            self._watermarks.received()
+
+    def clone(self) -> "BufferedReceiveStream[T]":
+        return BufferedReceiveStream(self._stream.clone(), self._watermarks)
+
+    def close(self) -> None:
+        self._stream.close()
+        # Paused senders must not wait for a receiver that is gone
+        self._watermarks.received()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def statistics(self) -> MemoryObjectStreamStatistics:
+        return self._stream.statistics()
+
+    def buffer_statistics(self) -> StreamBufferStatistics:
+        return self._watermarks.statistics()
+
+    def __enter__(self) -> "BufferedReceiveStream[T]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class create_message_stream(tuple[BufferedSendStream[T], BufferedReceiveStream[T]]):
+    """Create a memory object stream with high/low-water mark backpressure.
+
+    Used like `anyio.create_memory_object_stream`, including the item type subscript:
+    `create_message_stream[SessionMessage](StreamBuffer(100))`.
+
+    Args:
+        buffer: Buffer settings, or the maximum buffer size with the default low-water mark
+    """
+
+    def __new__(  # type: ignore[misc]
+        cls, buffer: StreamBuffer | int = 0
+    ) -> tuple[BufferedSendStream[T], BufferedReceiveStream[T]]:
+        if isinstance(buffer, int):
+            buffer = StreamBuffer(buffer)
+        send_stream, receive_stream = anyio.create_memory_object_stream[T](buffer.max_buffer_size)
+        watermarks = _Watermarks(send_stream.statistics, buffer)
+
+        return BufferedSendStream(send_stream, watermarks), BufferedReceiveStream(receive_stream, watermarks)
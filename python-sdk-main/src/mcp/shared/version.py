@@ -1,3 +1,6 @@
 from mcp.types import LATEST_PROTOCOL_VERSION
 
 SUPPORTED_PROTOCOL_VERSIONS: list[str] = ["2024-11-05", "2025-03-26", LATEST_PROTOCOL_VERSION]
+
+BATCH_PROTOCOL_VERSIONS: list[str] = ["2025-03-26"]
+"""Protocol versions that allow JSON-RPC batches; 2025-06-18 removed them."""
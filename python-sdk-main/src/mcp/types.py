@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from typing import Annotated, Any, Generic, Literal, TypeAlias, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, FileUrl, RootModel
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, FileUrl, RootModel, Tag
 from pydantic.networks import AnyUrl, UrlConstraints
 from typing_extensions import deprecated
 
@@ -149,6 +149,7 @@ class JSONRPCResponse(BaseModel):
 # SDK error codes
 CONNECTION_CLOSED = -32000
 # REQUEST_TIMEOUT = -32001  # the typescript sdk uses this
+SERVER_BUSY = -32003
 
 # Standard JSON-RPC error codes
 PARSE_ERROR = -32700
@@ -188,10 +189,44 @@ class JSONRPCError(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
-class JSONRPCMessage(RootModel[JSONRPCRequest | JSONRPCNotification | JSONRPCResponse | JSONRPCError]):
+def _jsonrpc_message_kind(value: Any) -> str | None:
+    """Tell the kind of a JSON-RPC message from its members, so it is validated against one model only."""
+    if isinstance(value, dict):
+        if "method" in value:
+            return "request" if "id" in value else "notification"
+        return "error" if "error" in value else "response"
+    for kind, model in _JSONRPC_MESSAGE_MODELS.items():
+        if isinstance(value, model):
+            return kind
+    return None
+
+
+_JSONRPC_MESSAGE_MODELS: dict[str, type[BaseModel]] = {
+    "request": JSONRPCRequest,
+    "notification": JSONRPCNotification,
+    "response": JSONRPCResponse,
+    "error": JSONRPCError,
+}
+
+
+class JSONRPCMessage(
+    RootModel[
+        Annotated[
+            Annotated[JSONRPCRequest, Tag("request")]
+            | Annotated[JSONRPCNotification, Tag("notification")]
+            | Annotated[JSONRPCResponse, Tag("response")]
+            | Annotated[JSONRPCError, Tag("error")],
+            Discriminator(_jsonrpc_message_kind),
+        ]
+    ]
+):
     pass
 
 
+class JSONRPCBatch(RootModel[Annotated[list[JSONRPCMessage], Field(min_length=1)]]):
+    """A non-empty array of JSON-RPC messages sent as a single unit."""
+
+
 class EmptyResult(Result):
     """A response that indicates success but carries no data."""
 
@@ -1249,26 +1284,34 @@ class CancelledNotification(Notification[CancelledNotificationParams, Literal["n
 
 class ClientRequest(
     RootModel[
-        PingRequest
-        | InitializeRequest
-        | CompleteRequest
-        | SetLevelRequest
-        | GetPromptRequest
-        | ListPromptsRequest
-        | ListResourcesRequest
-        | ListResourceTemplatesRequest
-        | ReadResourceRequest
-        | SubscribeRequest
-        | UnsubscribeRequest
-        | CallToolRequest
-        | ListToolsRequest
+        Annotated[
+            PingRequest
+            | InitializeRequest
+            | CompleteRequest
+            | SetLevelRequest
+            | GetPromptRequest
+            | ListPromptsRequest
+            | ListResourcesRequest
+            | ListResourceTemplatesRequest
+            | ReadResourceRequest
+            | SubscribeRequest
+            | UnsubscribeRequest
+            | CallToolRequest
+            | ListToolsRequest,
+            Field(discriminator="method"),
+        ]
     ]
 ):
     pass
 
 
 class ClientNotification(
-    RootModel[CancelledNotification | ProgressNotification | InitializedNotification | RootsListChangedNotification]
+    RootModel[
+        Annotated[
+            CancelledNotification | ProgressNotification | InitializedNotification | RootsListChangedNotification,
+            Field(discriminator="method"),
+        ]
+    ]
 ):
     pass
 
@@ -1315,19 +1358,29 @@ class ClientResult(RootModel[EmptyResult | CreateMessageResult | ListRootsResult
     pass
 
 
-class ServerRequest(RootModel[PingRequest | CreateMessageRequest | ListRootsRequest | ElicitRequest]):
+class ServerRequest(
+    RootModel[
+        Annotated[
+            PingRequest | CreateMessageRequest | ListRootsRequest | ElicitRequest,
+            Field(discriminator="method"),
+        ]
+    ]
+):
     pass
 
 
 class ServerNotification(
     RootModel[
-        CancelledNotification
-        | ProgressNotification
-        | LoggingMessageNotification
-        | ResourceUpdatedNotification
-        | ResourceListChangedNotification
-        | ToolListChangedNotification
-        | PromptListChangedNotification
+        Annotated[
+            CancelledNotification
+            | ProgressNotification
+            | LoggingMessageNotification
+            | ResourceUpdatedNotification
+            | ResourceListChangedNotification
+            | ToolListChangedNotification
+            | PromptListChangedNotification,
+            Field(discriminator="method"),
+        ]
     ]
 ):
     pass
@@ -5,6 +5,7 @@ Tests for refactored OAuth client authentication implementation.
 import time
 from unittest import mock
 
+import anyio
 import httpx
 import pytest
 from inline_snapshot import Is, snapshot
@@ -861,6 +862,81 @@ class TestAuthFlow:
         # Verify exactly one request was yielded (no double-sending)
         assert request_yields == 1, f"Expected 1 request yield, got {request_yields}"
 
+    @pytest.mark.anyio
+    async def test_requests_with_valid_tokens_do_not_hold_lock(
+        self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken
+    ):
+        """Test that a request in flight does not block other requests that already have a valid token."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() + 1800
+        oauth_provider._initialized = True
+
+        first_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/first"))
+        second_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/second"))
+
+        first_request = await first_flow.__anext__()
+        # The first request is still in flight, the second must not wait for it
+        with anyio.fail_after(1):
+            second_request = await second_flow.__anext__()
+
+        assert first_request.headers["Authorization"] == "Bearer test_access_token"
+        assert second_request.headers["Authorization"] == "Bearer test_access_token"
+        assert not oauth_provider.context.lock.locked()
+
+        for flow, request in ((first_flow, first_request), (second_flow, second_request)):
+            with pytest.raises(StopAsyncIteration):
+                await flow.asend(httpx.Response(200, request=request))
+
+    @pytest.mark.anyio
+    async def test_401_retries_with_token_obtained_by_concurrent_request(
+        self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken
+    ):
+        """Test that a 401 does not re-run the OAuth flow if another request already replaced the token."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() + 1800
+        oauth_provider._initialized = True
+
+        test_request = httpx.Request("GET", "https://api.example.com/mcp")
+        auth_flow = oauth_provider.async_auth_flow(test_request)
+        request = await auth_flow.__anext__()
+        assert request.headers["Authorization"] == "Bearer test_access_token"
+
+        # Meanwhile, a concurrent request re-authorized and stored a new token
+        oauth_provider.context.current_tokens = OAuthToken(
+            access_token="new_access_token", token_type="Bearer", expires_in=3600
+        )
+
+        retry_request = await auth_flow.asend(httpx.Response(401, request=request))
+        assert retry_request.headers["Authorization"] == "Bearer new_access_token"
+        assert str(retry_request.url) == "https://api.example.com/mcp"
+
+        with pytest.raises(StopAsyncIteration):
+            await auth_flow.asend(httpx.Response(200, request=retry_request))
+
+    @pytest.mark.anyio
+    async def test_concurrent_requests_throughput(self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken):
+        """Test that concurrent requests through one provider overlap instead of running one at a time."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() + 1800
+        oauth_provider._initialized = True
+
+        latency = 0.2
+        concurrency = 10
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await anyio.sleep(latency)
+            return httpx.Response(200, request=request)
+
+        async with httpx.AsyncClient(auth=oauth_provider, transport=httpx.MockTransport(handler)) as client:
+            start = time.perf_counter()
+            async with anyio.create_task_group() as tg:
+                for _ in range(concurrency):
+                    tg.start_soon(client.get, "https://api.example.com/mcp")
+            elapsed = time.perf_counter() - start
+
+        # Serialized requests would take concurrency * latency
+        assert elapsed < concurrency * latency / 2
+
     @pytest.mark.anyio
     async def test_403_insufficient_scope_updates_scope_from_header(
         self,
@@ -0,0 +1,103 @@
+import anyio
+import pytest
+
+from mcp import types
+from mcp.client.list_cache import ListCache
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.session import ServerSession
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+@pytest.mark.anyio
+async def test_list_cache_invalidated_by_list_changed():
+    server = FastMCP("test")
+
+    @server.tool()
+    def greet(name: str) -> str:
+        return f"Hello, {name}"
+
+    @server.tool()
+    async def add_tool(ctx: Context[ServerSession, None]) -> str:
+        server.add_tool(lambda: "new", name="new_tool")
+        await ctx.session.send_tool_list_changed()
+        return "added"
+
+    @server.prompt()
+    def hello() -> str:
+        return "Hello"
+
+    cache = ListCache()
+    async with create_connected_server_and_client_session(server, list_cache=cache) as client:
+        assert client.list_cache is cache
+
+        first = await client.list_tools()
+        second = await client.list_tools()
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert set(cache.tools_by_name) == {"greet", "add_tool"}
+
+        await client.list_prompts()
+        await client.list_prompts()
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # Requests with metadata are not answered from the cache.
+        await client.list_tools(params=types.PaginatedRequestParams.model_validate({"_meta": {"trace": "1"}}))
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        await client.call_tool("add_tool", {})
+        with anyio.fail_after(5):
+            while cache.tools_by_name:
+                await anyio.sleep(0.01)
+
+        tools = await client.list_tools()
+        assert {tool.name for tool in tools.tools} == {"greet", "add_tool", "new_tool"}
+        assert set(cache.tools_by_name) == {"greet", "add_tool", "new_tool"}
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        # Other listings are unaffected by a tool list change.
+        await client.list_prompts()
+        assert (cache.hits, cache.misses) == (3, 3)
+
+
+@pytest.mark.anyio
+async def test_list_cache_pages_and_expiry(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("mcp.client.list_cache.time.monotonic", lambda: now)
+    cache = ListCache(ttl=10)
+    fetches: list[str | None] = []
+
+    def fetcher(cursor: str | None):
+        async def fetch() -> types.ListToolsResult:
+            fetches.append(cursor)
+            return types.ListToolsResult(
+                tools=[types.Tool(name=f"tool_{cursor}", inputSchema={})],
+                nextCursor="2" if cursor is None else None,
+            )
+
+        return fetch
+
+    await cache.get_or_fetch("tools/list", None, fetcher(None))
+    await cache.get_or_fetch("tools/list", "2", fetcher("2"))
+    await cache.get_or_fetch("tools/list", None, fetcher(None))
+    await cache.get_or_fetch("tools/list", "2", fetcher("2"))
+    assert fetches == [None, "2"]
+    assert set(cache.tools_by_name) == {"tool_None", "tool_2"}
+
+    now += 10
+    await cache.get_or_fetch("tools/list", None, fetcher(None))
+    assert fetches == [None, "2", None]
+
+    # A listing fetched while the cache is invalidated is returned but not stored.
+    async def fetch_during_invalidation() -> types.ListToolsResult:
+        cache.invalidate()
+        return types.ListToolsResult(tools=[])
+
+    await cache.get_or_fetch("tools/list", "2", fetch_during_invalidation)
+    assert not cache.tools_by_name
+    await cache.get_or_fetch("tools/list", "2", fetcher("2"))
+    assert fetches == [None, "2", None, "2"]
+
+
+def test_list_cache_rejects_non_positive_ttl():
+    with pytest.raises(ValueError):
+        ListCache(ttl=0)
@@ -3,6 +3,7 @@ from typing import Literal
 import pytest
 
 import mcp.types as types
+from mcp.server.session import ServerSession
 from mcp.shared.memory import (
     create_connected_server_and_client_session as create_session,
 )
@@ -81,3 +82,65 @@ async def test_logging_callback():
         assert log.level == "info"
         assert log.logger == "test_logger"
         assert log.data == "Test log message"
+
+
+@pytest.mark.anyio
+async def test_log_messages_below_level_are_dropped():
+    from mcp.server.fastmcp import Context, FastMCP
+
+    server = FastMCP("test")
+    logging_collector = LoggingCollector()
+
+    @server.tool("log_all_levels")
+    async def log_all_levels(ctx: Context[ServerSession, None]) -> bool:
+        await ctx.debug("debug message")
+        await ctx.info("info message")
+        await ctx.warning("warning message")
+        await ctx.error("error message")
+        return True
+
+    async with create_session(server._mcp_server, logging_callback=logging_collector) as client_session:
+        capabilities = client_session.get_server_capabilities()
+        assert capabilities is not None and capabilities.logging is not None
+
+        await client_session.call_tool("log_all_levels", {})
+        assert [log.level for log in logging_collector.log_messages] == ["debug", "info", "warning", "error"]
+
+        logging_collector.log_messages.clear()
+        await client_session.set_logging_level("warning")
+        await client_session.call_tool("log_all_levels", {})
+        assert [log.level for log in logging_collector.log_messages] == ["warning", "error"]
+
+
+@pytest.mark.anyio
+async def test_log_rate_limit():
+    from mcp.server.fastmcp import Context, FastMCP
+    from mcp.server.session import LogRateLimit
+
+    server = FastMCP("test", log_rate_limit=LogRateLimit(max_messages=3, period=60))
+    logging_collector = LoggingCollector()
+    sessions: list[ServerSession] = []
+
+    @server.tool("chatty")
+    async def chatty(ctx: Context[ServerSession, None]) -> bool:
+        sessions.append(ctx.session)
+        for i in range(10):
+            await ctx.info(f"message {i}")
+        return True
+
+    async with create_session(server._mcp_server, logging_callback=logging_collector) as client_session:
+        await client_session.call_tool("chatty", {})
+        await client_session.call_tool("chatty", {})
+
+    # Each request gets its own allowance
+    assert [log.data for log in logging_collector.log_messages] == ["message 0", "message 1", "message 2"] * 2
+    assert sessions[0].log_messages_dropped == 14
+
+
+def test_invalid_log_rate_limit():
+    from mcp.server.session import LogRateLimit
+
+    with pytest.raises(ValueError):
+        LogRateLimit(max_messages=0)
+    with pytest.raises(ValueError):
+        LogRateLimit(max_messages=1, period=0)
@@ -13,14 +13,14 @@ from mcp.types import Tool
 
 
 @contextmanager
-def bypass_server_output_validation():
+def bypass_server_output_validation(server: Server):
     """
     Context manager that bypasses server-side output validation.
     This simulates a malicious or non-compliant server that doesn't validate
     its outputs, allowing us to test client-side validation.
     """
-    # Patch jsonschema.validate in the server module to disable all validation
-    with patch("mcp.server.lowlevel.server.jsonschema.validate"):
+    # Patch the server's output validator cache to disable all validation
+    with patch.object(server._output_validators, "validate"):
         # The mock will simply return None (do nothing) for all validation calls
         yield
 
@@ -60,7 +60,7 @@ class TestClientOutputSchemaValidation:
             return {"name": "John", "age": "invalid"}  # Invalid: age should be int
 
         # Test that client validates the structured content
-        with bypass_server_output_validation():
+        with bypass_server_output_validation(server):
             async with client_session(server) as client:
                 # The client validates structured content and should raise an error
                 with pytest.raises(RuntimeError) as exc_info:
@@ -97,13 +97,48 @@ class TestClientOutputSchemaValidation:
             # Return invalid structured content - result is string instead of integer
             return {"result": "not_a_number"}  # Invalid: should be int
 
-        with bypass_server_output_validation():
+        with bypass_server_output_validation(server):
             async with client_session(server) as client:
                 # The client validates structured content and should raise an error
                 with pytest.raises(RuntimeError) as exc_info:
                     await client.call_tool("calculate", {})
                 assert "Invalid structured content returned by tool calculate" in str(exc_info.value)
 
+    @pytest.mark.anyio
+    async def test_call_tools_client_side_validation(self):
+        """Test that call_tools raises validation errors as they are, not in an ExceptionGroup"""
+        server = Server("test-server")
+
+        output_schema = {
+            "type": "object",
+            "properties": {"result": {"type": "integer", "title": "Result"}},
+            "required": ["result"],
+            "title": "calculate_Output",
+        }
+
+        @server.list_tools()
+        async def list_tools():
+            return [
+                Tool(
+                    name="calculate",
+                    description="Calculate something",
+                    inputSchema={"type": "object"},
+                    outputSchema=output_schema,
+                )
+            ]
+
+        @server.call_tool()
+        async def call_tool(name: str, arguments: dict[str, Any]):
+            if arguments.get("valid"):
+                return {"result": 42}
+            return {"result": "not_a_number"}  # Invalid: should be int
+
+        with bypass_server_output_validation(server):
+            async with client_session(server) as client:
+                with pytest.raises(RuntimeError) as exc_info:
+                    await client.call_tools([("calculate", {"valid": True}), ("calculate", {})])
+                assert "Invalid structured content returned by tool calculate" in str(exc_info.value)
+
     @pytest.mark.anyio
     async def test_tool_structured_output_client_side_validation_dict_typed(self):
         """Test that client validates dict[str, T] structured content"""
@@ -128,7 +163,7 @@ class TestClientOutputSchemaValidation:
             # Return invalid structured content - values should be integers
             return {"alice": "100", "bob": "85"}  # Invalid: values should be int
 
-        with bypass_server_output_validation():
+        with bypass_server_output_validation(server):
             async with client_session(server) as client:
                 # The client validates structured content and should raise an error
                 with pytest.raises(RuntimeError) as exc_info:
@@ -163,7 +198,7 @@ class TestClientOutputSchemaValidation:
             # Return structured content missing required field 'email'
             return {"name": "John", "age": 30}  # Missing required 'email'
 
-        with bypass_server_output_validation():
+        with bypass_server_output_validation(server):
             async with client_session(server) as client:
                 # The client validates structured content and should raise an error
                 with pytest.raises(RuntimeError) as exc_info:
@@ -188,7 +223,7 @@ class TestClientOutputSchemaValidation:
         # Set logging level to capture warnings
         caplog.set_level(logging.WARNING)
 
-        with bypass_server_output_validation():
+        with bypass_server_output_validation(server):
             async with client_session(server) as client:
                 # Call a tool that wasn't listed
                 result = await client.call_tool("mystery_tool", {})
@@ -41,17 +41,17 @@ async def test_send_request_stream_cleanup():
     async def mock_send(*args: Any, **kwargs: Any):
         raise RuntimeError("Simulated network error")
 
-    # Record the response streams before the test
-    initial_stream_count = len(session._response_streams)
+    # Record the pending responses before the test
+    initial_stream_count = len(session._pending_responses)
 
     # Run the test with the patched method
     with patch.object(session._write_stream, "send", mock_send):
         with pytest.raises(RuntimeError):
             await session.send_request(request, EmptyResult)
 
-    # Verify that no response streams were leaked
-    assert len(session._response_streams) == initial_stream_count, (
-        f"Expected {initial_stream_count} response streams after request, but found {len(session._response_streams)}"
+    # Verify that no pending responses were leaked
+    assert len(session._pending_responses) == initial_stream_count, (
+        f"Expected {initial_stream_count} pending responses after request, but found {len(session._pending_responses)}"
     )
 
     # Clean up
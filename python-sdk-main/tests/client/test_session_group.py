@@ -1,13 +1,38 @@
 import contextlib
 from unittest import mock
 
+import anyio
 import pytest
 
 import mcp
 from mcp import types
-from mcp.client.session_group import ClientSessionGroup, SseServerParameters, StreamableHttpParameters
+from mcp.client.session_group import (
+    ClientSessionGroup,
+    ReplicaPolicy,
+    SseServerParameters,
+    StreamableHttpParameters,
+)
 from mcp.client.stdio import StdioServerParameters
+from mcp.server.fastmcp import FastMCP
 from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+def _memory_session_opener(servers: dict[str, FastMCP]):
+    """Stands in for ClientSessionGroup._open_session, connecting to in-memory servers by command."""
+
+    async def open_session(
+        server_params: StdioServerParameters, session_stack: contextlib.AsyncExitStack
+    ) -> tuple[types.Implementation, mcp.ClientSession]:
+        if server_params.command not in servers:
+            raise ConnectionError(f"{server_params.command} is down")
+        server = servers[server_params.command]
+        session = await session_stack.enter_async_context(
+            create_connected_server_and_client_session(server._mcp_server)
+        )
+        return types.Implementation(name=server.name, version="1"), session
+
+    return open_session
 
 
 @pytest.fixture
@@ -87,9 +112,9 @@ class TestClientSessionGroup:
         mock_resource1.name = "resource_b"
         mock_prompt1 = mock.Mock(spec=types.Prompt)
         mock_prompt1.name = "prompt_c"
-        mock_session.list_tools.return_value = mock.AsyncMock(tools=[mock_tool1])
-        mock_session.list_resources.return_value = mock.AsyncMock(resources=[mock_resource1])
-        mock_session.list_prompts.return_value = mock.AsyncMock(prompts=[mock_prompt1])
+        mock_session.list_tools.return_value = mock.AsyncMock(tools=[mock_tool1], nextCursor=None)
+        mock_session.list_resources.return_value = mock.AsyncMock(resources=[mock_resource1], nextCursor=None)
+        mock_session.list_prompts.return_value = mock.AsyncMock(prompts=[mock_prompt1], nextCursor=None)
 
         # --- Test Execution ---
         group = ClientSessionGroup(exit_stack=mock_exit_stack)
@@ -120,9 +145,9 @@ class TestClientSessionGroup:
         mock_session = mock.AsyncMock(spec=mcp.ClientSession)
         mock_tool = mock.Mock(spec=types.Tool)
         mock_tool.name = "base_tool"
-        mock_session.list_tools.return_value = mock.AsyncMock(tools=[mock_tool])
-        mock_session.list_resources.return_value = mock.AsyncMock(resources=[])
-        mock_session.list_prompts.return_value = mock.AsyncMock(prompts=[])
+        mock_session.list_tools.return_value = mock.AsyncMock(tools=[mock_tool], nextCursor=None)
+        mock_session.list_resources.return_value = mock.AsyncMock(resources=[], nextCursor=None)
+        mock_session.list_prompts.return_value = mock.AsyncMock(prompts=[], nextCursor=None)
 
         # --- Test Setup ---
         def name_hook(name: str, server_info: types.Implementation) -> str:
@@ -225,10 +250,10 @@ class TestClientSessionGroup:
         # Configure the new session to return a tool with the *same name*
         duplicate_tool = mock.Mock(spec=types.Tool)
         duplicate_tool.name = existing_tool_name
-        mock_session_new.list_tools.return_value = mock.AsyncMock(tools=[duplicate_tool])
+        mock_session_new.list_tools.return_value = mock.AsyncMock(tools=[duplicate_tool], nextCursor=None)
         # Keep other lists empty for simplicity
-        mock_session_new.list_resources.return_value = mock.AsyncMock(resources=[])
-        mock_session_new.list_prompts.return_value = mock.AsyncMock(prompts=[])
+        mock_session_new.list_resources.return_value = mock.AsyncMock(resources=[], nextCursor=None)
+        mock_session_new.list_prompts.return_value = mock.AsyncMock(prompts=[], nextCursor=None)
 
         # --- Test Execution and Assertion ---
         with pytest.raises(McpError) as excinfo:
@@ -364,3 +389,174 @@ class TestClientSessionGroup:
                 # 3. Assert returned values
                 assert returned_server_info is mock_initialize_result.serverInfo
                 assert returned_session is mock_entered_session
+
+    async def test_aggregate_components_follows_pagination(self, mock_exit_stack: contextlib.AsyncExitStack):
+        """Test that every page of each component list is aggregated."""
+        server_info = types.Implementation(name="PagedServer", version="1")
+        mock_session = mock.AsyncMock(spec=mcp.ClientSession)
+        mock_session.list_tools.side_effect = [
+            types.ListToolsResult(tools=[types.Tool(name="tool_1", inputSchema={})], nextCursor="page-2"),
+            types.ListToolsResult(tools=[types.Tool(name="tool_2", inputSchema={})]),
+        ]
+        mock_session.list_resources.return_value = types.ListResourcesResult(resources=[])
+        mock_session.list_prompts.side_effect = [
+            types.ListPromptsResult(prompts=[types.Prompt(name="prompt_1")], nextCursor="page-2"),
+            # A server repeating its cursor must not be listed forever.
+            types.ListPromptsResult(prompts=[types.Prompt(name="prompt_2")], nextCursor="page-2"),
+        ]
+
+        group = ClientSessionGroup(exit_stack=mock_exit_stack)
+        await group.connect_with_session(server_info, mock_session)
+
+        assert set(group.tools) == {"tool_1", "tool_2"}
+        assert set(group.prompts) == {"prompt_1", "prompt_2"}
+        assert mock_session.list_tools.await_args_list == [
+            mock.call(params=None),
+            mock.call(params=types.PaginatedRequestParams(cursor="page-2")),
+        ]
+        assert mock_session.list_prompts.await_count == 2
+
+    async def test_connect_to_servers(self):
+        """Test connecting to several servers concurrently, tolerating failures."""
+
+        def make_server(name: str) -> FastMCP:
+            server = FastMCP(name)
+
+            @server.tool(name=f"{name}_tool")
+            def tool() -> str:
+                return name
+
+            return server
+
+        open_session = _memory_session_opener({name: make_server(name) for name in ("alpha", "beta")})
+        server_params = [StdioServerParameters(command=name) for name in ("alpha", "down", "beta")]
+        async with ClientSessionGroup() as group:
+            with mock.patch.object(group, "_open_session", side_effect=open_session):
+                connections = await group.connect_to_servers(server_params, max_concurrency=2)
+
+            assert [connection.server_params for connection in connections] == server_params
+            assert [connection.connected for connection in connections] == [True, False, True]
+            assert isinstance(connections[1].error, ConnectionError)
+            assert connections[1].session is None
+            for connection in (connections[0], connections[2]):
+                assert connection.session in group.sessions
+                assert connection.initialize_time is not None
+                assert connection.startup_time is not None
+                assert connection.startup_time >= connection.initialize_time
+
+            assert set(group.tools) == {"alpha_tool", "beta_tool"}
+            result = await group.call_tool("beta_tool", {})
+            assert result.content == [types.TextContent(type="text", text="beta")]
+
+            alpha_session = connections[0].session
+            assert alpha_session is not None
+            await group.disconnect_from_server(alpha_session)
+            assert set(group.tools) == {"beta_tool"}
+
+    async def test_connect_to_servers_requires_entered_group(self):
+        with pytest.raises(RuntimeError):
+            await ClientSessionGroup().connect_to_servers([StdioServerParameters(command="test")])
+
+    async def test_replicas_share_load(self):
+        """Test that replicas of a server form a pool and calls go to the least busy one."""
+        calls: list[str] = []
+        release = anyio.Event()
+
+        def make_replica(replica: str) -> FastMCP:
+            server = FastMCP("service")
+
+            @server.tool()
+            async def work() -> str:
+                calls.append(replica)
+                await release.wait()
+                return replica
+
+            return server
+
+        open_session = _memory_session_opener({name: make_replica(name) for name in ("a", "b")})
+        async with ClientSessionGroup(replica_policy=ReplicaPolicy()) as group:
+            with mock.patch.object(group, "_open_session", side_effect=open_session):
+                connections = await group.connect_to_servers(
+                    [StdioServerParameters(command="a"), StdioServerParameters(command="b")], max_concurrency=1
+                )
+            assert all(connection.connected for connection in connections)
+            assert list(group.tools) == ["work"]
+            assert [replica.session for replica in group.replicas("work")] == [c.session for c in connections]
+
+            results: list[str] = []
+
+            async def call() -> None:
+                result = await group.call_tool("work", {})
+                assert isinstance(result.content[0], types.TextContent)
+                results.append(result.content[0].text)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(call)
+                with anyio.fail_after(5):
+                    while not calls:
+                        await anyio.sleep(0.01)
+                tg.start_soon(call)
+                with anyio.fail_after(5):
+                    while len(calls) < 2:
+                        await anyio.sleep(0.01)
+                release.set()
+            assert sorted(calls) == ["a", "b"]
+            assert sorted(results) == ["a", "b"]
+
+            # Disconnecting the replica that owns the components keeps them in the group.
+            first_session = connections[0].session
+            assert first_session is not None
+            await group.disconnect_from_server(first_session)
+            assert list(group.tools) == ["work"]
+            assert [replica.session for replica in group.replicas("work")] == [connections[1].session]
+            result = await group.call_tool("work", {})
+            assert result.content == [types.TextContent(type="text", text="b")]
+
+    @pytest.mark.parametrize("idempotent", [True, False])
+    async def test_replica_failures_eject_and_retry(self, mock_exit_stack: contextlib.AsyncExitStack, idempotent: bool):
+        """Test that a failing replica is ejected and idempotent calls are retried on another one."""
+        server_info = types.Implementation(name="service", version="1")
+        tool = types.Tool(name="lookup", inputSchema={}, annotations=types.ToolAnnotations(idempotentHint=idempotent))
+        ok = types.CallToolResult(content=[types.TextContent(type="text", text="ok")])
+        sessions: list[mock.AsyncMock] = []
+        for _ in range(2):
+            session = mock.AsyncMock(spec=mcp.ClientSession)
+            session.list_tools.return_value = types.ListToolsResult(tools=[tool])
+            session.list_resources.return_value = types.ListResourcesResult(resources=[])
+            session.list_prompts.return_value = types.ListPromptsResult(prompts=[])
+            sessions.append(session)
+        failing, healthy = sessions
+        failing.call_tool.side_effect = McpError(
+            types.ErrorData(code=types.CONNECTION_CLOSED, message="Connection closed")
+        )
+        healthy.call_tool.return_value = ok
+
+        group = ClientSessionGroup(
+            exit_stack=mock_exit_stack, replica_policy=ReplicaPolicy(eject_after_failures=1, ejection_period=60)
+        )
+        for session in sessions:
+            await group.connect_with_session(server_info, session)
+
+        if idempotent:
+            assert await group.call_tool("lookup", {}) == ok
+        else:
+            with pytest.raises(McpError):
+                await group.call_tool("lookup", {})
+        failing.call_tool.assert_awaited_once()
+        assert healthy.call_tool.await_count == int(idempotent)
+
+        # The failed replica is ejected, so the next call goes straight to the healthy one.
+        failing_replica, healthy_replica = group.replicas("lookup")
+        assert [replica.outstanding for replica in (failing_replica, healthy_replica)] == [0, 0]
+        assert failing_replica.ejected
+        assert not healthy_replica.ejected
+        assert await group.call_tool("lookup", {}) == ok
+        failing.call_tool.assert_awaited_once()
+        assert healthy_replica.latency_ewma is not None
+        assert healthy_replica.outstanding == 0
+
+    def test_replica_policy_validation(self):
+        with pytest.raises(ValueError):
+            ReplicaPolicy(eject_after_failures=0)
+        with pytest.raises(ValueError):
+            ReplicaPolicy(latency_ewma_alpha=0)
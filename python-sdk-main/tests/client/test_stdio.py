@@ -12,6 +12,7 @@ import pytest
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, _create_platform_compatible_process, stdio_client
 from mcp.shared.exceptions import McpError
+from mcp.shared.framing import MessageTooLargeError
 from mcp.shared.message import SessionMessage
 from mcp.types import CONNECTION_CLOSED, JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
 
@@ -66,6 +67,29 @@ async def test_stdio_client():
         assert read_messages[1] == JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=2, result={}))
 
 
+@pytest.mark.anyio
+@pytest.mark.skipif(tee is None, reason="could not find tee command")
+async def test_stdio_client_max_message_size():
+    assert tee is not None
+    server_parameters = StdioServerParameters(command=tee, max_message_size=1000)
+    large = JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=1, result={"text": "x" * 200_000}))
+    small = JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=2, result={"text": "é"}))
+
+    async with stdio_client(server_parameters) as (read_stream, write_stream):
+        async with write_stream:
+            await write_stream.send(SessionMessage(large))
+            await write_stream.send(SessionMessage(small))
+
+        async with read_stream:
+            error = await read_stream.receive()
+            assert isinstance(error, MessageTooLargeError)
+            assert error.max_size == 1000
+
+            message = await read_stream.receive()
+            assert isinstance(message, SessionMessage)
+            assert message.message == small
+
+
 @pytest.mark.anyio
 async def test_stdio_client_bad_path():
     """Check that the connection doesn't hang if process errors."""
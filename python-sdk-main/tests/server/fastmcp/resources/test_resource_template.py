@@ -1,4 +1,5 @@
 import json
+import threading
 from typing import Any
 
 import pytest
@@ -6,6 +7,8 @@ from pydantic import BaseModel
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.resources import FunctionResource, ResourceTemplate
+from mcp.server.fastmcp.resources.templates import ResourceTemplateRouter
+from mcp.server.fastmcp.utilities.execution import ExecutionMode, SyncExecutor
 from mcp.types import Annotations
 
 
@@ -72,6 +75,28 @@ class TestResourceTemplate:
         data = json.loads(content)
         assert data == {"key": "foo", "value": 123}
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    async def test_create_resource_on_executor(self, mode: ExecutionMode):
+        """Test that sync template functions run off the event loop."""
+
+        def where(key: str) -> str:
+            return f"{key}:{threading.get_ident()}"
+
+        template = ResourceTemplate.from_function(
+            fn=where,
+            uri_template="test://{key}",
+            name="test",
+        )
+        executor = SyncExecutor(mode)
+
+        resource = await template.create_resource("test://foo", {"key": "foo"}, executor=executor)
+
+        content = await resource.read()
+        assert content != f"foo:{threading.get_ident()}"
+        # Templates fall back to the thread pool when the executor uses processes
+        assert executor.statistics()["thread"].completed == 1
+
     @pytest.mark.anyio
     async def test_template_error(self):
         """Test error handling in template resource creation."""
@@ -258,3 +283,79 @@ class TestResourceTemplateAnnotations:
         # Verify the resource works correctly
         content = await resource.read()
         assert content == "Item 123"
+
+
+def _template(uri_template: str) -> ResourceTemplate:
+    def read(**kwargs: str) -> str:
+        return uri_template
+
+    return ResourceTemplate.from_function(fn=read, uri_template=uri_template, name=uri_template)
+
+
+class TestResourceTemplateRouter:
+    """Test matching URIs against many templates."""
+
+    def test_literal_text_is_not_a_pattern(self):
+        template = _template("data://{name}.json")
+        assert template.matches("data://report.json") == {"name": "report"}
+        assert template.matches("data://reportxjson") is None
+
+    def test_match_extracts_params(self):
+        router = ResourceTemplateRouter()
+        for uri_template in ["users://{id}", "users://{id}/posts/{post}", "files://{path}"]:
+            router[uri_template] = _template(uri_template)
+
+        match = router.match("users://42/posts/7")
+        assert match is not None
+        template, params = match
+        assert template.uri_template == "users://{id}/posts/{post}"
+        assert params == {"id": "42", "post": "7"}
+        assert router.match("users://42/comments/7") is None
+        assert router.match("unknown://42") is None
+
+    def test_first_registered_template_wins(self):
+        router = ResourceTemplateRouter()
+        router["{scheme}://item"] = _template("{scheme}://item")
+        router["repo://{name}"] = _template("repo://{name}")
+        router["repo://item"] = _template("repo://item")
+
+        match = router.match("repo://item")
+        assert match is not None
+        assert match[0].uri_template == "{scheme}://item"
+
+        # Replacing a template keeps its precedence; removing it hands over to the next one
+        router["{scheme}://item"] = _template("{scheme}://item")
+        match = router.match("repo://item")
+        assert match is not None
+        assert match[0].uri_template == "{scheme}://item"
+
+        del router["{scheme}://item"]
+        match = router.match("repo://item")
+        assert match is not None
+        assert match[0].uri_template == "repo://{name}"
+        assert list(router) == ["repo://{name}", "repo://item"]
+
+    def test_many_templates(self):
+        router = ResourceTemplateRouter()
+        for index in range(1000):
+            uri_template = f"service{index}://{{tenant}}/items/{{item}}"
+            router[uri_template] = _template(uri_template)
+
+        assert len(router) == 1000
+        match = router.match("service999://acme/items/7")
+        assert match is not None
+        template, params = match
+        assert template.uri_template == "service999://{tenant}/items/{item}"
+        assert params == {"tenant": "acme", "item": "7"}
+        assert router.match("service1000://acme/items/7") is None
+
+    def test_templates_without_params_do_not_match(self):
+        # As before the router, a template must extract parameters to serve a URI
+        router = ResourceTemplateRouter()
+        router["static://item"] = _template("static://item")
+        assert router.match("static://item") is None
+
+        router["static://{name}"] = _template("static://{name}")
+        match = router.match("static://item")
+        assert match is not None
+        assert match[0].uri_template == "static://{name}"
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
+import anyio
 import pytest
 from pydantic import AnyUrl, BaseModel
 from starlette.routing import Mount, Route
@@ -16,12 +17,17 @@ from mcp.shared.exceptions import McpError
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
 )
+from mcp.shared.session import RequestResponder
 from mcp.types import (
     AudioContent,
     BlobResourceContents,
+    ClientResult,
     ContentBlock,
     EmbeddedResource,
     ImageContent,
+    ResourceUpdatedNotification,
+    ServerNotification,
+    ServerRequest,
     TextContent,
     TextResourceContents,
 )
@@ -770,6 +776,78 @@ class TestServerResources:
             assert resource.mimeType == "text/plain"
 
 
+class TestServerResourceSubscriptions:
+    @staticmethod
+    def _fastmcp() -> FastMCP:
+        mcp = FastMCP(resource_update_debounce=0.01)
+
+        @mcp.resource("resource://counter")
+        def counter() -> str:
+            return "0"
+
+        @mcp.resource("resource://items/{item_id}")
+        def item(item_id: str) -> str:
+            return item_id
+
+        return mcp
+
+    @pytest.mark.anyio
+    async def test_updates_reach_subscribers_once_per_burst(self):
+        mcp = self._fastmcp()
+        updates: list[str] = []
+        received = anyio.Event()
+
+        async def message_handler(
+            message: RequestResponder[ServerRequest, ClientResult] | ServerNotification | Exception,
+        ) -> None:
+            if isinstance(message, ServerNotification) and isinstance(message.root, ResourceUpdatedNotification):
+                updates.append(str(message.root.params.uri))
+                if len(updates) == 3:
+                    received.set()
+
+        async with (
+            client_session(mcp._mcp_server, message_handler=message_handler) as client,
+            client_session(mcp._mcp_server, message_handler=message_handler) as bystander,
+        ):
+            capabilities = client.get_server_capabilities()
+            assert capabilities is not None and capabilities.resources is not None
+            assert capabilities.resources.subscribe
+
+            await client.subscribe_resource(AnyUrl("resource://counter"))
+            await client.subscribe_resource(AnyUrl("resource://items/1"))
+            await client.subscribe_resource(AnyUrl("resource://items/2"))
+            await bystander.send_ping()
+
+            for _ in range(5):
+                assert await mcp.notify_resource_updated("resource://counter") == 1
+            # A URI template notifies the subscribers of every URI matching it
+            assert await mcp.notify_resource_updated("resource://items/{item_id}") == 2
+
+            with anyio.fail_after(5):
+                await received.wait()
+            await client.send_ping()
+
+        assert sorted(updates) == ["resource://counter", "resource://items/1", "resource://items/2"]
+
+    @pytest.mark.anyio
+    async def test_unsubscribe_and_unknown_resources(self):
+        mcp = self._fastmcp()
+
+        async with client_session(mcp._mcp_server) as client:
+            with pytest.raises(McpError, match="Unknown resource"):
+                await client.subscribe_resource(AnyUrl("resource://missing"))
+
+            await client.subscribe_resource(AnyUrl("resource://counter"))
+            await client.unsubscribe_resource(AnyUrl("resource://counter"))
+            assert await mcp.notify_resource_updated("resource://counter") == 0
+            assert await mcp.notify_resource_updated("resource://missing") == 0
+
+        # Sessions that ended without unsubscribing are dropped
+        async with client_session(mcp._mcp_server) as client:
+            await client.subscribe_resource(AnyUrl("resource://counter"))
+        assert await mcp.notify_resource_updated("resource://counter") == 0
+
+
 class TestServerResourceTemplates:
     @pytest.mark.anyio
     async def test_resource_with_params(self):
@@ -1,17 +1,21 @@
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
+import anyio
 import pytest
 from pydantic import BaseModel
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
-from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.tools import CachePolicy, Tool, ToolManager
+from mcp.server.fastmcp.utilities.execution import SyncExecutor
 from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
 from mcp.server.session import ServerSessionT
 from mcp.shared.context import LifespanContextT, RequestT
+from mcp.shared.memory import create_connected_server_and_client_session as client_session
 from mcp.types import TextContent, ToolAnnotations
 
 
@@ -918,3 +922,309 @@ class TestRemoveTools:
         # Remove with correct case
         manager.remove_tool("test_func")
         assert manager.get_tool("test_func") is None
+
+
+class TestSyncExecution:
+    """Test running synchronous tools on a worker pool."""
+
+    @pytest.mark.anyio
+    async def test_inline_by_default(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager()
+        manager.add_tool(where)
+
+        assert await manager.call_tool("where", {}) == threading.get_ident()
+
+    @pytest.mark.anyio
+    async def test_thread_execution(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager(executor=SyncExecutor("thread", max_workers=2))
+        manager.add_tool(where)
+
+        assert await manager.call_tool("where", {}) != threading.get_ident()
+        stats = manager.executor.statistics()["thread"]
+        assert stats.completed == 1
+        assert stats.running == 0
+        assert stats.queued == 0
+        assert stats.max_workers == 2
+
+    @pytest.mark.anyio
+    async def test_per_tool_override(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager()
+        manager.add_tool(where, execution="thread")
+
+        assert await manager.call_tool("where", {}) != threading.get_ident()
+        assert manager.executor.statistics()["thread"].completed == 1
+
+    @pytest.mark.anyio
+    async def test_concurrency_limit_queues_calls(self):
+        release = threading.Event()
+
+        def block() -> str:
+            release.wait(5)
+            return "done"
+
+        manager = ToolManager(executor=SyncExecutor("thread", max_workers=1))
+        manager.add_tool(block)
+
+        results: list[str] = []
+
+        async def call():
+            results.append(await manager.call_tool("block", {}))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            tg.start_soon(call)
+            with anyio.fail_after(5):
+                while manager.executor.statistics()["thread"].queued != 1:
+                    await anyio.sleep(0.01)
+            assert manager.executor.statistics()["thread"].running == 1
+            release.set()
+
+        assert results == ["done", "done"]
+        assert manager.executor.statistics()["thread"].completed == 2
+
+    @pytest.mark.anyio
+    async def test_errors_propagate_from_worker(self):
+        def fail() -> None:
+            raise RuntimeError("boom")
+
+        manager = ToolManager(executor=SyncExecutor("thread"))
+        manager.add_tool(fail)
+
+        with pytest.raises(ToolError, match="boom"):
+            await manager.call_tool("fail", {})
+
+    def test_process_execution_rejects_context(self):
+        def tool_with_context(x: int, ctx: Context[ServerSessionT, None]) -> str:
+            return str(x)
+
+        manager = ToolManager(executor=SyncExecutor("process"))
+        with pytest.raises(ValueError, match="cannot run in a process pool"):
+            manager.add_tool(tool_with_context)
+
+    def test_fastmcp_settings(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        mcp = FastMCP(sync_execution="thread", max_sync_workers=4)
+        mcp.add_tool(where, execution="inline")
+
+        assert mcp.sync_executor.mode == "thread"
+        assert mcp.sync_executor.max_workers == 4
+        tool = mcp._tool_manager.get_tool("where")
+        assert tool is not None
+        assert tool.execution == "inline"
+
+
+class TestResultCache:
+    """Test caching the results of read-only and idempotent tools."""
+
+    @pytest.mark.anyio
+    async def test_cached_by_validated_arguments(self, monkeypatch: pytest.MonkeyPatch):
+        now = 1000.0
+        monkeypatch.setattr("mcp.server.fastmcp.tools.result_cache.time.monotonic", lambda: now)
+        calls: list[tuple[str, int]] = []
+
+        def lookup(key: str, limit: int = 10) -> str:
+            calls.append((key, limit))
+            return f"{key}:{limit}"
+
+        manager = ToolManager()
+        manager.add_tool(lookup, annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy(ttl=60))
+
+        assert await manager.call_tool("lookup", {"key": "a"}) == "a:10"
+        # Equivalent arguments after validation share the cached result.
+        assert await manager.call_tool("lookup", {"limit": "10", "key": "a"}) == "a:10"
+        assert await manager.call_tool("lookup", {"key": "a", "limit": 5}) == "a:5"
+        assert calls == [("a", 10), ("a", 5)]
+
+        cache = manager.get_result_cache("lookup")
+        assert cache is not None
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == 1 / 3
+
+        now += 60
+        assert await manager.call_tool("lookup", {"key": "a"}) == "a:10"
+        assert calls[-1] == ("a", 10)
+        assert cache.misses == 3
+
+        # Converted results are built from the cached value.
+        result = await manager.call_tool("lookup", {"key": "a"}, convert_result=True)
+        assert result[0] == [TextContent(type="text", text="a:10")]
+        assert cache.hits == 2
+
+    @pytest.mark.anyio
+    async def test_lru_eviction(self):
+        def square(x: int) -> int:
+            return x * x
+
+        manager = ToolManager()
+        manager.add_tool(square, annotations=ToolAnnotations(idempotentHint=True), cache=CachePolicy(max_entries=2))
+        for x in (1, 2, 1, 3):
+            await manager.call_tool("square", {"x": x})
+
+        cache = manager.get_result_cache("square")
+        assert cache is not None
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        # 2 was the least recently used, so 1 is still cached.
+        await manager.call_tool("square", {"x": 1})
+        await manager.call_tool("square", {"x": 2})
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    @pytest.mark.anyio
+    async def test_single_flight(self):
+        started = anyio.Event()
+        release = anyio.Event()
+        calls = 0
+
+        async def slow(x: int) -> int:
+            nonlocal calls
+            calls += 1
+            started.set()
+            await release.wait()
+            return x
+
+        manager = ToolManager()
+        manager.add_tool(slow, annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        results: list[int] = []
+
+        async def call():
+            results.append(await manager.call_tool("slow", {"x": 1}))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+            await started.wait()
+            await anyio.sleep(0.01)
+            release.set()
+
+        assert results == [1, 1, 1]
+        assert calls == 1
+        cache = manager.get_result_cache("slow")
+        assert cache is not None
+        assert (cache.misses, cache.coalesced) == (1, 2)
+
+    @pytest.mark.anyio
+    async def test_errors_are_not_cached(self):
+        fail = True
+
+        def flaky() -> str:
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+        manager = ToolManager()
+        manager.add_tool(flaky, annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        with pytest.raises(ToolError, match="boom"):
+            await manager.call_tool("flaky", {})
+        fail = False
+        assert await manager.call_tool("flaky", {}) == "ok"
+
+    @pytest.mark.anyio
+    async def test_invalidation(self):
+        data = {"a": 1, "b": 2}
+
+        mcp = FastMCP()
+
+        @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        def read(key: str) -> int:
+            return data[key]
+
+        @mcp.tool()
+        def write(key: str, value: int, ctx: Context[ServerSessionT, None]) -> None:
+            data[key] = value
+            ctx.fastmcp.invalidate_tool_cache("read", {"key": key})
+
+        assert await mcp.call_tool("read", {"key": "a"}) == ([TextContent(type="text", text="1")], {"result": 1})
+        assert await mcp.call_tool("read", {"key": "b"}) == ([TextContent(type="text", text="2")], {"result": 2})
+        await mcp.call_tool("write", {"key": "a", "value": 10})
+        data["b"] = 20
+        assert await mcp.call_tool("read", {"key": "a"}) == ([TextContent(type="text", text="10")], {"result": 10})
+        assert await mcp.call_tool("read", {"key": "b"}) == ([TextContent(type="text", text="2")], {"result": 2})
+
+        mcp.invalidate_tool_cache()
+        assert await mcp.call_tool("read", {"key": "b"}) == ([TextContent(type="text", text="20")], {"result": 20})
+        cache = mcp.get_tool_cache("read")
+        assert cache is not None
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    @pytest.mark.anyio
+    async def test_invalidation_during_first_call(self):
+        data = {"a": 1}
+        started = anyio.Event()
+        release = anyio.Event()
+
+        async def read(key: str) -> int:
+            value = data[key]
+            started.set()
+            await release.wait()
+            return value
+
+        manager = ToolManager()
+        manager.add_tool(read, annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        results: list[int] = []
+
+        async with anyio.create_task_group() as tg:
+
+            async def call() -> None:
+                results.append(await manager.call_tool("read", {"key": "a"}))
+
+            tg.start_soon(call)
+            await started.wait()
+            # The cache has no entries yet, but the result in flight is already stale.
+            data["a"] = 2
+            manager.invalidate_cache("read")
+            release.set()
+
+        assert results == [1]
+        assert await manager.call_tool("read", {"key": "a"}) == 2
+
+    def test_requires_read_only_or_idempotent(self):
+        def update(x: int) -> int:
+            return x
+
+        manager = ToolManager()
+        with pytest.raises(ValueError, match="readOnlyHint or idempotentHint"):
+            manager.add_tool(update, cache=CachePolicy())
+        with pytest.raises(ValueError, match="readOnlyHint or idempotentHint"):
+            manager.add_tool(update, annotations=ToolAnnotations(readOnlyHint=False), cache=CachePolicy())
+        with pytest.raises(ValueError):
+            CachePolicy(ttl=0)
+
+    @pytest.mark.anyio
+    async def test_context_tools_are_not_cached_across_sessions(self):
+        mcp = FastMCP()
+
+        def whoami(ctx: Context[ServerSessionT, None]) -> int:
+            return id(ctx.session)
+
+        # The cache is keyed by arguments only, so it would serve one session's result to all.
+        with pytest.raises(ValueError, match="takes a Context"):
+            mcp.add_tool(whoami, annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        mcp.add_tool(whoami, annotations=ToolAnnotations(readOnlyHint=True))
+
+        calls = 0
+
+        @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True), cache=CachePolicy())
+        def count() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        async with client_session(mcp._mcp_server) as first, client_session(mcp._mcp_server) as second:
+            first_id = (await first.call_tool("whoami", {})).structuredContent
+            second_id = (await second.call_tool("whoami", {})).structuredContent
+            assert first_id != second_id
+
+            # Tools without a Context share their cached results between sessions.
+            assert (await first.call_tool("count", {})).structuredContent == {"result": 1}
+            assert (await second.call_tool("count", {})).structuredContent == {"result": 1}
@@ -0,0 +1,226 @@
+"""Tests for bounded request dispatch in the lowlevel server."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from mcp.server import Server
+from mcp.server.lowlevel.dispatch import RequestDispatcher
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import (
+    SERVER_BUSY,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
+    TextContent,
+    Tool,
+)
+
+
+@pytest.mark.anyio
+async def test_per_session_limit_queues_requests():
+    dispatcher = RequestDispatcher(max_in_flight_per_session=1)
+    started: list[str] = []
+    release = anyio.Event()
+
+    async def job(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    async with anyio.create_task_group() as tg:
+        with dispatcher.session(tg) as queue:
+            assert dispatcher.submit(queue, "tools/call", lambda: job("first"))
+            assert dispatcher.submit(queue, "tools/call", lambda: job("second"))
+            await anyio.sleep(0.01)
+
+            assert started == ["first"]
+            assert dispatcher.in_flight == 1
+            assert dispatcher.queued == 1
+
+            release.set()
+            with anyio.fail_after(1):
+                while started != ["first", "second"]:
+                    await anyio.sleep(0.01)
+
+    assert dispatcher.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_full_queue_rejects_requests():
+    dispatcher = RequestDispatcher(max_in_flight_per_session=1, max_queued_per_session=1)
+    release = anyio.Event()
+
+    async with anyio.create_task_group() as tg:
+        with dispatcher.session(tg) as queue:
+            assert dispatcher.submit(queue, "tools/call", release.wait)
+            assert dispatcher.submit(queue, "tools/call", release.wait)
+            assert not dispatcher.submit(queue, "tools/call", release.wait)
+            release.set()
+
+
+@pytest.mark.anyio
+async def test_priority_zero_bypasses_limits():
+    dispatcher = RequestDispatcher(max_in_flight=1, max_queued_per_session=0)
+    release = anyio.Event()
+    pinged = anyio.Event()
+
+    async def ping() -> None:
+        pinged.set()
+
+    async with anyio.create_task_group() as tg:
+        with dispatcher.session(tg) as queue:
+            assert dispatcher.submit(queue, "tools/call", release.wait)
+            assert dispatcher.submit(queue, "ping", ping)
+            with anyio.fail_after(1):
+                await pinged.wait()
+            release.set()
+
+
+@pytest.mark.anyio
+async def test_queued_requests_run_by_priority():
+    dispatcher = RequestDispatcher(max_in_flight=1)
+    order: list[str] = []
+    release = anyio.Event()
+
+    async def job(name: str) -> None:
+        order.append(name)
+
+    async with anyio.create_task_group() as tg:
+        with dispatcher.session(tg) as queue:
+            dispatcher.submit(queue, "tools/call", release.wait)
+            dispatcher.submit(queue, "tools/call", lambda: job("call"))
+            dispatcher.submit(queue, "tools/list", lambda: job("list"))
+            release.set()
+            with anyio.fail_after(1):
+                while len(order) < 2:
+                    await anyio.sleep(0.01)
+
+    assert order == ["list", "call"]
+
+
+@pytest.mark.anyio
+async def test_global_limit_is_fair_across_sessions():
+    dispatcher = RequestDispatcher(max_in_flight=1)
+    order: list[str] = []
+    release = anyio.Event()
+
+    async def job(name: str) -> None:
+        order.append(name)
+
+    async with anyio.create_task_group() as tg:
+        with dispatcher.session(tg) as first, dispatcher.session(tg) as second:
+            dispatcher.submit(first, "tools/call", release.wait)
+            for i in range(3):
+                dispatcher.submit(first, "tools/call", lambda i=i: job(f"a{i}"))
+            for i in range(3):
+                dispatcher.submit(second, "tools/call", lambda i=i: job(f"b{i}"))
+            release.set()
+            with anyio.fail_after(1):
+                while len(order) < 6:
+                    await anyio.sleep(0.01)
+
+    assert order == ["b0", "a0", "b1", "a1", "b2", "a2"]
+
+
+@pytest.mark.anyio
+async def test_server_rejects_overflow_with_server_busy():
+    server = Server("test", request_dispatcher=RequestDispatcher(max_in_flight_per_session=1, max_queued_per_session=1))
+    release = anyio.Event()
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="wait", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        await release.wait()
+        return [TextContent(type="text", text="done")]
+
+    errors: list[McpError] = []
+    results: list[str] = []
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+
+        async def call() -> None:
+            try:
+                result = await client.call_tool("wait", {})
+                assert isinstance(result.content[0], TextContent)
+                results.append(result.content[0].text)
+            except McpError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+            with anyio.fail_after(5):
+                while not errors:
+                    await anyio.sleep(0.01)
+            # Ping is not subject to the limits
+            await client.send_ping()
+            release.set()
+
+    assert results == ["done", "done"]
+    assert len(errors) == 1
+    assert errors[0].error.code == SERVER_BUSY
+
+
+@pytest.mark.anyio
+async def test_cancelling_a_queued_request_skips_it():
+    dispatcher = RequestDispatcher(max_in_flight_per_session=1)
+    server = Server("test", request_dispatcher=dispatcher)
+    release = anyio.Event()
+    started: list[int] = []
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="wait", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        request_id = server.request_context.request_id
+        assert isinstance(request_id, int)
+        started.append(request_id)
+        await release.wait()
+        return [TextContent(type="text", text="done")]
+
+    errors: list[McpError] = []
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+
+        async def call() -> None:
+            try:
+                await client.call_tool("wait", {})
+            except McpError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            with anyio.fail_after(5):
+                while not started:
+                    await anyio.sleep(0.01)
+            tg.start_soon(call)
+            with anyio.fail_after(5):
+                while not dispatcher.queued:
+                    await anyio.sleep(0.01)
+
+            # Request IDs are sequential, so the queued request follows the running one
+            await client.send_notification(
+                ClientNotification(CancelledNotification(params=CancelledNotificationParams(requestId=started[0] + 1)))
+            )
+            with anyio.fail_after(5):
+                while not errors:
+                    await anyio.sleep(0.01)
+            release.set()
+
+        result = await client.call_tool("wait", {})
+
+    assert not result.isError
+    assert len(errors) == 1
+    assert errors[0].error.message == "Request cancelled"
+    # The cancelled request never ran
+    assert len(started) == 2 and started[1] == started[0] + 2
+    assert dispatcher.queued == 0
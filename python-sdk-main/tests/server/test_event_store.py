@@ -0,0 +1,134 @@
+"""Tests for the SQLite event store."""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import anyio
+import pytest
+
+from mcp.server.event_store import SQLiteEventStore
+from mcp.server.streamable_http import EventMessage
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+
+
+def _message(index: int) -> JSONRPCMessage:
+    return JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/message", params={"index": index}))
+
+
+async def _replay(store: SQLiteEventStore, last_event_id: str) -> tuple[str | None, list[EventMessage]]:
+    replayed: list[EventMessage] = []
+
+    async def send(event: EventMessage) -> None:
+        replayed.append(event)
+
+    stream_id = await store.replay_events_after(last_event_id, send)
+    return stream_id, replayed
+
+
+@pytest.mark.anyio
+async def test_replays_events_of_the_same_stream(tmp_path: Path):
+    async with SQLiteEventStore(tmp_path / "events.db") as store:
+        first = await store.store_event("a", _message(0))
+        await store.store_event("b", _message(1))
+        second = await store.store_event("a", _message(2))
+        third = await store.store_event("a", _message(3))
+
+        assert first < second < third
+
+        stream_id, replayed = await _replay(store, first)
+        assert stream_id == "a"
+        assert [event.event_id for event in replayed] == [second, third]
+        assert [event.message for event in replayed] == [_message(2), _message(3)]
+
+
+@pytest.mark.anyio
+async def test_events_survive_reopening(tmp_path: Path):
+    path = tmp_path / "events.db"
+    async with SQLiteEventStore(path, commit_every=1000, commit_interval=3600) as store:
+        first = await store.store_event("a", _message(0))
+        await store.store_event("a", _message(1))
+
+    async with SQLiteEventStore(path) as store:
+        stream_id, replayed = await _replay(store, first)
+        assert stream_id == "a"
+        assert [event.message for event in replayed] == [_message(1)]
+
+        # IDs keep increasing after a restart
+        last_event_id = replayed[-1].event_id
+        assert last_event_id is not None
+        assert await store.store_event("a", _message(2)) > last_event_id
+
+
+@pytest.mark.anyio
+async def test_unknown_event_id(tmp_path: Path):
+    async with SQLiteEventStore(tmp_path / "events.db") as store:
+        await store.store_event("a", _message(0))
+        assert await _replay(store, "00000000000000000042") == (None, [])
+        assert await _replay(store, "not-an-event-id") == (None, [])
+
+
+@pytest.mark.anyio
+async def test_replay_spans_several_pages(tmp_path: Path):
+    async with SQLiteEventStore(tmp_path / "events.db", commit_every=10_000) as store:
+        first = await store.store_event("a", _message(0))
+        for index in range(1, 1200):
+            await store.store_event("a", _message(index))
+
+        _, replayed = await _replay(store, first)
+        assert [event.message for event in replayed] == [_message(index) for index in range(1, 1200)]
+
+
+@pytest.mark.anyio
+async def test_max_events_retention(tmp_path: Path):
+    async with SQLiteEventStore(tmp_path / "events.db", max_events=3) as store:
+        ids = [await store.store_event("a", _message(index)) for index in range(6)]
+        await store.compact()
+
+        assert await _replay(store, ids[2]) == (None, [])
+        stream_id, replayed = await _replay(store, ids[3])
+        assert stream_id == "a"
+        assert [event.event_id for event in replayed] == ids[4:]
+
+
+@pytest.mark.anyio
+async def test_max_age_retention(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("mcp.server.event_store.time.time", lambda: now)
+
+    async with SQLiteEventStore(tmp_path / "events.db", max_age=60) as store:
+        old = await store.store_event("a", _message(0))
+        now += 120
+        recent = await store.store_event("a", _message(1))
+        await store.store_event("a", _message(2))
+        await store.compact()
+
+        assert await _replay(store, old) == (None, [])
+        _, replayed = await _replay(store, recent)
+        assert [event.message for event in replayed] == [_message(2)]
+
+
+@pytest.mark.anyio
+async def test_run_commits_the_last_events_of_a_burst(tmp_path: Path):
+    path = tmp_path / "events.db"
+
+    def committed() -> int:
+        # Another connection only sees committed events
+        with closing(sqlite3.connect(path)) as connection:
+            return connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    async with SQLiteEventStore(path, commit_every=1000, commit_interval=0.01) as store:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(store.run)
+            await store.store_event("a", _message(0))
+            await store.store_event("a", _message(1))
+            with anyio.fail_after(5):
+                while committed() < 2:
+                    await anyio.sleep(0.01)
+
+            # And again for the next burst, after the store was idle
+            await store.store_event("a", _message(2))
+            with anyio.fail_after(5):
+                while committed() < 3:
+                    await anyio.sleep(0.01)
+            tg.cancel_scope.cancel()
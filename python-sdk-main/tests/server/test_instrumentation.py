@@ -0,0 +1,112 @@
+import httpx
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.instrumentation import Instrumentation, PrometheusInstrumentation, Stage
+from mcp.server.lowlevel import Server
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.stages: list[tuple[Stage, str | None]] = []
+        self.started: list[str] = []
+        self.finished: list[tuple[str, bool]] = []
+
+    def record_stage(self, stage: Stage, duration: float, method: str | None = None) -> None:
+        assert duration >= 0
+        self.stages.append((stage, method))
+
+    def request_started(self, method: str) -> None:
+        self.started.append(method)
+
+    def request_finished(self, method: str, duration: float, error: bool) -> None:
+        assert duration >= 0
+        self.finished.append((method, error))
+
+
+@pytest.mark.anyio
+async def test_server_records_request_stages():
+    instrumentation = RecordingInstrumentation()
+    mcp = FastMCP("test", instrumentation=instrumentation)
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        instrumentation.stages.clear()
+        instrumentation.finished.clear()
+        await client.call_tool("echo", {"text": "hi"})
+
+    # The client also lists the tools to validate the result
+    assert [stage for stage in instrumentation.stages if stage[1] == "tools/call"] == [
+        ("queue", "tools/call"),
+        ("handler", "tools/call"),
+        ("encode", "tools/call"),
+    ]
+    assert ("tools/call", False) in instrumentation.finished
+
+
+@pytest.mark.anyio
+async def test_server_records_errors():
+    instrumentation = RecordingInstrumentation()
+    server = Server("test", instrumentation=instrumentation)
+
+    async with create_connected_server_and_client_session(server) as client:
+        with pytest.raises(McpError):
+            await client.list_tools()
+
+    assert instrumentation.finished[-1] == ("tools/list", True)
+
+
+@pytest.mark.anyio
+async def test_streamable_http_records_decode_and_write():
+    instrumentation = RecordingInstrumentation()
+    mcp = FastMCP("test", instrumentation=instrumentation, stateless_http=True, json_response=True)
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    app = mcp.streamable_http_app()
+    async with mcp.session_manager.run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://127.0.0.1") as client:
+            response = await client.post(
+                "/mcp",
+                json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+                headers={"Accept": "application/json, text/event-stream"},
+            )
+    assert response.status_code == 200
+
+    assert ("decode", "tools/list") in instrumentation.stages
+    assert ("write", "tools/list") in instrumentation.stages
+
+
+def test_prometheus_render():
+    metrics = PrometheusInstrumentation(buckets=(0.1, 1.0))
+    metrics.request_started("tools/call")
+    metrics.record_stage("handler", 0.05, "tools/call")
+    metrics.record_stage("handler", 0.5, "tools/call")
+    metrics.record_stage("decode", 2.0)
+    metrics.request_finished("tools/call", 0.5, error=False)
+    metrics.request_started('odd"method')
+
+    text = metrics.render()
+    lines = text.splitlines()
+    assert "# TYPE mcp_server_stage_duration_seconds histogram" in lines
+    assert 'mcp_server_stage_duration_seconds_bucket{stage="handler",method="tools/call",le="0.1"} 1' in lines
+    assert 'mcp_server_stage_duration_seconds_bucket{stage="handler",method="tools/call",le="1.0"} 2' in lines
+    assert 'mcp_server_stage_duration_seconds_bucket{stage="handler",method="tools/call",le="+Inf"} 2' in lines
+    assert 'mcp_server_stage_duration_seconds_sum{stage="handler",method="tools/call"} 0.55' in lines
+    assert 'mcp_server_stage_duration_seconds_count{stage="decode"} 1' in lines
+    assert 'mcp_server_requests_total{method="tools/call",outcome="ok"} 1' in lines
+    assert 'mcp_server_requests_in_flight{method="tools/call"} 0' in lines
+    assert 'mcp_server_requests_in_flight{method="odd\\"method"} 1' in lines
+    assert text.endswith("\n")
+
+
+def test_prometheus_invalid_buckets():
+    with pytest.raises(ValueError):
+        PrometheusInstrumentation(buckets=(1.0, 0.1))
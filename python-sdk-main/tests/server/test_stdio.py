@@ -1,11 +1,22 @@
 import io
+import os
+import sys
+import textwrap
 
 import anyio
 import pytest
 
-from mcp.server.stdio import stdio_server
+from mcp.server.stdio import StdioMode, stdio_server
 from mcp.shared.message import SessionMessage
-from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
+from mcp.types import (
+    ErrorData,
+    JSONRPCBatch,
+    JSONRPCError,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+)
 
 
 @pytest.mark.anyio
@@ -59,3 +70,193 @@ async def test_stdio_server():
     assert len(received_responses) == 2
     assert received_responses[0] == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=3, method="ping"))
     assert received_responses[1] == JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=4, result={}))
+
+
+@pytest.mark.anyio
+async def test_stdio_server_batch():
+    stdin = io.StringIO()
+    stdout = io.StringIO()
+
+    batch = [
+        JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+        JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=2, method="tools/list")),
+    ]
+    stdin.write(JSONRPCBatch(batch).model_dump_json(by_alias=True, exclude_none=True) + "\n")
+    stdin.seek(0)
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout)) as (
+        read_stream,
+        write_stream,
+    ):
+        await write_stream.aclose()
+        received_messages: list[JSONRPCMessage] = []
+        async with read_stream:
+            async for message in read_stream:
+                if isinstance(message, Exception):
+                    raise message
+                received_messages.append(message.message)
+                if len(received_messages) == 2:
+                    break
+
+    assert received_messages == batch
+
+
+@pytest.mark.anyio
+async def test_stdio_server_batch_responses():
+    stdin = io.StringIO()
+    stdout = io.StringIO()
+
+    batch = [
+        JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+        JSONRPCMessage(root=JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")),
+        JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=2, method="ping")),
+    ]
+    stdin.write(JSONRPCBatch(batch).model_dump_json(by_alias=True, exclude_none=True) + "\n")
+    stdin.seek(0)
+
+    first = JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=1, result={}))
+    second = JSONRPCMessage(root=JSONRPCError(jsonrpc="2.0", id=2, error=ErrorData(code=-32603, message="failed")))
+    notification = JSONRPCMessage(root=JSONRPCNotification(jsonrpc="2.0", method="notifications/message"))
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout)) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream:
+            for _ in batch:
+                await read_stream.receive()
+
+        async with write_stream:
+            # Responses complete in any order, with other messages in between
+            for message in (second, notification, first):
+                await write_stream.send(SessionMessage(message))
+
+    lines = stdout.getvalue().splitlines()
+    assert len(lines) == 2
+    assert JSONRPCMessage.model_validate_json(lines[0]) == notification
+    assert JSONRPCBatch.model_validate_json(lines[1]).root == [first, second]
+
+
+@pytest.mark.anyio
+async def test_stdio_server_orjson_codec():
+    pytest.importorskip("orjson")
+    stdin = io.StringIO('{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n')
+    stdout = io.StringIO()
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout), codec="orjson") as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream:
+            message = await read_stream.receive()
+        assert isinstance(message, SessionMessage)
+        assert message.message == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"))
+
+        async with write_stream:
+            await write_stream.send(
+                SessionMessage(JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=1, result={})))
+            )
+
+    assert stdout.getvalue() == '{"jsonrpc":"2.0","id":1,"result":{}}\n'
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("stream_buffer", [0, 8])
+async def test_stdio_server_coalesces_ready_messages(stream_buffer: int):
+    stdout = CountingStringIO()
+    responses = [JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=i, result={})) for i in range(5)]
+
+    async with stdio_server(
+        stdin=anyio.AsyncFile(io.StringIO()), stdout=anyio.AsyncFile(stdout), stream_buffer=stream_buffer
+    ) as (
+        read_stream,
+        write_stream,
+    ):
+        await read_stream.aclose()
+        async with write_stream:
+            async with anyio.create_task_group() as tg:
+                for response in responses:
+                    tg.start_soon(write_stream.send, SessionMessage(response))
+
+    assert [JSONRPCMessage.model_validate_json(line) for line in stdout.getvalue().splitlines()] == responses
+    assert stdout.writes < len(responses)
+
+
+ECHO_SERVER = textwrap.dedent(
+    """
+    import anyio
+
+    from mcp.server.stdio import stdio_server
+
+
+    async def main():
+        async with stdio_server(mode="nonblocking") as (read_stream, write_stream):
+            async with write_stream:
+                async for message in read_stream:
+                    await write_stream.send(message)
+
+
+    anyio.run(main)
+    """
+)
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="non-blocking stdio needs POSIX pipes")
+async def test_stdio_server_nonblocking():
+    requests = [JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=i, method="ping")) for i in range(100)]
+    # Split across writes so lines straddle the chunks the server reads
+    data = "".join(request.model_dump_json(by_alias=True, exclude_none=True) + "\n" for request in requests).encode()
+
+    async with await anyio.open_process([sys.executable, "-c", ECHO_SERVER]) as process:
+        assert process.stdin is not None and process.stdout is not None
+        for start in range(0, len(data), 1000):
+            await process.stdin.send(data[start : start + 1000])
+        await process.stdin.aclose()
+
+        output = b""
+        # Generous, the server has to start a fresh interpreter
+        with anyio.fail_after(60):
+            async for chunk in process.stdout:
+                output += chunk
+
+    assert process.returncode == 0
+    assert [JSONRPCMessage.model_validate_json(line) for line in output.splitlines()] == requests
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="non-blocking stdio needs POSIX pipes")
+@pytest.mark.parametrize("mode, blocking", [(None, True), ("auto", False)])
+async def test_stdio_server_nonblocking_is_opt_in(
+    monkeypatch: pytest.MonkeyPatch, mode: StdioMode | None, blocking: bool
+):
+    stdin_read, stdin_write = os.pipe()
+    stdout_read, stdout_write = os.pipe()
+    os.close(stdin_write)
+    # stdio_server re-wraps these, so the descriptors are closed here rather than by the files
+    stdin = open(stdin_read, encoding="utf-8", closefd=False)
+    stdout = open(stdout_write, "w", encoding="utf-8", closefd=False)
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    try:
+        server = stdio_server() if mode is None else stdio_server(mode=mode)
+        async with server as (read_stream, write_stream):
+            assert os.get_blocking(stdin_read) is blocking
+            assert os.get_blocking(stdout_write) is blocking
+            await read_stream.aclose()
+            await write_stream.aclose()
+    finally:
+        monkeypatch.undo()
+        for fd in (stdin_read, stdout_read, stdout_write):
+            os.close(fd)
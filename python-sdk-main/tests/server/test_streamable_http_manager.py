@@ -1,5 +1,10 @@
 """Tests for StreamableHTTPSessionManager."""
 
+import contextlib
+import sqlite3
+from collections.abc import AsyncIterator
+from contextlib import closing
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -7,8 +12,11 @@ import anyio
 import pytest
 from starlette.types import Message
 
+from mcp import types
 from mcp.server import streamable_http_manager
+from mcp.server.event_store import SQLiteEventStore
 from mcp.server.lowlevel import Server
+from mcp.server.models import InitializationOptions
 from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, StreamableHTTPServerTransport
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 
@@ -31,6 +39,26 @@ async def test_run_can_only_be_called_once():
     assert "StreamableHTTPSessionManager .run() can only be called once per instance" in str(excinfo.value)
 
 
+@pytest.mark.anyio
+async def test_run_runs_and_closes_the_event_store(tmp_path: Path):
+    """Test that run() commits pending events on shutdown, so none are lost."""
+    path = tmp_path / "events.db"
+    # Nothing would commit the event before shutdown
+    event_store = SQLiteEventStore(path, commit_every=1000, commit_interval=3600)
+    manager = StreamableHTTPSessionManager(app=Server("test-server"), event_store=event_store)
+
+    with patch.object(event_store, "run", wraps=event_store.run) as run:
+        async with manager.run():
+            event_id = await event_store.store_event(
+                "a", types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"))
+            )
+            await anyio.wait_all_tasks_blocked()
+            run.assert_called_once()
+
+    with closing(sqlite3.connect(path)) as connection:
+        assert connection.execute("SELECT seq FROM events").fetchall() == [(int(event_id),)]
+
+
 @pytest.mark.anyio
 async def test_run_prevents_concurrent_calls():
     """Test that concurrent calls to run() are prevented."""
@@ -222,8 +250,8 @@ async def test_stateless_requests_memory_cleanup():
 
     with patch.object(streamable_http_manager, "StreamableHTTPServerTransport", side_effect=track_transport):
         async with manager.run():
-            # Mock app.run to complete immediately
-            app.run = AsyncMock(return_value=None)
+            # Mock the session runner to complete immediately
+            app.run_session = AsyncMock(return_value=None)
 
             # Send a simple request
             sent_messages: list[Message] = []
@@ -262,3 +290,256 @@ async def test_stateless_requests_memory_cleanup():
 
             # Verify internal state is cleaned up
             assert len(transport._request_streams) == 0, "Transport should have no active request streams"
+
+
+async def _run_forever(*args: Any, **kwargs: Any) -> None:
+    await anyio.sleep_forever()
+
+
+async def _create_session(manager: StreamableHTTPSessionManager) -> tuple[int, str | None]:
+    """Open a new session and return the response status and session ID."""
+    sent_messages: list[Message] = []
+
+    async def mock_send(message: Message):
+        sent_messages.append(message)
+
+    async def mock_receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    await manager.handle_request(scope, mock_receive, mock_send)
+
+    start = next(msg for msg in sent_messages if msg["type"] == "http.response.start")
+    for header_name, header_value in start.get("headers", []):
+        if header_name.decode().lower() == MCP_SESSION_ID_HEADER.lower():
+            return start["status"], header_value.decode()
+    return start["status"], None
+
+
+@pytest.mark.anyio
+async def test_idle_sessions_are_evicted():
+    app = Server("test-idle-eviction")
+    app.run = AsyncMock(side_effect=_run_forever)
+    manager = StreamableHTTPSessionManager(app=app, session_idle_timeout=0.05)
+
+    async with manager.run():
+        _, session_id = await _create_session(manager)
+        assert session_id is not None
+        transport = manager._server_instances[session_id]
+
+        await anyio.sleep(0.2)
+
+        assert session_id not in manager._server_instances
+        assert transport.is_terminated
+        stats = manager.statistics()
+        assert stats.live_sessions == 0
+        assert stats.evicted_idle == 1
+
+
+@pytest.mark.anyio
+async def test_idle_sweep_spares_session_used_during_sweep():
+    app = Server("test-idle-eviction-race")
+    app.run = AsyncMock(side_effect=_run_forever)
+    manager = StreamableHTTPSessionManager(app=app, session_idle_timeout=0.05)
+
+    async with manager.run():
+        _, first = await _create_session(manager)
+        _, second = await _create_session(manager)
+        assert first is not None and second is not None
+        first_transport = manager._server_instances[first]
+
+        # Hold up the sweep in the termination of the first session
+        terminating = anyio.Event()
+        release = anyio.Event()
+        terminate = first_transport.terminate
+
+        async def slow_terminate() -> None:
+            terminating.set()
+            await release.wait()
+            await terminate()
+
+        first_transport.terminate = slow_terminate
+
+        async def blocking_receive():
+            await release.wait()
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def discard(message: Message):
+            pass
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/mcp",
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"accept", b"application/json, text/event-stream"),
+                (MCP_SESSION_ID_HEADER.encode(), second.encode()),
+            ],
+        }
+
+        async with anyio.create_task_group() as tg:
+            await terminating.wait()
+            # The second session expired too, but receives a request before the sweep reaches it
+            tg.start_soon(manager.handle_request, scope, blocking_receive, discard)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert first not in manager._server_instances
+        assert second in manager._server_instances
+        assert manager.statistics().evicted_idle == 1
+
+
+@pytest.mark.anyio
+async def test_max_sessions_evicts_least_recently_used():
+    app = Server("test-max-sessions")
+    app.run = AsyncMock(side_effect=_run_forever)
+    manager = StreamableHTTPSessionManager(app=app, max_sessions=2)
+
+    async with manager.run():
+        await _create_session(manager)
+        _, second = await _create_session(manager)
+        _, third = await _create_session(manager)
+
+        assert list(manager._server_instances) == [second, third]
+        stats = manager.statistics()
+        assert stats.live_sessions == 2
+        assert stats.evicted_capacity == 1
+
+
+@pytest.mark.anyio
+async def test_max_sessions_rejects_when_all_sessions_busy():
+    app = Server("test-max-sessions-busy")
+    app.run = AsyncMock(side_effect=_run_forever)
+    manager = StreamableHTTPSessionManager(app=app, max_sessions=1, session_idle_timeout=0.05)
+
+    async with manager.run():
+        _, session_id = await _create_session(manager)
+        assert session_id is not None
+
+        # Keep a request of the session in progress until released
+        release = anyio.Event()
+
+        async def blocking_receive():
+            await release.wait()
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def discard(message: Message):
+            pass
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/mcp",
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"accept", b"application/json, text/event-stream"),
+                (MCP_SESSION_ID_HEADER.encode(), session_id.encode()),
+            ],
+        }
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.handle_request, scope, blocking_receive, discard)
+            await anyio.sleep(0.2)
+
+            # Busy sessions are neither idle-evicted nor evicted for capacity
+            assert session_id in manager._server_instances
+            assert manager.statistics().active_sessions == 1
+            status, new_session_id = await _create_session(manager)
+            assert status == 503
+            assert new_session_id is None
+            assert manager.statistics().rejected == 1
+
+            release.set()
+
+
+@pytest.mark.anyio
+async def test_new_sessions_are_created_concurrently():
+    """A slow first request of one session must not hold up the creation of others."""
+    app = Server("test-concurrent-sessions")
+    app.run = AsyncMock(side_effect=_run_forever)
+    manager = StreamableHTTPSessionManager(app=app)
+
+    release = anyio.Event()
+
+    async def blocking_receive():
+        await release.wait()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def discard(message: Message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json")],
+    }
+
+    async with manager.run():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.handle_request, scope, blocking_receive, discard)
+            await anyio.sleep(0.05)
+            assert len(manager._server_instances) == 1
+
+            with anyio.fail_after(1):
+                _, session_id = await _create_session(manager)
+
+            assert session_id is not None
+            assert len(manager._server_instances) == 2
+            release.set()
+
+
+@pytest.mark.anyio
+async def test_stateless_requests_share_lifespan_and_initialization_options():
+    lifespan_entries = 0
+
+    @contextlib.asynccontextmanager
+    async def lifespan(server: Server[dict[str, str], Any]) -> AsyncIterator[dict[str, str]]:
+        nonlocal lifespan_entries
+        lifespan_entries += 1
+        yield {"db": "connected"}
+
+    app = Server[dict[str, str], Any]("test-stateless-runtime", lifespan=lifespan)
+    manager = StreamableHTTPSessionManager(app=app, stateless=True)
+    seen: list[tuple[InitializationOptions, dict[str, str]]] = []
+
+    async def run_session(
+        read_stream: Any,
+        write_stream: Any,
+        initialization_options: InitializationOptions,
+        lifespan_context: dict[str, str],
+        **kwargs: Any,
+    ) -> None:
+        seen.append((initialization_options, lifespan_context))
+
+    app.run_session = run_session  # type: ignore
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json")],
+    }
+
+    async def mock_receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def discard(message: Message):
+        pass
+
+    with patch.object(app, "create_initialization_options", wraps=app.create_initialization_options) as create_options:
+        async with manager.run():
+            for _ in range(3):
+                await manager.handle_request(scope, mock_receive, discard)
+            await anyio.sleep(0.01)
+
+    assert lifespan_entries == 1
+    create_options.assert_called_once()
+    assert len(seen) == 3
+    assert all(options is seen[0][0] and context == {"db": "connected"} for options, context in seen)
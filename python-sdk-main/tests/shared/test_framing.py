@@ -0,0 +1,61 @@
+import pytest
+
+from mcp.shared.framing import LineFramer, MessageTooLargeError
+
+
+def test_lines_split_across_chunks():
+    framer = LineFramer()
+
+    assert framer.feed(b'{"a"') == []
+    assert framer.buffered == 4
+    assert framer.feed(b': 1}\n{"b": 2}\n{"c"') == [b'{"a": 1}', b'{"b": 2}']
+    assert framer.feed(b": 3}\n") == [b'{"c": 3}']
+    assert framer.buffered == 0
+    assert framer.flush() is None
+
+
+def test_flush_returns_unfinished_line():
+    framer = LineFramer()
+    framer.feed(b"line\npartial")
+
+    assert framer.flush() == b"partial"
+    assert framer.flush() is None
+
+
+def test_large_line_in_many_chunks():
+    framer = LineFramer()
+    chunk = b"x" * 65536
+
+    for _ in range(160):  # 10 MiB
+        assert framer.feed(chunk) == []
+    lines = framer.feed(b"\n")
+
+    assert len(lines) == 1
+    assert lines[0] == chunk * 160
+
+
+def test_line_over_max_size_in_one_chunk():
+    framer = LineFramer(max_line_size=4)
+
+    lines = framer.feed(b"1234\n12345\n12\n")
+
+    assert lines[0] == b"1234"
+    assert isinstance(lines[1], MessageTooLargeError)
+    assert lines[2] == b"12"
+
+
+def test_line_over_max_size_is_discarded_while_it_arrives():
+    framer = LineFramer(max_line_size=4)
+
+    lines = framer.feed(b"123456")
+    assert len(lines) == 1 and isinstance(lines[0], MessageTooLargeError)
+    assert framer.buffered == 0
+
+    # The rest of the oversized line is dropped without another error
+    assert framer.feed(b"789") == []
+    assert framer.feed(b"0\nok\n") == [b"ok"]
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        LineFramer(max_line_size=0)
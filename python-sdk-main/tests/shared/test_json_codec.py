@@ -0,0 +1,69 @@
+import json
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from mcp.shared.json_codec import (
+    DEFAULT_JSON_CODEC,
+    JSONCodec,
+    JSONCodecName,
+    OrjsonJSONCodec,
+    get_json_codec,
+)
+from mcp.types import JSONRPCMessage, JSONRPCNotification, JSONRPCRequest, JSONRPCResponse
+
+MESSAGES = [
+    JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call", params={"name": "add", "arguments": {}})),
+    JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")),
+    JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id="a", result={"content": [{"type": "text", "text": "é"}]})),
+]
+
+
+@pytest.fixture(params=["pydantic", "orjson"])
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    name: JSONCodecName = request.param
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    return get_json_codec(name)
+
+
+def test_default_codec():
+    assert get_json_codec() is DEFAULT_JSON_CODEC
+    assert get_json_codec("pydantic") is DEFAULT_JSON_CODEC
+    assert get_json_codec(DEFAULT_JSON_CODEC) is DEFAULT_JSON_CODEC
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_round_trip(codec: JSONCodec, message: JSONRPCMessage):
+    data = codec.encode_message(message)
+
+    assert json.loads(data) == message.model_dump(by_alias=True, mode="json", exclude_none=True)
+    assert codec.decode_message(data) == message
+    assert codec.decode_message(data.encode()) == message
+
+
+def test_decode_messages(codec: JSONCodec):
+    assert codec.decode_messages(codec.encode_message(MESSAGES[0])) == MESSAGES[:1]
+    assert codec.decode_messages(" " + codec.encode_messages(MESSAGES)) == MESSAGES
+
+
+@pytest.mark.parametrize("data", ["{not json", '{"jsonrpc": "2.0"}', "[]"])
+def test_invalid_messages_raise_validation_error(codec: JSONCodec, data: str):
+    with pytest.raises(ValidationError):
+        codec.decode_messages(data)
+
+
+def test_plain_values(codec: JSONCodec):
+    value = {"a": [1, 2.5, None, True], "b": "ü"}
+
+    assert codec.loads(codec.dumps(value)) == value
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_orjson_codec_requires_orjson(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(ImportError, match="pip install orjson"):
+        OrjsonJSONCodec()
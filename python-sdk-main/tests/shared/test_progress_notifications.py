@@ -13,7 +13,7 @@ from mcp.server.session import ServerSession
 from mcp.shared.context import RequestContext
 from mcp.shared.memory import create_connected_server_and_client_session
 from mcp.shared.progress import progress
-from mcp.shared.session import BaseSession, RequestResponder, SessionMessage
+from mcp.shared.session import BaseSession, ProgressReporter, ProgressThrottle, RequestResponder, SessionMessage
 
 
 @pytest.mark.anyio
@@ -388,3 +388,90 @@ async def test_progress_callback_exception_logging():
             # Check that a warning was logged for the progress callback exception
             assert len(logged_errors) > 0
             assert any("Progress callback raised an exception" in warning for warning in logged_errors)
+
+
+@pytest.mark.anyio
+async def test_progress_reporter_coalesces_updates():
+    updates: list[tuple[float, float | None, str | None]] = []
+
+    async def callback(progress: float, total: float | None, message: str | None) -> None:
+        updates.append((progress, total, message))
+
+    reporter = ProgressReporter(callback, ProgressThrottle(min_delta=10))
+    for i in range(1, 26):
+        await reporter(i, None, f"step {i}")
+    assert updates == [(1, None, "step 1"), (11, None, "step 11"), (21, None, "step 21")]
+
+    # The last update is held until the reporter is flushed
+    await reporter.flush()
+    assert updates[-1] == (25, None, "step 25")
+    assert reporter.passed == 4
+    assert reporter.coalesced == 21
+
+    # Reaching the total is always passed on
+    await reporter(26, 26, None)
+    assert updates[-1] == (26, 26, None)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("server_throttle", "client_throttle", "expected"),
+    [
+        # Only the first update and the final value cross the transport
+        (ProgressThrottle(min_interval=3600), None, [1, 1000]),
+        # Every update crosses the transport but the client callback is debounced
+        (None, ProgressThrottle(min_delta=250), [1, 251, 501, 751, 1000]),
+    ],
+)
+async def test_progress_throttle(
+    server_throttle: ProgressThrottle | None, client_throttle: ProgressThrottle | None, expected: list[float]
+):
+    from mcp.server.fastmcp import Context, FastMCP
+
+    server = FastMCP("test", progress_throttle=server_throttle)
+
+    @server.tool()
+    async def busy(ctx: Context[ServerSession, None]) -> str:
+        for i in range(1, 1001):
+            await ctx.report_progress(i)
+        return "done"
+
+    updates: list[float] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        updates.append(progress)
+
+    async with create_connected_server_and_client_session(server._mcp_server) as client_session:
+        await client_session.call_tool("busy", {}, progress_callback=on_progress, progress_throttle=client_throttle)
+
+    assert updates == expected
+
+
+@pytest.mark.anyio
+async def test_progress_throttle_delivers_last_update():
+    """Test that an update held back by the throttle is sent when the tool returns."""
+    from mcp.server.fastmcp import Context, FastMCP
+
+    server = FastMCP("test", progress_throttle=ProgressThrottle(min_interval=3600))
+
+    @server.tool()
+    async def busy(ctx: Context[ServerSession, None]) -> str:
+        await ctx.report_progress(1, message="started")
+        # Within min_interval of the first update, so held back
+        await ctx.report_progress(2, message="almost done")
+        return "done"
+
+    updates: list[tuple[float, str | None]] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        updates.append((progress, message))
+
+    async with create_connected_server_and_client_session(server._mcp_server) as client_session:
+        await client_session.call_tool("busy", {}, progress_callback=on_progress)
+
+    assert updates == [(1, "started"), (2, "almost done")]
+
+
+def test_invalid_progress_throttle():
+    with pytest.raises(ValueError):
+        ProgressThrottle(min_interval=-1)
@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+from jsonschema import SchemaError, ValidationError
+
+from mcp.shared.schema_validation import SchemaValidatorBackend, SchemaValidatorCache
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "a": {"type": "number"},
+        "b": {"type": "number"},
+    },
+    "required": ["a", "b"],
+    "additionalProperties": False,
+}
+
+
+@pytest.fixture(params=["jsonschema", "fastjsonschema"])
+def backend(request: pytest.FixtureRequest) -> SchemaValidatorBackend:
+    if request.param == "fastjsonschema":
+        pytest.importorskip("fastjsonschema")
+    return request.param
+
+
+def test_validator_is_compiled_once(backend: SchemaValidatorBackend):
+    cache = SchemaValidatorCache(backend)
+
+    cache.validate("add", {"a": 1, "b": 2}, SCHEMA)
+    validator = cache._validators["add"][1]
+    cache.validate("add", {"a": 3, "b": 4}, SCHEMA)
+
+    assert cache._validators["add"][1] is validator
+    assert len(cache) == 1
+
+
+def test_new_schema_object_recompiles(backend: SchemaValidatorBackend):
+    cache = SchemaValidatorCache(backend)
+
+    cache.validate("add", {"a": 1, "b": 2}, SCHEMA)
+    validator = cache._validators["add"][1]
+    cache.validate("add", {"a": 1, "b": 2}, dict(SCHEMA))
+
+    assert cache._validators["add"][1] is not validator
+
+
+def test_invalidate(backend: SchemaValidatorBackend):
+    cache = SchemaValidatorCache(backend)
+    cache.validate("add", {"a": 1, "b": 2}, SCHEMA)
+    cache.validate("sub", {"a": 1, "b": 2}, SCHEMA)
+
+    cache.invalidate("add")
+    assert "add" not in cache._validators
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "instance,message",
+    [
+        ({"a": 1}, "'b' is a required property"),
+        ({"a": "five", "b": 3}, "'five' is not of type 'number'"),
+    ],
+)
+def test_errors_match_jsonschema(backend: SchemaValidatorBackend, instance: dict[str, Any], message: str):
+    cache = SchemaValidatorCache(backend)
+
+    with pytest.raises(ValidationError) as exc_info:
+        cache.validate("add", instance, SCHEMA)
+
+    assert exc_info.value.message == message
+
+
+def test_invalid_schema(backend: SchemaValidatorBackend):
+    cache = SchemaValidatorCache(backend)
+
+    with pytest.raises(SchemaError):
+        cache.validate("broken", {}, {"type": "not-a-type"})
@@ -9,6 +9,7 @@ from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
 from mcp.shared.exceptions import McpError
 from mcp.shared.memory import create_client_server_memory_streams, create_connected_server_and_client_session
+from mcp.shared.message import SessionMessage
 from mcp.types import (
     CancelledNotification,
     CancelledNotificationParams,
@@ -168,3 +169,57 @@ async def test_connection_closed():
                 await ev_closed.wait()
             with anyio.fail_after(1):
                 await ev_response.wait()
+
+
+@pytest.mark.anyio
+async def test_progress_token_added_to_request_meta():
+    """The progress token is merged into any _meta the request already carries."""
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        pass
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async def mock_server():
+            for _ in range(2):
+                message = await server_read.receive()
+                assert not isinstance(message, Exception)
+                request = message.message.root
+                assert isinstance(request, types.JSONRPCRequest)
+                requests.append(request)
+                response = types.JSONRPCResponse(jsonrpc="2.0", id=request.id, result={})
+                await server_write.send(SessionMessage(types.JSONRPCMessage(response)))
+
+        requests: list[types.JSONRPCRequest] = []
+        async with (
+            anyio.create_task_group() as tg,
+            ClientSession(read_stream=client_read, write_stream=client_write) as client_session,
+        ):
+            tg.start_soon(mock_server)
+            with anyio.fail_after(1):
+                await client_session.send_request(
+                    ClientRequest(types.PingRequest()), EmptyResult, progress_callback=on_progress
+                )
+                await client_session.send_request(
+                    ClientRequest(
+                        types.CallToolRequest(
+                            params=types.CallToolRequestParams(
+                                name="t",
+                                arguments={},
+                                _meta=types.RequestParams.Meta.model_validate({"custom": "value"}),
+                            )
+                        )
+                    ),
+                    EmptyResult,
+                    progress_callback=on_progress,
+                )
+
+    assert requests[0].params == {"_meta": {"progressToken": requests[0].id}}
+    assert requests[1].params == {
+        "name": "t",
+        "arguments": {},
+        "_meta": {"custom": "value", "progressToken": requests[1].id},
+    }
+    assert client_session._pending_responses == {}
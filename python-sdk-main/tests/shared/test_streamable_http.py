@@ -5,10 +5,12 @@ Contains tests for both server and client sides of the StreamableHTTP transport.
 """
 
 import json
+import logging
 import multiprocessing
 import socket
 from collections.abc import Generator
 from typing import Any
+from unittest.mock import patch
 
 import anyio
 import httpx
@@ -22,7 +24,7 @@ from starlette.routing import Mount
 
 import mcp.types as types
 from mcp.client.session import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
+from mcp.client.streamable_http import StreamableHTTPTransport, streamablehttp_client
 from mcp.server import Server
 from mcp.server.streamable_http import (
     MCP_PROTOCOL_VERSION_HEADER,
@@ -39,7 +41,7 @@ from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
-from mcp.shared.message import ClientMessageMetadata
+from mcp.shared.message import ClientMessageMetadata, RequestBatch, SessionMessage
 from mcp.shared.session import RequestResponder
 from mcp.types import InitializeResult, TextContent, TextResourceContents, Tool
 from tests.test_helpers import wait_for_server
@@ -705,6 +707,80 @@ def test_json_response_incorrect_accept_header(json_response_server: None, json_
     assert "Not Acceptable" in response.text
 
 
+def test_json_response_batch(json_response_server: None, json_server_url: str):
+    """Test that a batch is answered with a JSON array of responses in request order."""
+    mcp_url = f"{json_server_url}/mcp"
+    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert response.status_code == 200
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+
+    batch: list[dict[str, Any]] = [
+        {"jsonrpc": "2.0", "method": "tools/call", "id": "call-1", "params": {"name": "test_tool", "arguments": {}}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "method": "tools/list", "id": "list-1"},
+    ]
+    response = requests.post(mcp_url, headers=headers, json=batch)
+    assert response.status_code == 200
+    assert response.headers.get("Content-Type") == "application/json"
+
+    responses = response.json()
+    assert [item["id"] for item in responses] == ["call-1", "list-1"]
+    assert responses[0]["result"]["content"][0]["text"] == "Called test_tool"
+    assert len(responses[1]["result"]["tools"]) == 6
+
+
+def test_batch_validation(basic_server: None, basic_server_url: str):
+    """Test that initialize, duplicate IDs and empty batches are rejected."""
+    mcp_url = f"{basic_server_url}/mcp"
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+    response = requests.post(mcp_url, headers=headers, json=[INIT_REQUEST])
+    assert response.status_code == 400
+    assert "initialize must not be part of a batch" in response.text
+
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert response.status_code == 200
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+
+    request = {"jsonrpc": "2.0", "method": "tools/list", "id": "dup"}
+    response = requests.post(mcp_url, headers=headers, json=[request, request])
+    assert response.status_code == 400
+    assert "duplicate request ID" in response.text
+
+    response = requests.post(mcp_url, headers=headers, json=[])
+    assert response.status_code == 400
+
+
+def test_sse_response_batch(basic_server: None, basic_server_url: str):
+    """Test that the responses of a batch are streamed over one SSE stream."""
+    mcp_url = f"{basic_server_url}/mcp"
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert response.status_code == 200
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+
+    batch: list[dict[str, Any]] = [
+        {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": f"call-{name}",
+            "params": {"name": name, "arguments": {}},
+        }
+        for name in ("long_running_with_checkpoints", "test_tool")
+    ]
+    response = requests.post(mcp_url, headers=headers, json=batch)
+    assert response.status_code == 200
+    assert response.headers.get("Content-Type", "").startswith("text/event-stream")
+
+    messages = [json.loads(line[len("data: ") :]) for line in response.text.splitlines() if line.startswith("data: ")]
+    results = {message["id"]: message["result"] for message in messages if "id" in message}
+    assert results["call-test_tool"]["content"][0]["text"] == "Called test_tool"
+    assert results["call-long_running_with_checkpoints"]["content"][0]["text"] == "Completed!"
+    # Log notifications related to a batched request are streamed along with it
+    assert sum(1 for message in messages if message.get("method") == "notifications/message") == 2
+
+
 def test_get_sse_stream(basic_server: None, basic_server_url: str):
     """Test establishing an SSE stream via GET request."""
     # First, we need to initialize a session
@@ -950,6 +1026,110 @@ async def test_streamablehttp_client_json_response(json_response_server: None, j
             assert result.content[0].text == "Called test_tool"
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("json_response", [False, True])
+@pytest.mark.parametrize("protocol_version", ["2025-03-26", types.LATEST_PROTOCOL_VERSION])
+async def test_streamablehttp_client_call_tools_batch(
+    basic_server: None,
+    basic_server_url: str,
+    json_response_server: None,
+    json_server_url: str,
+    json_response: bool,
+    protocol_version: str,
+):
+    """Test that ClientSession.call_tools batches its calls only where the protocol version allows it."""
+    url = json_server_url if json_response else basic_server_url
+    post_batch = StreamableHTTPTransport._handle_batch_post_request
+    with (
+        patch.object(types, "LATEST_PROTOCOL_VERSION", protocol_version),
+        patch.object(
+            StreamableHTTPTransport, "_handle_batch_post_request", autospec=True, side_effect=post_batch
+        ) as batch_posts,
+    ):
+        async with streamablehttp_client(f"{url}/mcp") as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                init_result = await session.initialize()
+                results = await session.call_tools(
+                    [("long_running_with_checkpoints", {}), ("test_tool", {}), ("test_tool", None)]
+                )
+
+    assert init_result.protocolVersion == protocol_version
+    assert batch_posts.call_count == int(protocol_version == "2025-03-26")
+    texts: list[str] = []
+    for result in results:
+        assert isinstance(result, types.CallToolResult)
+        assert isinstance(result.content[0], TextContent)
+        texts.append(result.content[0].text)
+    assert texts == ["Completed!", "Called test_tool", "Called test_tool"]
+
+
+@pytest.mark.anyio
+async def test_streamablehttp_client_sends_unfilled_batch(basic_server: None, basic_server_url: str):
+    """Test that the requests of a batch that never fills are still sent after its max_delay."""
+    batch = RequestBatch(size=3, max_delay=0.01)
+    results: list[types.CallToolResult] = []
+    with patch.object(types, "LATEST_PROTOCOL_VERSION", "2025-03-26"):
+        async with streamablehttp_client(f"{basic_server_url}/mcp") as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+
+                async def call_tool() -> None:
+                    request = types.ClientRequest(
+                        types.CallToolRequest(params=types.CallToolRequestParams(name="test_tool", arguments={}))
+                    )
+                    results.append(
+                        await session.send_request(
+                            request, types.CallToolResult, metadata=ClientMessageMetadata(batch=batch)
+                        )
+                    )
+
+                with anyio.fail_after(5):
+                    async with anyio.create_task_group() as tg:
+                        for _ in range(2):
+                            tg.start_soon(call_tool)
+
+    assert len(results) == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "response, code",
+    [
+        (
+            httpx.Response(
+                400,
+                json={"jsonrpc": "2.0", "id": "server-error", "error": {"code": -32700, "message": "Parse error"}},
+            ),
+            types.PARSE_ERROR,
+        ),
+        (httpx.Response(403, text="Forbidden"), types.INVALID_REQUEST),
+        (httpx.Response(404, text="Not Found"), types.INVALID_REQUEST),
+        (httpx.Response(502, text="Bad Gateway"), types.INTERNAL_ERROR),
+    ],
+)
+async def test_batch_http_errors_map_to_jsonrpc_errors(response: httpx.Response, code: int):
+    """Test that a failed batch POST answers each request with a JSON-RPC error code, not the HTTP status."""
+    transport = StreamableHTTPTransport("http://testserver/mcp")
+    messages = [
+        SessionMessage(types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=request_id, method="ping")))
+        for request_id in (1, 2)
+    ]
+    send_stream, receive_stream = anyio.create_memory_object_stream[SessionMessage | Exception](2 * len(messages))
+    async with send_stream, receive_stream:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: response)) as client:
+            await transport._handle_batch_post_request(client, messages, send_stream)  # type: ignore[reportPrivateUsage]
+
+        errors: dict[types.RequestId, int] = {}
+        for _ in messages:
+            received = receive_stream.receive_nowait()
+            assert isinstance(received, SessionMessage)
+            assert isinstance(received.message.root, types.JSONRPCError)
+            errors[received.message.root.id] = received.message.root.error.code
+        assert errors == {1: code, 2: code}
+        # Each request is answered exactly once
+        assert receive_stream.statistics().current_buffer_used == 0
+
+
 @pytest.mark.anyio
 async def test_streamablehttp_client_get_stream(basic_server: None, basic_server_url: str):
     """Test GET stream functionality for server-initiated messages."""
@@ -1598,3 +1778,17 @@ async def test_client_crash_handled(basic_server: None, basic_server_url: str):
             assert isinstance(result, InitializeResult)
             tools = await session.list_tools()
             assert tools.tools
+
+
+@pytest.mark.anyio
+async def test_message_router_stops_quietly_on_termination(caplog: pytest.LogCaptureFixture):
+    """Test that terminating a session while the message router is routing does not log an error."""
+    transport = StreamableHTTPServerTransport(mcp_session_id=None)
+    with caplog.at_level(logging.DEBUG, logger="mcp.server.streamable_http"):
+        async with transport.connect() as (_, write_stream):
+            response = types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=1, result={}))
+            await write_stream.send(SessionMessage(response))
+            # Stateless sessions are terminated as soon as their request is answered
+            await transport.terminate()
+
+    assert [record.getMessage() for record in caplog.records if record.levelno >= logging.ERROR] == []
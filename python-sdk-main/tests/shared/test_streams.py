@@ -0,0 +1,133 @@
+import ast
+import importlib
+import inspect
+
+import anyio
+import pytest
+
+from mcp.shared import streams
+from mcp.shared.streams import StreamBuffer, create_message_stream
+
+
+@pytest.mark.anyio
+async def test_messages_are_buffered():
+    send_stream, receive_stream = create_message_stream[int](10)
+
+    with send_stream, receive_stream:
+        with anyio.fail_after(1):
+            for i in range(10):
+                await send_stream.send(i)
+
+        stats = send_stream.buffer_statistics()
+        assert stats.depth == 10
+        assert stats.peak_depth == 10
+        assert stats.sent == 10
+        assert stats.pauses == 0
+
+        assert [receive_stream.receive_nowait() for _ in range(10)] == list(range(10))
+        assert receive_stream.buffer_statistics().depth == 0
+
+
+@pytest.mark.anyio
+async def test_senders_resume_at_low_water_mark():
+    send_stream, receive_stream = create_message_stream[int](StreamBuffer(max_buffer_size=4, low_water_mark=1))
+    sent: list[int] = []
+
+    async def send(i: int):
+        await send_stream.send(i)
+        sent.append(i)
+
+    with send_stream, receive_stream:
+        async with anyio.create_task_group() as tg:
+            for i in range(6):
+                tg.start_soon(send, i)
+                await anyio.wait_all_tasks_blocked()
+
+            # The fifth message found the buffer full and paused every sender
+            assert sent == [0, 1, 2, 3]
+            assert send_stream.buffer_statistics().pauses == 1
+
+            # Draining to two messages is not enough to resume
+            assert [receive_stream.receive_nowait() for _ in range(3)] == [0, 1, 2]
+            await anyio.wait_all_tasks_blocked()
+            assert sent == [0, 1, 2, 3, 4]
+
+            assert receive_stream.receive_nowait() == 3
+            await anyio.wait_all_tasks_blocked()
+            assert sent == [0, 1, 2, 3, 4, 5]
+
+    stats = receive_stream.buffer_statistics()
+    assert stats.depth == 2
+    assert stats.peak_depth == 4
+    assert stats.sent == 6
+
+
+@pytest.mark.anyio
+async def test_paused_senders_fail_when_receiver_closes():
+    send_stream, receive_stream = create_message_stream[int](StreamBuffer(max_buffer_size=1, low_water_mark=0))
+    failed: list[int] = []
+
+    async def send(i: int):
+        try:
+            await send_stream.send(i)
+        except anyio.BrokenResourceError:
+            failed.append(i)
+
+    with send_stream:
+        await send_stream.send(1)
+        with anyio.fail_after(1):
+            async with anyio.create_task_group() as tg:
+                for i in (2, 3):
+                    tg.start_soon(send, i)
+                    await anyio.wait_all_tasks_blocked()
+                receive_stream.close()
+
+    assert failed == [2, 3]
+
+
+@pytest.mark.anyio
+async def test_receiving_resumes_paused_senders():
+    send_stream, receive_stream = create_message_stream[int](StreamBuffer(max_buffer_size=2, low_water_mark=0))
+
+    async def send_all():
+        async with send_stream:
+            for i in range(5):
+                await send_stream.send(i)
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(send_all)
+            await anyio.wait_all_tasks_blocked()
+            assert send_stream.buffer_statistics().senders_waiting == 1
+            async with receive_stream:
+                assert [i async for i in receive_stream] == list(range(5))
+
+    assert receive_stream.buffer_statistics().pauses == 1
+
+
+def test_only_public_anyio_names_are_used():
+    """anyio renames its internals between releases, so the streams must stick to its public API."""
+    tree = ast.parse(inspect.getsource(streams))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("anyio"):
+            module = importlib.import_module(node.module)
+            public = getattr(module, "__all__", [name for name in dir(module) if not name.startswith("_")])
+            for alias in node.names:
+                assert alias.name in public, f"{node.module}.{alias.name} is not public"
+
+
+@pytest.mark.anyio
+async def test_clones_share_statistics():
+    send_stream, receive_stream = create_message_stream[int](2)
+
+    with send_stream, receive_stream, send_stream.clone() as send_clone, receive_stream.clone() as receive_clone:
+        await send_clone.send(1)
+        assert receive_clone.receive_nowait() == 1
+        assert send_stream.buffer_statistics().sent == 1
+
+
+def test_invalid_buffer():
+    with pytest.raises(ValueError):
+        StreamBuffer(max_buffer_size=-1)
+    with pytest.raises(ValueError):
+        StreamBuffer(max_buffer_size=2, low_water_mark=3)
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.__main__ import main, run
+from benchmarks.compare import compare, read_results, write_results
+from benchmarks.runner import BENCHMARKS, BenchmarkConfig, BenchmarkResult
+
+
+@pytest.mark.anyio
+async def test_memory_transport_benchmarks():
+    config = BenchmarkConfig(
+        iterations=10,
+        warmup=1,
+        concurrency=2,
+        payload_sizes=(16,),
+        payload_iterations=2,
+        sessions=2,
+        session_connects=4,
+        templates=20,
+    )
+    results = await run(["memory"], list(BENCHMARKS), config)
+
+    # orjson is optional, so only the default codec is always decoded with
+    assert [(result.benchmark, result.params) for result in results if result.params.get("codec") != "orjson"] == [
+        ("memory", {"sessions": 2}),
+        ("latency", {"method": "ping"}),
+        ("latency", {"method": "tools/call"}),
+        ("throughput", {"concurrency": 2}),
+        ("sessions", {"concurrency": 2}),
+        ("payload", {"bytes": 16}),
+        ("decode", {"codec": "pydantic", "method": "tools/call"}),
+        ("templates", {"templates": 20}),
+    ]
+    assert all(result.metrics for result in results)
+
+
+def test_compare_reports_regressions(tmp_path: Path):
+    baseline = [
+        BenchmarkResult("memory", "latency", {"method": "ping"}, {"p50_ms": 1.0}),
+        BenchmarkResult("memory", "throughput", {"concurrency": 16}, {"ops_per_sec": 1000.0}),
+    ]
+    current = [
+        BenchmarkResult("memory", "latency", {"method": "ping"}, {"p50_ms": 1.5}),
+        BenchmarkResult("memory", "throughput", {"concurrency": 16}, {"ops_per_sec": 1100.0}),
+        BenchmarkResult("stdio", "latency", {"method": "ping"}, {"p50_ms": 1.0}),
+    ]
+
+    changes = compare(baseline, current)
+    assert [(change.result.benchmark, round(change.regression, 2)) for change in changes] == [
+        ("latency", 0.5),
+        ("throughput", -0.1),
+    ]
+
+    write_results(tmp_path / "baseline.json", baseline, {})
+    write_results(tmp_path / "current.json", current, {})
+    assert read_results(tmp_path / "current.json") == current
+    assert main(["--compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 1
+    assert main(["--compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
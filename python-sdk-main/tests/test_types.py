@@ -1,14 +1,22 @@
+import json
+from typing import Any
+
 import pytest
+from pydantic import ValidationError
 
 from mcp.types import (
     LATEST_PROTOCOL_VERSION,
+    CallToolRequest,
     ClientCapabilities,
     ClientRequest,
     Implementation,
     InitializeRequest,
     InitializeRequestParams,
+    JSONRPCError,
     JSONRPCMessage,
+    JSONRPCNotification,
     JSONRPCRequest,
+    JSONRPCResponse,
 )
 
 
@@ -56,3 +64,31 @@ async def test_method_initialization():
     assert initialize_request.method == "initialize", "method should be set to 'initialize'"
     assert initialize_request.params is not None
     assert initialize_request.params.protocolVersion == LATEST_PROTOCOL_VERSION
+
+
+@pytest.mark.parametrize(
+    "data, expected_type",
+    [
+        ({"jsonrpc": "2.0", "id": 1, "method": "ping"}, JSONRPCRequest),
+        ({"jsonrpc": "2.0", "method": "notifications/initialized"}, JSONRPCNotification),
+        ({"jsonrpc": "2.0", "id": 1, "result": {}}, JSONRPCResponse),
+        ({"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}}, JSONRPCError),
+    ],
+)
+def test_jsonrpc_message_kind(data: dict[str, Any], expected_type: type[Any]):
+    assert isinstance(JSONRPCMessage.model_validate(data).root, expected_type)
+    message = JSONRPCMessage.model_validate_json(json.dumps(data))
+    assert isinstance(message.root, expected_type)
+    # Wrapping an existing message keeps its type
+    assert JSONRPCMessage(message.root).root is message.root
+
+
+def test_client_request_is_discriminated_by_method():
+    request = ClientRequest.model_validate({"method": "tools/call", "params": {"name": "echo", "arguments": {}}})
+    assert isinstance(request.root, CallToolRequest)
+    assert request.root.params.name == "echo"
+
+    with pytest.raises(ValidationError) as exc_info:
+        ClientRequest.model_validate({"method": "tools/unknown"})
+    # Only the method tag is checked, not every member of the union
+    assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"